@@ -0,0 +1,183 @@
+import json
+import logging
+import os
+import re
+import shutil
+import time
+from pathlib import Path
+
+
+def load_parallels_per_platform(config_path, default=1):
+    """Read parallelsPerPlatform from browserstack.yml"""
+    try:
+        text = Path(config_path).read_text(encoding="utf-8")
+    except OSError:
+        return default
+
+    try:
+        import yaml
+        value = (yaml.safe_load(text) or {}).get("parallelsPerPlatform", default)
+    except ImportError:
+        # PyYAML is optional; the key is a plain top-level scalar
+        match = re.search(r"^parallelsPerPlatform:\s*(\d+)", text, re.MULTILINE)
+        value = match.group(1) if match else default
+
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        return default
+
+
+class PlatformSlots:
+    """Lease files capping concurrent remote sessions per platform across worker processes"""
+
+    def __init__(self, lock_dir, limit, stale_after=900, poll_interval=1.0):
+        self.lock_dir = Path(lock_dir)
+        self.limit = limit
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def clear(lock_dir):
+        """Remove leases left behind by a previous run"""
+        shutil.rmtree(lock_dir, ignore_errors=True)
+
+    def acquire(self, platform, timeout=None):
+        """Block until a slot for the platform is free and return its lease path"""
+        deadline = time.time() + timeout if timeout else None
+        waiting_logged = False
+
+        while True:
+            for index in range(self.limit):
+                lease = self.lock_dir / f"{platform}_{index}.lease"
+                if self._try_create(lease):
+                    return lease
+                self._expire_if_stale(lease)
+
+            if deadline and time.time() > deadline:
+                raise TimeoutError(f"No free BrowserStack slot for {platform} within {timeout}s")
+            if not waiting_logged:
+                self.logger.info(f"All {self.limit} {platform} slots busy, waiting in queue")
+                waiting_logged = True
+            time.sleep(self.poll_interval)
+
+    def refresh(self, lease):
+        """Mark a held lease as still in use"""
+        try:
+            os.utime(lease)
+        except OSError:
+            pass
+
+    def release(self, lease):
+        """Give a slot back"""
+        try:
+            os.remove(lease)
+        except OSError:
+            pass
+
+    def _try_create(self, lease):
+        """Atomically claim a lease file; O_EXCL makes this safe across processes"""
+        try:
+            fd = os.open(lease, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w") as lease_file:
+            lease_file.write(json.dumps({"pid": os.getpid(), "acquired": time.time()}))
+        return True
+
+    def _expire_if_stale(self, lease):
+        """Drop a lease whose owner stopped refreshing it, e.g. a crashed worker"""
+        try:
+            if time.time() - lease.stat().st_mtime > self.stale_after:
+                self.logger.warning(f"Expiring stale BrowserStack lease {lease.name}")
+                os.remove(lease)
+        except OSError:
+            pass
+
+
+class BrowserStackSessionScheduler:
+    """Reuses one remote session across consecutive tests and respects parallelsPerPlatform"""
+
+    def __init__(self, slots, reset_state=None):
+        self.slots = slots
+        self.reset_state = reset_state
+        self.session_count = 0
+        # key -> (driver, lease); a worker holds at most one session at a time
+        self._sessions = {}
+        self.logger = logging.getLogger(__name__)
+
+    def acquire(self, platform, session_name, create_driver, variant=None):
+        """Return a remote driver for the platform, reusing the current session when possible"""
+        key = (platform, variant)
+
+        # Switching platform frees this worker's slot for others queued on the old platform
+        for other_key in [other for other in self._sessions if other != key]:
+            self._close(other_key)
+
+        if key in self._sessions:
+            driver, lease = self._sessions[key]
+            self.slots.refresh(lease)
+            self.set_session_name(driver, session_name)
+            self.logger.info(f"Reusing BrowserStack session for {platform}: {session_name}")
+            return driver
+
+        lease = self.slots.acquire(platform)
+        try:
+            driver = create_driver()
+        except Exception:
+            self.slots.release(lease)
+            raise
+
+        self.session_count += 1
+        self._sessions[key] = (driver, lease)
+        self.set_session_name(driver, session_name)
+        return driver
+
+    def release(self, driver):
+        """Keep the session for the next test, or close it if its state cannot be reset"""
+        key = self._find_key(driver)
+        if key is None:
+            return
+
+        if self.reset_state and not self.reset_state(driver):
+            self.logger.warning("Could not reset BrowserStack session, closing it")
+            self._close(key)
+        else:
+            self.slots.refresh(self._sessions[key][1])
+
+    def discard(self, driver):
+        """Close a session instead of keeping it for reuse"""
+        key = self._find_key(driver)
+        if key is not None:
+            self._close(key)
+
+    def close_all(self):
+        """Close every session this worker holds"""
+        for key in list(self._sessions):
+            self._close(key)
+
+    @staticmethod
+    def set_session_name(driver, name):
+        """Rename the remote session on the BrowserStack dashboard via the executor API"""
+        command = {"action": "setSessionName", "arguments": {"name": name}}
+        try:
+            driver.execute_script(f"browserstack_executor: {json.dumps(command)}")
+        except Exception as e:
+            logging.getLogger(__name__).debug(f"Could not set session name: {str(e)}")
+
+    def _find_key(self, driver):
+        for key, (session_driver, _) in self._sessions.items():
+            if session_driver is driver:
+                return key
+        return None
+
+    def _close(self, key):
+        driver, lease = self._sessions.pop(key)
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.debug(f"Ignoring error while quitting remote session: {str(e)}")
+        finally:
+            self.slots.release(lease)
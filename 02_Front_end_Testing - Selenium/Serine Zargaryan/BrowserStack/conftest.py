@@ -2,6 +2,9 @@ import pytest
 import os
 from pathlib import Path
 
+BROWSERSTACK_SLOTS_DIR = Path("test_reports") / "browserstack_slots"
+BROWSER_ORDER = ["chrome", "firefox", "edge"]
+
 
 def pytest_addoption(parser):
     """Add command-line options for pytest"""
@@ -25,6 +28,62 @@ def pytest_addoption(parser):
         default=1,
         help="Number of parallel processes to run tests (default: 1)"
     )
+    parser.addoption(
+        "--matrix",
+        action="store_true",
+        default=False,
+        help="Run the browser variants of each test concurrently, one group of workers per browser"
+    )
+    parser.addoption(
+        "--matrix-caps",
+        action="store",
+        default=None,
+        help="Workers per browser for --matrix, e.g. 'chrome=2,firefox=1,edge=1' (default: 1 per browser, "
+             "parallelsPerPlatform from browserstack.yml on BrowserStack)"
+    )
+    parser.addoption(
+        "--durations-db",
+        action="store",
+        default=str(Path("test_reports") / "test_durations.json"),
+        help="File storing per-test durations used to balance parallel workers"
+    )
+    parser.addoption(
+        "--workday-standin",
+        action="store",
+        nargs="?",
+        const="sample",
+        default=None,
+        help="Serve Workday from a local stand-in: built-in sample postings, or a file recorded with "
+             "'python workday_standin.py --record PATH'"
+    )
+    parser.addoption(
+        "--record-snapshots",
+        action="store",
+        nargs="?",
+        const=str(Path("test_reports") / "snapshots"),
+        default=None,
+        help="Record every captured page snapshot into a content-addressed corpus for offline replay "
+             "(default directory: test_reports/snapshots)"
+    )
+    # Internal options used by --parallel to drive worker processes
+    parser.addoption(
+        "--worker-id",
+        action="store",
+        default=None,
+        help="Worker identifier assigned by --parallel (internal)"
+    )
+    parser.addoption(
+        "--shard-file",
+        action="store",
+        default=None,
+        help="File listing the node IDs this worker should run (internal)"
+    )
+    parser.addoption(
+        "--results-file",
+        action="store",
+        default=None,
+        help="File the worker appends serialized test reports to (internal)"
+    )
     # Add --env option
     parser.addoption(
         "--env",
@@ -50,6 +109,84 @@ def test_config(request):
 
 
 
+@pytest.fixture(scope="session")
+def driver_pool():
+    """Provide a session-wide pool of warm local browsers reused across tests"""
+    from test_helpers import WebDriverPool
+
+    pool = WebDriverPool()
+    yield pool
+    pool.quit_all()
+
+
+@pytest.fixture(scope="session")
+def navigation_states():
+    """Provide the session-wide cache of navigation prefixes restored into pooled drivers"""
+    from navigation_state import NavigationStateCache
+
+    cache = NavigationStateCache()
+    yield cache
+    cache.logger.info(f"Navigation states: {cache.stats}")
+
+
+@pytest.fixture(scope="session")
+def browserstack_scheduler():
+    """Provide the per-worker BrowserStack session scheduler"""
+    from browserstack_scheduler import BrowserStackSessionScheduler, PlatformSlots, load_parallels_per_platform
+    from test_helpers import WebDriverPool
+
+    slots = PlatformSlots(
+        BROWSERSTACK_SLOTS_DIR,
+        limit=load_parallels_per_platform(Path(__file__).parent / "browserstack.yml")
+    )
+    scheduler = BrowserStackSessionScheduler(slots, reset_state=WebDriverPool.reset_driver_state)
+    yield scheduler
+    scheduler.close_all()
+
+
+@pytest.fixture(scope="session")
+def job_snapshot(tmp_path_factory):
+    """Provide the on-disk Workday / blueorigin.com job catalog snapshot shared by all runs"""
+    from job_snapshot import JobSnapshotStore
+
+    # A stand-in or other tenant gets a throwaway snapshot so it never mixes with the live catalog
+    path = tmp_path_factory.mktemp("job_snapshot") / "job_snapshot.sqlite" if os.getenv("WORKDAY_API_URL") else None
+    store = JobSnapshotStore(path)
+    yield store
+    store.close()
+
+
+@pytest.fixture(scope="session")
+def keyword_discrepancies(request, job_snapshot):
+    """Sweep a generated keyword corpus through the stand-in replaying a recorded catalog once
+
+    The snapshot the oracle is built from is synced from the same recording, so every discrepancy is
+    a keyword the oracle's matching model gets wrong for the real catalog.
+    """
+    from keyword_sweep import KeywordCorpus, KeywordSweep
+    from search_oracle import SearchOracle
+    from workday_client import WorkdayApiError, WorkdayClient
+
+    # The corpus includes injection and fuzz strings, and the sweep crawls the whole catalog first:
+    # never send that to the live Workday tenant
+    if not os.getenv("WORKDAY_API_URL"):
+        pytest.skip("Keyword sweep runs only against a Workday stand-in (--workday-standin PATH or WORKDAY_API_URL)")
+    if request.config.getoption("--workday-standin") == "sample":
+        pytest.skip("Keyword sweep needs a recorded catalog, not the built-in sample postings")
+
+    concurrency = 8
+    client = WorkdayClient(pool_size=concurrency)
+    try:
+        job_snapshot.refresh_workday(client)
+        oracle = SearchOracle.from_snapshot(job_snapshot)
+        corpus = KeywordCorpus(oracle.vocabulary).build(int(os.getenv("KEYWORD_SWEEP_SIZE", "300")))
+        return KeywordSweep(client, oracle, concurrency=concurrency).run(corpus)
+    except WorkdayApiError as e:
+        pytest.skip(f"Workday API unavailable for keyword sweep: {str(e)}")
+    finally:
+        client.close()
+
+
 @pytest.fixture(scope="session")
 def env(request):
     """Get the environment from command line argument"""
@@ -67,6 +204,7 @@ def test_environment(request):
     }
 
 
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
     """Configure pytest with custom markers and setup"""
     # Add custom markers
@@ -92,18 +230,63 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "browserstack: marks tests that run on BrowserStack"
     )
+    config.addinivalue_line(
+        "markers", "browser: marks tests that need a local headless browser (skipped without one)"
+    )
 
     # Create test reports directory if it doesn't exist
     reports_dir = Path("test_reports")
     reports_dir.mkdir(exist_ok=True)
 
+    # Each parallel worker logs to its own file and leaves report files to the main process
+    worker_id = config.getoption("--worker-id")
+    log_file = f"test_execution_{worker_id}.log" if worker_id else "test_execution.log"
+    if worker_id:
+        config.option.xmlpath = None
+        if hasattr(config.option, "htmlpath"):
+            config.option.htmlpath = None
+
+        from parallel_runner import WorkerReporter
+        results_file = config.getoption("--results-file")
+        config.pluginmanager.register(WorkerReporter(config, results_file), "parallel_worker_reporter")
+    elif not config.option.collectonly:
+        # Leases from an earlier, interrupted run must not block this one
+        from browserstack_scheduler import PlatformSlots
+        PlatformSlots.clear(BROWSERSTACK_SLOTS_DIR)
+
+        # Durations are recorded once, in the main process, from every run serial or parallel
+        from duration_store import DurationStore, DurationRecorder
+        config.duration_store = DurationStore(config.getoption("--durations-db"))
+        config.pluginmanager.register(DurationRecorder(config.duration_store), "duration_recorder")
+
+        if config.getoption("--matrix"):
+            from matrix_runner import MatrixSummary
+            config.pluginmanager.register(MatrixSummary(), "matrix_summary")
+
+        # Started before any worker, which inherits WORKDAY_API_URL from this process
+        standin_source = config.getoption("--workday-standin")
+        if standin_source and not os.getenv("WORKDAY_API_URL"):
+            from workday_standin import WorkdayStandIn
+            if standin_source == "sample":
+                config.workday_standin = WorkdayStandIn().start()
+            else:
+                config.workday_standin = WorkdayStandIn.from_recording(standin_source).start()
+            os.environ["WORKDAY_API_URL"] = config.workday_standin.url
+
+    # Workers inherit the option, so every process records into the same corpus
+    snapshots_dir = config.getoption("--record-snapshots")
+    if snapshots_dir:
+        from snapshot_corpus import SnapshotCorpus
+        SnapshotCorpus.start_recording(snapshots_dir)
+
     # Set up logging
     import logging
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(reports_dir / "test_execution.log"),
+            # Opened on the first record, so runs where nothing is logged to it leave no file
+            logging.FileHandler(reports_dir / log_file, delay=True),
             logging.StreamHandler()
         ]
     )
@@ -153,6 +336,78 @@ def pytest_collection_modifyitems(config, items):
         if any(pattern in test_name_lower for pattern in integration_patterns):
             item.add_marker(pytest.mark.integration)
 
+    # Only runs that drive a browser update the duration DB
+    recorder = config.pluginmanager.get_plugin("duration_recorder")
+    if recorder is not None:
+        recorder.enabled = any(_is_browser_test(item) for item in items)
+
+    # Parallel workers only keep the items assigned to them, in the assigned order
+    shard_file = config.getoption("--shard-file")
+    if shard_file:
+        shard = Path(shard_file).read_text(encoding="utf-8").split("\n")
+        positions = {nodeid: index for index, nodeid in enumerate(shard) if nodeid}
+        selected = sorted((item for item in items if item.nodeid in positions),
+                          key=lambda item: positions[item.nodeid])
+        deselected = [item for item in items if item.nodeid not in positions]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+    # On BrowserStack, queue tests by platform so consecutive tests reuse one remote session.
+    # Each worker starts on a different platform so workers do not all wait on the same slots.
+    if os.getenv('USE_BROWSERSTACK', 'false').lower() == 'true':
+        worker_id = config.getoption("--worker-id") or "gw0"
+        offset = int(worker_id[2:]) if worker_id[2:].isdigit() else 0
+        rotation = BROWSER_ORDER[offset % len(BROWSER_ORDER):] + BROWSER_ORDER[:offset % len(BROWSER_ORDER)]
+        items.sort(key=lambda item: rotation.index(_item_browser(item)))
+
+
+def _is_browser_test(item):
+    """Whether a test item is parametrized with a browser, i.e. drives a real WebDriver"""
+    callspec = getattr(item, "callspec", None)
+    return bool(callspec and "browser" in callspec.params)
+
+
+def _item_browser(item):
+    """Browser a test item is parametrized with, defaulting to chrome"""
+    callspec = getattr(item, "callspec", None)
+    browser = callspec.params.get("browser", "chrome") if callspec else "chrome"
+    return browser if browser in BROWSER_ORDER else "chrome"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtestloop(session):
+    """Run the collected items in worker processes when --parallel is greater than 1 or --matrix is set"""
+    config = session.config
+    workers = config.getoption("--parallel")
+    matrix = config.getoption("--matrix")
+    if (workers <= 1 and not matrix) or config.getoption("--worker-id") or config.option.collectonly:
+        return None
+
+    if session.testsfailed and not config.option.continue_on_collection_errors:
+        raise session.Interrupted(
+            f"{session.testsfailed} error{'s' if session.testsfailed != 1 else ''} during collection"
+        )
+
+    if matrix:
+        from browserstack_scheduler import load_parallels_per_platform
+        from matrix_runner import MatrixRunner, parse_caps
+
+        # On BrowserStack each browser group may use every session its platform allows
+        default_cap = 1
+        if os.getenv('USE_BROWSERSTACK', 'false').lower() == 'true':
+            default_cap = load_parallels_per_platform(Path(__file__).parent / "browserstack.yml")
+        try:
+            caps = parse_caps(config.getoption("--matrix-caps"), default_cap)
+        except ValueError as e:
+            raise pytest.UsageError(str(e))
+        runner = MatrixRunner(config, caps, Path("test_reports"), durations=config.duration_store)
+    else:
+        from parallel_runner import ParallelRunner
+        runner = ParallelRunner(config, workers, Path("test_reports"), durations=config.duration_store)
+    runner.run(session.items)
+    return True
+
 
 def pytest_runtest_setup(item):
     """Run setup for each test item"""
@@ -160,6 +415,11 @@ def pytest_runtest_setup(item):
     if "smoke" in item.config.getoption("-m", default="") and item.get_closest_marker("slow"):
         pytest.skip("Skipping slow test in smoke test run")
 
+    # Recorded page snapshots are labelled with the test that captured them
+    from snapshot_corpus import SnapshotCorpus
+    if SnapshotCorpus.recorder is not None:
+        SnapshotCorpus.recorder.label = item.nodeid
+
 
 def pytest_sessionstart(session):
     """Called after the Session object has been created"""
@@ -172,13 +432,38 @@ def pytest_sessionstart(session):
     print("=" * 80)
     print(f"Environment: {env.upper()}")
     print(f"Browser: {browser.upper()}")
-    print("Execution Mode: Direct Test Execution")
-    print(f"Parallel processes: {session.config.getoption('--parallel')}")
+    parallel = session.config.getoption('--parallel')
+    worker_id = session.config.getoption('--worker-id')
+    if worker_id:
+        print(f"Execution Mode: Parallel Worker {worker_id}")
+    elif session.config.getoption('--matrix'):
+        print("Execution Mode: Browser Matrix")
+    elif parallel > 1:
+        print("Execution Mode: Process Pool")
+    else:
+        print("Execution Mode: Direct Test Execution")
+    print(f"Parallel processes: {parallel}")
     print("=" * 80 + "\n")
 
 
+def pytest_unconfigure(config):
+    """Stop the Workday stand-in started by --workday-standin and snapshot recording"""
+    if config.getoption("--record-snapshots"):
+        from snapshot_corpus import SnapshotCorpus
+        SnapshotCorpus.stop_recording()
+
+    standin = getattr(config, "workday_standin", None)
+    if standin:
+        standin.stop()
+        os.environ.pop("WORKDAY_API_URL", None)
+
+
 def pytest_sessionfinish(session, exitstatus):
     """Called after whole test run finished"""
+    # Selector matches are batched in memory during the session
+    from selector_memo import SelectorMemo
+    SelectorMemo.flush_shared()
+
     print("\n" + "=" * 80)
     print("TEST EXECUTION COMPLETED")
     print(f"Exit status: {exitstatus}")
@@ -191,7 +476,44 @@ def pytest_html_report_title(report):
 
 
 @pytest.fixture(autouse=True)
-def test_environment_info(request):
+def isolated_run_state(request, tmp_path_factory, monkeypatch):
+    """Point the run state that helpers persist under test_reports at a temporary directory in unit tests
+
+    Browser tests keep the real selector memo, consent seeds, caches and log; unit tests get fresh,
+    empty copies and do not write to the execution log.
+    """
+    if _is_browser_test(request.node):
+        yield
+        return
+
+    import logging
+    from consent_seeds import ConsentSeeder
+    from http_cache import HttpCache
+    from job_snapshot import JobSnapshotStore
+    from matrix_runner import MatrixSummary
+    from selector_memo import SelectorMemo
+    from snapshot_corpus import SnapshotCorpus
+    from workday_client import WorkdayClient
+
+    state_dir = tmp_path_factory.mktemp("run_state")
+    for cls, attribute, name in ((SelectorMemo, "DEFAULT_PATH", "selector_memo.json"),
+                                 (ConsentSeeder, "DEFAULT_PATH", "consent_seeds.json"),
+                                 (HttpCache, "DEFAULT_DIR", "http_cache"),
+                                 (JobSnapshotStore, "DEFAULT_PATH", "job_snapshot.sqlite"),
+                                 (SnapshotCorpus, "DEFAULT_DIR", "snapshots"),
+                                 (MatrixSummary, "DEFAULT_PATH", "browser_matrix.json")):
+        monkeypatch.setattr(cls, attribute, state_dir / name)
+    for cls in (SelectorMemo, ConsentSeeder, HttpCache, WorkdayClient):
+        monkeypatch.setattr(cls, "_shared", {})
+    monkeypatch.setattr(SnapshotCorpus, "recorder", None)
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.FileHandler):
+            monkeypatch.setattr(handler, "level", logging.CRITICAL + 1)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def test_environment_info(request, isolated_run_state):
     """Automatically capture test environment information"""
     test_info = {
         "test_name": request.node.name,
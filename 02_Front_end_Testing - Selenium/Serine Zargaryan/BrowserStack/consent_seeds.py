@@ -0,0 +1,170 @@
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+
+class ConsentSeeder:
+    """Writes cookie-consent state into the browser before the first visit to each domain"""
+
+    DEFAULT_PATH = Path("test_reports") / "consent_seeds.json"
+
+    # OneTrust hides its banner once OptanonAlertBoxClosed is set; OptanonConsent holds the accepted groups.
+    # "{now}" is replaced with the current UTC timestamp when the seed is applied.
+    BUILTIN_SEEDS = {
+        "www.blueorigin.com": {
+            "cookies": [
+                {"name": "OptanonAlertBoxClosed", "value": "{now}", "domain": ".blueorigin.com"},
+                {"name": "OptanonConsent", "domain": ".blueorigin.com",
+                 "value": "isGpcEnabled=0&datestamp={now}&isIABGlobal=false&interactionCount=1"
+                          "&landingPath=NotLandingPage&groups=C0001%3A1%2CC0002%3A1%2CC0003%3A1%2CC0004%3A1"}
+            ],
+            "local_storage": {}
+        }
+    }
+
+    # Names of cookies and storage keys captured after a banner is accepted by clicking
+    CONSENT_NAME_PATTERN = re.compile(r"consent|optanon|gdpr|cookie", re.IGNORECASE)
+
+    _shared = {}
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.seeds = dict(self.BUILTIN_SEEDS)
+        self.seeds.update(self._load())
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def shared(cls, path=None):
+        """Return one seeder per seed file so all helpers in a process share it"""
+        key = str(Path(path) if path else cls.DEFAULT_PATH)
+        if key not in cls._shared:
+            cls._shared[key] = cls(key)
+        return cls._shared[key]
+
+    @staticmethod
+    def domain_of(url):
+        return (urlparse(url).hostname or "").lower()
+
+    @staticmethod
+    def forget(driver):
+        """Mark a driver as unseeded, e.g. after its cookies were cleared"""
+        driver._consent_seeded_domains = set()
+
+    @staticmethod
+    def is_seeded(driver, domain):
+        return domain in getattr(driver, "_consent_seeded_domains", set())
+
+    def has_seed(self, domain):
+        return domain in self.seeds
+
+    def seed(self, driver, url):
+        """Inject consent cookies and localStorage for the URL's domain; returns True if a seed applies"""
+        domain = self.domain_of(url)
+        if not self.has_seed(domain):
+            return False
+        if self.is_seeded(driver, domain):
+            return True
+
+        seed = self.seeds[domain]
+        origin = f"{urlparse(url).scheme}://{domain}"
+        cookies = [self._render(cookie) for cookie in seed.get("cookies", [])]
+        local_storage = seed.get("local_storage", {})
+
+        try:
+            if local_storage or not self._set_cookies_with_cdp(driver, domain, cookies):
+                # Cookies and storage can only be written for the loaded origin
+                driver.get(f"{origin}/robots.txt")
+                for cookie in cookies:
+                    driver.add_cookie(cookie)
+                for key, value in local_storage.items():
+                    driver.execute_script("window.localStorage.setItem(arguments[0], arguments[1]);", key, value)
+        except Exception as e:
+            self.logger.warning(f"Could not seed consent for {domain}: {str(e)}")
+            return False
+
+        if not hasattr(driver, "_consent_seeded_domains"):
+            self.forget(driver)
+        driver._consent_seeded_domains.add(domain)
+        self.logger.info(f"Seeded cookie consent for {domain}")
+        return True
+
+    def record(self, driver):
+        """Capture the consent cookies and storage the page wrote after the banner was accepted"""
+        domain = self.domain_of(driver.current_url)
+        try:
+            cookies = [
+                {key: cookie[key] for key in ("name", "value", "domain", "path") if key in cookie}
+                for cookie in driver.get_cookies()
+                if self.CONSENT_NAME_PATTERN.search(cookie["name"])
+            ]
+            local_storage = self._read_consent_storage(driver)
+        except Exception as e:
+            self.logger.debug(f"Could not capture consent state for {domain}: {str(e)}")
+            return False
+
+        if not cookies and not local_storage:
+            return False
+        self.seeds[domain] = {"cookies": cookies, "local_storage": local_storage}
+        self._save()
+        self.logger.info(f"Recorded cookie consent seed for {domain}")
+        return True
+
+    def _read_consent_storage(self, driver):
+        items = driver.execute_script(
+            "var items = {};"
+            "for (var i = 0; i < window.localStorage.length; i++) {"
+            "  var key = window.localStorage.key(i);"
+            "  items[key] = window.localStorage.getItem(key);"
+            "}"
+            "return items;"
+        ) or {}
+        return {key: value for key, value in items.items() if self.CONSENT_NAME_PATTERN.search(key)}
+
+    @staticmethod
+    def _set_cookies_with_cdp(driver, domain, cookies):
+        """Set cookies without loading the site first (Chrome/Edge only)"""
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        try:
+            for cookie in cookies:
+                driver.execute_cdp_cmd("Network.setCookie", {
+                    "name": cookie["name"],
+                    "value": cookie["value"],
+                    "domain": cookie.get("domain", domain),
+                    "path": cookie.get("path", "/"),
+                    "secure": True
+                })
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _render(cookie):
+        now = time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
+        rendered = dict(cookie)
+        rendered["value"] = cookie["value"].replace("{now}", now)
+        rendered.setdefault("path", "/")
+        return rendered
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as seeds_file:
+                return json.load(seeds_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        recorded = self._load()
+        recorded.update({domain: seed for domain, seed in self.seeds.items() if domain not in self.BUILTIN_SEEDS})
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(temp_path, "w", encoding="utf-8") as seeds_file:
+                json.dump(recorded, seeds_file, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"Could not save consent seeds: {str(e)}")
@@ -0,0 +1,105 @@
+import heapq
+import json
+import logging
+import os
+import statistics
+from pathlib import Path
+
+
+class DurationStore:
+    """Local database of historical per-test durations, keyed by node ID"""
+
+    DEFAULT_PATH = Path("test_reports") / "test_durations.json"
+    DEFAULT_DURATION = 30.0
+    # Weight of the newest run in the moving average
+    SMOOTHING = 0.5
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.durations = self._load()
+        # Median of the known durations, the estimate for unknown tests; None until needed after a change
+        self._median = None
+        self.logger = logging.getLogger(__name__)
+
+    def _load(self):
+        """Read stored durations, treating a missing or corrupt file as empty"""
+        try:
+            with open(self.path, encoding="utf-8") as db:
+                return {nodeid: float(value) for nodeid, value in json.load(db).items()}
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def record(self, nodeid, duration):
+        """Blend a new measurement into the stored duration for a test"""
+        previous = self.durations.get(nodeid)
+        self._median = None
+        if previous is None:
+            self.durations[nodeid] = duration
+        else:
+            self.durations[nodeid] = self.SMOOTHING * duration + (1 - self.SMOOTHING) * previous
+
+    def estimate(self, nodeid):
+        """Expected duration of a test, falling back to the median of known tests"""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        if self.durations:
+            if self._median is None:
+                self._median = statistics.median(self.durations.values())
+            return self._median
+        return self.DEFAULT_DURATION
+
+    def save(self):
+        """Write durations atomically so an interrupted run never corrupts the file"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as db:
+            json.dump(self.durations, db, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+        self.logger.info(f"Saved durations for {len(self.durations)} tests to {self.path}")
+
+
+def partition_by_duration(items, workers, store):
+    """Bin-pack items onto workers by expected duration, longest first onto the least loaded worker"""
+    shards = [[] for _ in range(workers)]
+    loads = [(0.0, index) for index in range(workers)]
+    heapq.heapify(loads)
+
+    positions = {item.nodeid: position for position, item in enumerate(items)}
+    for item in sorted(items, key=lambda item: store.estimate(item.nodeid), reverse=True):
+        load, index = heapq.heappop(loads)
+        shards[index].append(item)
+        heapq.heappush(loads, (load + store.estimate(item.nodeid), index))
+
+    # Keep collection order inside each shard so related tests stay together
+    for shard in shards:
+        shard.sort(key=lambda item: positions[item.nodeid])
+    return shards
+
+
+class DurationRecorder:
+    """Plugin that accumulates setup, call and teardown time per test and saves it at the end"""
+
+    def __init__(self, store):
+        self.store = store
+        self._totals = {}
+        self._skipped = set()
+        # Cleared by conftest for runs without browser tests, so unit-test runs leave the file alone
+        self.enabled = True
+
+    def pytest_runtest_logreport(self, report):
+        # Reports made up for tests a crashed worker never finished carry no real timing
+        if report.skipped or getattr(report, "lost", False):
+            self._skipped.add(report.nodeid)
+        self._totals[report.nodeid] = self._totals.get(report.nodeid, 0.0) + report.duration
+
+        if report.when == "teardown":
+            total = self._totals.pop(report.nodeid, 0.0)
+            # A skipped test says nothing about how long the test really takes
+            if report.nodeid in self._skipped:
+                self._skipped.discard(report.nodeid)
+            else:
+                self.store.record(report.nodeid, total)
+
+    def pytest_sessionfinish(self, session):
+        if self.enabled:
+            self.store.save()
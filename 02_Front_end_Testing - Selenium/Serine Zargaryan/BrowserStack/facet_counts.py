@@ -0,0 +1,100 @@
+import logging
+from collections import Counter
+
+from http_cache import HttpCache
+from job_details import JobDetailFetcher
+from workday_client import WorkdayClient
+from workday_crawler import WorkdayCrawler
+
+
+class FacetAggregator:
+    """Counts the crawled catalog per facet value locally and reports drift from the facets Workday returns"""
+
+    # facetParameter -> jobPostingInfo keys holding that facet's values
+    FACET_FIELDS = {
+        "locations": ("location", "additionalLocations"),
+        "jobFamilyGroup": ("jobFamilyGroup", "jobFamily"),
+        "timeType": ("timeType",)
+    }
+
+    def __init__(self, facet_fields=None):
+        self.facet_fields = dict(facet_fields or self.FACET_FIELDS)
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def normalize(value):
+        return " ".join(str(value).split()).casefold()
+
+    def count(self, infos):
+        """Per-facet Counter of normalized values over jobPostingInfo dicts, in one pass over the catalog"""
+        counts = {facet: Counter() for facet in self.facet_fields}
+        for info in infos:
+            for facet, keys in self.facet_fields.items():
+                values = set()
+                for key in keys:
+                    value = info.get(key)
+                    for item in value if isinstance(value, list) else [value]:
+                        if item:
+                            values.add(self.normalize(item))
+                # A job listed in several locations counts once for each of them, as in Workday
+                counts[facet].update(values)
+        return counts
+
+    @classmethod
+    def reported(cls, facets):
+        """Flatten a CXS facets block into {facetParameter: {normalized descriptor: count}}"""
+        reported = {}
+
+        def walk(nodes, parameter):
+            for node in nodes or []:
+                if "count" in node and parameter:
+                    values = reported.setdefault(parameter, {})
+                    descriptor = cls.normalize(node.get("descriptor", node.get("id", "")))
+                    values[descriptor] = values.get(descriptor, 0) + int(node["count"])
+                else:
+                    # Groups such as locationMainGroup nest the real facet one level down
+                    walk(node.get("values"), node.get("facetParameter") or parameter)
+
+        walk(facets, None)
+        return reported
+
+    def drift(self, local, reported):
+        """One record per facet value whose local count differs from Workday's"""
+        drift = []
+        for facet in sorted(set(local) & set(reported)):
+            for value in sorted(set(local[facet]) | set(reported[facet])):
+                local_count = local[facet].get(value, 0)
+                workday_count = reported[facet].get(value, 0)
+                if local_count != workday_count:
+                    drift.append({"facet": facet, "value": value, "local": local_count, "workday": workday_count})
+        for facet in sorted(set(local) - set(reported)):
+            self.logger.info(f"Workday did not report facet {facet}; not compared")
+        return drift
+
+    def run(self, client, postings=None, concurrency=8):
+        """Crawl the catalog and its details, then return the drift against the reported facets"""
+        if postings is None:
+            postings = WorkdayCrawler(client, concurrency=concurrency).crawl_all()
+        details = JobDetailFetcher(client, concurrency=concurrency).fetch(postings)
+        infos = [detail.get("jobPostingInfo", {}) for detail in details.values() if detail]
+        local = self.count(infos)
+        reported = self.reported(client.search(limit=1).get("facets"))
+        drift = self.drift(local, reported)
+        self.logger.info(f"Aggregated {len(infos)} jobs over {len(local)} facets: {len(drift)} values drift")
+        return drift
+
+    @staticmethod
+    def format_report(drift):
+        """Compact report: one line per drifting facet value"""
+        if not drift:
+            return "Facet counts match Workday"
+        lines = [f"{len(drift)} facet values drift from Workday:"]
+        for item in drift:
+            lines.append(f"  {item['facet']:<15} {item['value']!r}: local {item['local']} != workday {item['workday']}")
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    workday_client = WorkdayClient(pool_size=8, cache=HttpCache.shared())
+    print(FacetAggregator.format_report(FacetAggregator().run(workday_client)))
@@ -0,0 +1,183 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+
+class HttpCache:
+    """Response cache with TTL, ETag revalidation and LRU eviction by bytes, shared between workers on disk"""
+
+    DEFAULT_DIR = Path("test_reports") / "http_cache"
+    DEFAULT_TTL = 300
+    DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+    # A full disk store is trimmed to this share of max_bytes, so the next writes need no scan
+    DISK_LOW_WATER = 0.8
+
+    _shared = {}
+
+    def __init__(self, directory=None, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES, clock=time.time):
+        self.directory = Path(directory) if directory else self.DEFAULT_DIR
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.clock = clock
+        # In-process layer: key -> entry, least recently used first
+        self._entries = OrderedDict()
+        self._bytes = 0
+        # Size of the disk store as of the last scan plus this process's writes since; None until scanned
+        self._disk_bytes = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def shared(cls, directory=None):
+        """Return one cache per directory so every client in a process shares it"""
+        key = str(Path(directory) if directory else cls.DEFAULT_DIR)
+        if key not in cls._shared:
+            cls._shared[key] = cls(key)
+        return cls._shared[key]
+
+    @staticmethod
+    def key(method, url, body=None):
+        digest = hashlib.sha256(f"{method} {url}\n".encode("utf-8"))
+        digest.update(body or b"")
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Cached entry (fresh or stale) from memory, then from the shared disk store"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        entry = self._read(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def is_fresh(self, entry):
+        return self.clock() - entry["stored_at"] <= self.ttl
+
+    def put(self, key, body, etag=None):
+        entry = {"body": body, "etag": etag, "stored_at": self.clock()}
+        self._remember(key, entry)
+        self._write(key, entry)
+        return entry
+
+    def refresh(self, key, entry):
+        """Restart the TTL of an entry the server confirmed unchanged (HTTP 304)"""
+        entry["stored_at"] = self.clock()
+        self._write(key, entry)
+        return entry
+
+    def fetch(self, method, url, body, headers, send):
+        """Serve a request from the cache, revalidating stale entries with If-None-Match
+
+        send(headers) performs the request and returns (status, data, response_headers).
+        """
+        key = self.key(method, url, body)
+        entry = self.get(key)
+        if entry is not None and self.is_fresh(entry):
+            self.hits += 1
+            return 200, entry["body"]
+
+        if entry is not None and entry["etag"]:
+            headers = dict(headers, **{"If-None-Match": entry["etag"]})
+        status, data, response_headers = send(headers)
+
+        if status == 304 and entry is not None:
+            self.revalidations += 1
+            return 200, self.refresh(key, entry)["body"]
+        self.misses += 1
+        if status == 200:
+            self.put(key, data, response_headers.get("ETag"))
+        return status, data
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._disk_bytes = 0
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def _remember(self, key, entry):
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous["body"])
+            self._entries[key] = entry
+            self._bytes += len(entry["body"])
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted["body"])
+
+    def _read(self, key):
+        path = self.directory / f"{key}.json"
+        try:
+            with open(path, encoding="utf-8") as entry_file:
+                stored = json.load(entry_file)
+            # Access time drives the disk LRU
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return {"body": base64.b64decode(stored["body"]), "etag": stored["etag"], "stored_at": stored["stored_at"]}
+
+    def _write(self, key, entry):
+        stored = {"body": base64.b64encode(entry["body"]).decode("ascii"), "etag": entry["etag"],
+                  "stored_at": entry["stored_at"]}
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"{key}.json"
+            temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_path, "w", encoding="utf-8") as entry_file:
+                json.dump(stored, entry_file)
+            added = os.path.getsize(temp_path)
+            try:
+                added -= os.path.getsize(path)
+            except OSError:
+                pass
+            os.replace(temp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Could not write HTTP cache entry: {str(e)}")
+            return
+        with self._lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes += added
+            over_budget = self._disk_bytes is None or self._disk_bytes > self.max_bytes
+        # The directory is only scanned when the store may have outgrown its budget
+        if over_budget:
+            self._evict_from_disk()
+
+    def _evict_from_disk(self):
+        """Delete least recently used files until the store is back under its low-water mark
+
+        The scan also picks up entries other workers wrote since the last one.
+        """
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        if total <= self.max_bytes:
+            with self._lock:
+                self._disk_bytes = total
+            return
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes * self.DISK_LOW_WATER:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+            except OSError:
+                continue
+        with self._lock:
+            self._disk_bytes = total
@@ -0,0 +1,89 @@
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from http_cache import HttpCache
+from job_snapshot import JobSnapshotStore
+from workday_client import WorkdayApiError, WorkdayClient
+from workday_crawler import WorkdayCrawler
+
+
+class JobDetailFetcher:
+    """Fetches every job detail concurrently and diffs it against the job list entries"""
+
+    # (field name, key in the list posting, key in jobPostingInfo)
+    COMPARED_FIELDS = [
+        ("title", "title", "title"),
+        ("location", "locationsText", "location"),
+        ("posted", "postedOn", "postedOn")
+    ]
+    # The list shows "3 Locations" for multi-site jobs, which the detail spells out
+    MULTI_LOCATION_PATTERN = re.compile(r"^\d+ Locations$")
+
+    def __init__(self, client=None, concurrency=8):
+        self.concurrency = concurrency
+        self.client = client or WorkdayClient(pool_size=concurrency, cache=HttpCache.shared())
+        self.logger = logging.getLogger(__name__)
+
+    def fetch(self, postings):
+        """Detail response for every posting by externalPath; None where the request failed"""
+        def fetch_one(posting):
+            try:
+                return self.client.job_detail(posting["externalPath"])
+            except WorkdayApiError as e:
+                self.logger.warning(f"Could not fetch {posting['externalPath']}: {str(e)}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="job-details") as executor:
+            return dict(zip((posting["externalPath"] for posting in postings), executor.map(fetch_one, postings)))
+
+    def diff(self, postings, details):
+        """One mismatch record per differing field, plus one per detail that could not be fetched"""
+        mismatches = []
+        for posting in postings:
+            path = posting["externalPath"]
+            requisition_id = JobSnapshotStore.workday_record(posting)["requisition_id"]
+            detail = details.get(path)
+            if detail is None:
+                mismatches.append({"requisition_id": requisition_id, "path": path, "field": "fetch",
+                                   "list": None, "detail": None})
+                continue
+
+            info = detail.get("jobPostingInfo", {})
+            for field, list_key, detail_key in self.COMPARED_FIELDS:
+                listed = (posting.get(list_key) or "").strip()
+                detailed = (info.get(detail_key) or "").strip()
+                if field == "location" and self.MULTI_LOCATION_PATTERN.match(listed):
+                    continue
+                if listed != detailed:
+                    mismatches.append({"requisition_id": requisition_id, "path": path, "field": field,
+                                       "list": listed, "detail": detailed})
+        return mismatches
+
+    def run(self, postings=None):
+        """Fetch details for postings (default: the whole catalog) and return the mismatches"""
+        if postings is None:
+            postings = WorkdayCrawler(self.client).crawl_all()
+        details = self.fetch(postings)
+        mismatches = self.diff(postings, details)
+        self.logger.info(f"Compared {len(postings)} job details with the list: {len(mismatches)} mismatches")
+        return mismatches
+
+    @staticmethod
+    def format_report(mismatches):
+        """Compact report: one line per mismatch, grouped by field"""
+        if not mismatches:
+            return "Job details match the job list"
+        lines = [f"{len(mismatches)} job detail mismatches:"]
+        for mismatch in sorted(mismatches, key=lambda item: (item["field"], item["requisition_id"] or "")):
+            if mismatch["field"] == "fetch":
+                lines.append(f"  fetch     {mismatch['requisition_id']}: detail unavailable ({mismatch['path']})")
+            else:
+                lines.append(f"  {mismatch['field']:<9} {mismatch['requisition_id']}: "
+                             f"list {mismatch['list']!r} != detail {mismatch['detail']!r}")
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(JobDetailFetcher.format_report(JobDetailFetcher().run()))
@@ -0,0 +1,170 @@
+import logging
+import re
+import sqlite3
+import time
+from pathlib import Path
+
+from workday_crawler import WorkdayCrawler
+
+
+WORKDAY = "workday"
+BLUEORIGIN = "blueorigin"
+
+
+class JobSnapshotStore:
+    """SQLite snapshot of the Workday and blueorigin.com job catalogs, keyed by requisition ID"""
+
+    DEFAULT_PATH = Path("test_reports") / "job_snapshot.sqlite"
+    # A snapshot younger than this is used without asking Workday anything
+    MAX_AGE_SECONDS = 15 * 60
+
+    # ".../Structural-Design-Engineer-III---New-Glenn_R53757" or "..._R53757-1"
+    REQUISITION_PATTERN = re.compile(r"_(R\d+)(?:-\d+)?/?(?:[?#].*)?$")
+    BULLET_PATTERN = re.compile(r"^R\d+$")
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            source TEXT NOT NULL,
+            requisition_id TEXT NOT NULL,
+            title TEXT,
+            url TEXT,
+            location TEXT,
+            first_seen REAL NOT NULL,
+            PRIMARY KEY (source, requisition_id)
+        );
+        CREATE TABLE IF NOT EXISTS syncs (
+            source TEXT PRIMARY KEY,
+            synced_at REAL NOT NULL,
+            total INTEGER NOT NULL
+        );
+    """
+
+    def __init__(self, path=None, clock=time.time):
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.clock = clock
+        # Parallel workers share the file; wait for their write locks instead of failing
+        self.connection = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(self.SCHEMA)
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def requisition_id(cls, url):
+        """Extract the requisition ID (e.g. R53757) from a job URL or path"""
+        match = cls.REQUISITION_PATTERN.search(url or "")
+        return match.group(1) if match else None
+
+    @classmethod
+    def workday_record(cls, posting, base_url=""):
+        """Convert a Workday CXS posting into a snapshot record"""
+        path = posting.get("externalPath", "")
+        requisition_id = cls.requisition_id(path)
+        if not requisition_id:
+            requisition_id = next((field for field in posting.get("bulletFields") or []
+                                   if cls.BULLET_PATTERN.match(field)), None)
+        return {
+            "requisition_id": requisition_id,
+            "title": posting.get("title", "").strip(),
+            "url": f"{base_url}{path}",
+            "location": posting.get("locationsText", "")
+        }
+
+    @classmethod
+    def listing_record(cls, listing):
+        """Convert a record from BlueOriginHelpers.extract_job_listings into a snapshot record"""
+        return {
+            "requisition_id": cls.requisition_id(listing.get("href")),
+            "title": listing.get("text", "").strip(),
+            "url": listing.get("href"),
+            "location": ""
+        }
+
+    def sync(self, source, records, complete=True, total=None):
+        """Apply only the added and removed requisitions; partial listings never remove anything"""
+        now = self.clock()
+        incoming = {}
+        for record in records:
+            if record.get("requisition_id"):
+                incoming[record["requisition_id"]] = record
+            else:
+                self.logger.debug(f"Skipping {source} record without requisition ID: {record.get('url')}")
+
+        with self.connection:
+            existing = self.requisitions(source)
+            added = sorted(set(incoming) - existing)
+            removed = sorted(existing - set(incoming)) if complete else []
+
+            self.connection.executemany(
+                "INSERT INTO jobs (source, requisition_id, title, url, location, first_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(source, requisition_id, incoming[requisition_id].get("title"), incoming[requisition_id].get("url"),
+                  incoming[requisition_id].get("location"), now)
+                 for requisition_id in added]
+            )
+            self.connection.executemany(
+                "DELETE FROM jobs WHERE source = ? AND requisition_id = ?",
+                [(source, requisition_id) for requisition_id in removed]
+            )
+            if complete:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO syncs (source, synced_at, total) VALUES (?, ?, ?)",
+                    (source, now, len(incoming) if total is None else total)
+                )
+
+        self.logger.info(f"Synced {source} snapshot: {len(added)} added, {len(removed)} removed")
+        return {"added": added, "removed": removed, "total": self.count(source)}
+
+    def refresh_workday(self, client, max_age=None):
+        """Bring the Workday catalog up to date; returns the sync delta, or None if nothing was fetched"""
+        if self.is_fresh(WORKDAY, max_age):
+            return None
+        # The total is one cheap request; the catalog is only crawled when it changed
+        if client.job_count() == self.synced_total(WORKDAY):
+            self._touch(WORKDAY)
+            return None
+        postings = WorkdayCrawler(client).crawl_all()
+        return self.sync(WORKDAY, [self.workday_record(posting, client.base_url) for posting in postings],
+                         total=len(postings))
+
+    def is_fresh(self, source, max_age=None):
+        synced_at = self.last_sync(source)
+        max_age = self.MAX_AGE_SECONDS if max_age is None else max_age
+        return synced_at is not None and self.clock() - synced_at <= max_age
+
+    def last_sync(self, source):
+        row = self.connection.execute("SELECT synced_at FROM syncs WHERE source = ?", (source,)).fetchone()
+        return row[0] if row else None
+
+    def synced_total(self, source):
+        """Number of postings the source reported at the last complete sync"""
+        row = self.connection.execute("SELECT total FROM syncs WHERE source = ?", (source,)).fetchone()
+        return row[0] if row else None
+
+    def requisitions(self, source):
+        rows = self.connection.execute("SELECT requisition_id FROM jobs WHERE source = ?", (source,))
+        return {row[0] for row in rows}
+
+    def count(self, source):
+        return self.connection.execute("SELECT COUNT(*) FROM jobs WHERE source = ?", (source,)).fetchone()[0]
+
+    def jobs(self, source):
+        """All records of a source, oldest first"""
+        rows = self.connection.execute(
+            "SELECT requisition_id, title, url, location FROM jobs "
+            "WHERE source = ? ORDER BY first_seen, requisition_id",
+            (source,)
+        )
+        return [{"requisition_id": row[0], "title": row[1], "url": row[2], "location": row[3]} for row in rows]
+
+    def diff(self, source, other):
+        """Requisitions present in only one of the two sources"""
+        ours, theirs = self.requisitions(source), self.requisitions(other)
+        return {f"only_in_{source}": sorted(ours - theirs), f"only_in_{other}": sorted(theirs - ours)}
+
+    def close(self):
+        self.connection.close()
+
+    def _touch(self, source):
+        with self.connection:
+            self.connection.execute("UPDATE syncs SET synced_at = ? WHERE source = ?", (self.clock(), source))
@@ -0,0 +1,107 @@
+import codecs
+import json
+
+
+class JsonArrayStream:
+    """Incrementally parses a JSON object from byte chunks, yielding the items of one array member as they arrive
+
+    Only the current item and one chunk are held in memory. Other top-level members
+    (e.g. "total") are decoded whole and collected in fields.
+    """
+
+    WHITESPACE = " \t\r\n"
+
+    def __init__(self, chunks, array_key):
+        self.chunks = iter(chunks)
+        self.array_key = array_key
+        self.fields = {}
+        self.items_parsed = 0
+        # Largest amount of undecoded text held at once, to verify memory stays flat
+        self.max_buffered = 0
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    def __iter__(self):
+        try:
+            self._expect("{")
+            while True:
+                char = self._next_token_char()
+                if char == "}":
+                    return
+                if char == ",":
+                    self._position += 1
+                    continue
+                key = self._decode_value()
+                self._expect(":")
+                if key == self.array_key:
+                    yield from self._iter_array()
+                else:
+                    self.fields[key] = self._decode_value()
+        finally:
+            # Lets a chunk generator release its connection when iteration stops early
+            close = getattr(self.chunks, "close", None)
+            if close is not None:
+                close()
+
+    def _iter_array(self):
+        self._expect("[")
+        while True:
+            char = self._next_token_char()
+            if char == "]":
+                self._position += 1
+                return
+            if char == ",":
+                self._position += 1
+                continue
+            item = self._decode_value()
+            self.items_parsed += 1
+            yield item
+
+    def _decode_value(self):
+        """Decode the value at the current position, reading chunks until it is complete"""
+        self._next_token_char()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+                # A number at the very end of the buffer may continue in the next chunk
+                if end < len(self._buffer) or self._exhausted:
+                    self._position = end
+                    self._compact()
+                    return value
+            except json.JSONDecodeError:
+                if self._exhausted:
+                    raise
+            self._read_chunk()
+
+    def _expect(self, char):
+        if self._next_token_char() != char:
+            raise json.JSONDecodeError(f"Expected {char!r}", self._buffer, self._position)
+        self._position += 1
+
+    def _next_token_char(self):
+        """Skip whitespace and return the next character without consuming it"""
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in self.WHITESPACE:
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if self._exhausted:
+                raise json.JSONDecodeError("Unexpected end of document", self._buffer, self._position)
+            self._read_chunk()
+
+    def _read_chunk(self):
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self._exhausted = True
+            self._buffer += self._text_decoder.decode(b"", final=True)
+        else:
+            self._buffer += self._text_decoder.decode(chunk)
+        self.max_buffered = max(self.max_buffered, len(self._buffer) - self._position)
+
+    def _compact(self):
+        """Drop text that has already been parsed"""
+        self._buffer = self._buffer[self._position:]
+        self._position = 0
@@ -0,0 +1,129 @@
+import logging
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from workday_client import WorkdayApiError
+
+
+INJECTION_KEYWORDS = [
+    "  software engineer @@ ##  ",
+    "' OR '1'='1",
+    "\" OR 1=1 --",
+    "engineer; DROP TABLE jobs;",
+    "<script>alert(1)</script>",
+    "${7*7}",
+    "{{7*7}}",
+    "../../etc/passwd",
+    "%00engineer",
+    "engineer\\",
+    "*",
+    "?",
+    "engineer*",
+    "\"software engineer\"",
+    "software AND engineer",
+    "software OR technician",
+    "NOT engineer",
+    "-engineer"
+]
+
+UNICODE_KEYWORDS = [
+    "ingénieur", "Ingenieur", "инженер", "工程师", "エンジニア", "مهندس", "naïve", "straße", "Ωmega",
+    "sof\u00adtware",  # soft hyphen
+    "\uff53\uff4f\uff46\uff54\uff57\uff41\uff52\uff45",  # full-width "software"
+    "softw\u0430re",  # Cyrillic a
+    "engineer\u200b",  # zero-width space
+    "\U0001f680", "engineer \U0001f680"
+]
+
+# Regular, double, tab, no-break and ideographic spaces
+WHITESPACE = [" ", "  ", "\t", "\u00a0", "\u3000"]
+
+
+class KeywordCorpus:
+    """Generators for large keyword corpora used by the search sweep"""
+
+    def __init__(self, vocabulary=(), seed=0):
+        # Real catalog tokens make most generated queries plausible, so counts are not all zero
+        self.vocabulary = sorted(vocabulary) or ["software", "engineer", "technician", "manager", "senior"]
+        self.random = random.Random(seed)
+
+    def numerics(self, count):
+        fixed = ["0", "1", "123", "2024", "007", "-1", "1.5", "1e3", "99999999999999999999"]
+        generated = [str(self.random.randint(0, 10 ** self.random.randint(1, 6))) for _ in range(count)]
+        return fixed + generated
+
+    def words(self, count, max_terms=3):
+        return [" ".join(self.random.choice(self.vocabulary) for _ in range(self.random.randint(1, max_terms)))
+                for _ in range(count)]
+
+    def whitespace_mixes(self, count):
+        keywords = []
+        for keyword in self.words(count):
+            separator = self.random.choice(WHITESPACE)
+            padding = self.random.choice(WHITESPACE) * self.random.randint(0, 2)
+            keywords.append(padding + separator.join(keyword.split()) + padding)
+        return keywords
+
+    def case_mixes(self, count):
+        return ["".join(char.upper() if self.random.random() < 0.5 else char for char in keyword)
+                for keyword in self.words(count)]
+
+    def unicode(self, count):
+        mixed = [f"{self.random.choice(UNICODE_KEYWORDS)} {word}" for word in self.words(count, max_terms=1)]
+        return UNICODE_KEYWORDS + mixed
+
+    def injections(self, count):
+        wrapped = [f"{word} {self.random.choice(INJECTION_KEYWORDS)}" for word in self.words(count, max_terms=1)]
+        return INJECTION_KEYWORDS + wrapped
+
+    def build(self, size):
+        """A de-duplicated corpus of about size keywords across all categories, in a stable order"""
+        share = max(1, size // 6)
+        corpus = (self.injections(share) + self.numerics(share) + self.unicode(share) +
+                  self.whitespace_mixes(share) + self.case_mixes(share) + self.words(size))
+        return list(dict.fromkeys(corpus))[:size]
+
+
+class KeywordSweep:
+    """Runs a keyword corpus against the Workday search API and escalates discrepancies to a browser"""
+
+    def __init__(self, client, oracle, concurrency=8, tolerance=0):
+        self.client = client
+        self.oracle = oracle
+        self.concurrency = concurrency
+        self.tolerance = tolerance
+        self.logger = logging.getLogger(__name__)
+
+    def observe(self, keywords):
+        """API result count for every keyword; None where the request failed"""
+        def count(keyword):
+            try:
+                return self.client.job_count(keyword)
+            except WorkdayApiError as e:
+                self.logger.warning(f"Sweep request failed for {keyword!r}: {str(e)}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="keyword-sweep") as executor:
+            return dict(zip(keywords, executor.map(count, keywords)))
+
+    def run(self, keywords):
+        """Sweep the corpus and return the keywords whose API count disagrees with the oracle"""
+        observed = self.observe(keywords)
+        discrepancies = self.oracle.outliers(observed, tolerance=self.tolerance)
+        self.logger.info(f"Keyword sweep: {len(keywords)} queries, {len(discrepancies)} discrepancies")
+        return discrepancies
+
+    @staticmethod
+    def escalate(helpers, discrepancies, search_url, limit=30):
+        """Re-run up to limit discrepant keywords through the careers site search in the browser"""
+        escalated = []
+        for discrepancy in discrepancies[:limit]:
+            helpers.open_url(search_url)
+            helpers.handle_cookie_consent()
+            if helpers.search_for_keyword(discrepancy["keyword"]):
+                helpers.wait_for_dom_settle()
+                browser_count = helpers.get_search_results_count()
+            else:
+                browser_count = None
+            escalated.append(dict(discrepancy, browser=browser_count))
+        return escalated
@@ -0,0 +1,133 @@
+import json
+import logging
+import os
+import re
+from pathlib import Path
+
+from parallel_runner import ParallelRunner
+
+MATRIX_BROWSERS = ("chrome", "firefox", "edge")
+# Group for tests that are not parametrized by browser
+SHARED_GROUP = "shared"
+
+
+def parse_caps(text, default=1):
+    """Per-browser worker caps from 'chrome=2,edge=1'; browsers not listed get the default"""
+    caps = {browser: default for browser in MATRIX_BROWSERS}
+    caps[SHARED_GROUP] = 1
+    for part in (text or "").split(","):
+        if not part.strip():
+            continue
+        browser, _, value = part.partition("=")
+        browser = browser.strip().lower()
+        if browser not in caps or not value.strip().isdigit() or int(value) < 1:
+            raise ValueError(f"Invalid matrix cap '{part.strip()}', expected e.g. 'chrome=2,firefox=1,edge=1'")
+        caps[browser] = int(value)
+    return caps
+
+
+def item_browser(item):
+    """Browser a test item is parametrized with, or None"""
+    callspec = getattr(item, "callspec", None)
+    browser = callspec.params.get("browser") if callspec else None
+    return browser if browser in MATRIX_BROWSERS else None
+
+
+def split_browser(nodeid):
+    """(test ID without the browser parameter, browser) for a node ID; browser is None if it has none"""
+    match = re.search(r"\[([^\]]*)\]$", nodeid)
+    if not match:
+        return nodeid, None
+    params = match.group(1).split("-")
+    browser = next((param for param in params if param in MATRIX_BROWSERS), None)
+    if browser is None:
+        return nodeid, None
+    params.remove(browser)
+    base = nodeid[:match.start()]
+    return (f"{base}[{'-'.join(params)}]" if params else base), browser
+
+
+class MatrixRunner(ParallelRunner):
+    """Runs each browser's variants in their own group of worker processes, all groups at once
+
+    Every worker has its own driver pool, so browsers never share or wait on each other's
+    drivers, and the run takes about as long as the slowest browser's group. caps limits the
+    workers, and so the concurrent browsers, per group.
+    """
+
+    def __init__(self, config, caps, reports_dir, durations=None):
+        super().__init__(config, sum(caps.values()), reports_dir, durations)
+        self.caps = caps
+
+    def group_items(self, items):
+        """{group: items} in collection order, one group per browser plus one for the rest"""
+        groups = {}
+        for item in items:
+            groups.setdefault(item_browser(item) or SHARED_GROUP, []).append(item)
+        return groups
+
+    def shard_items(self, items):
+        shards = []
+        for group, group_items in self.group_items(items).items():
+            workers = min(self.caps.get(group, 1), len(group_items))
+            self.logger.info(f"Matrix group {group}: {len(group_items)} tests on {workers} workers")
+            shards.extend(super().shard_items(group_items, workers))
+        return shards
+
+
+class MatrixSummary:
+    """Plugin that groups the outcomes of each test's browser variants by test ID"""
+
+    DEFAULT_PATH = Path("test_reports") / "browser_matrix.json"
+
+    # A variant's outcome is the worst of its setup, call and teardown phases
+    RANK = {"passed": 0, "skipped": 1, "failed": 2, "error": 3}
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.results = {}
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def outcome(report):
+        if report.failed:
+            return "failed" if report.when == "call" else "error"
+        return "skipped" if report.skipped else "passed"
+
+    def pytest_runtest_logreport(self, report):
+        test_id, browser = split_browser(report.nodeid)
+        if browser is None:
+            return
+        outcomes = self.results.setdefault(test_id, {})
+        outcome = self.outcome(report)
+        if browser not in outcomes or self.RANK[outcome] > self.RANK[outcomes[browser]]:
+            outcomes[browser] = outcome
+
+    def format_lines(self):
+        """One line per test ID with each browser's outcome; tests that differ across browsers are marked"""
+        width = max((len(test_id) for test_id in self.results), default=0)
+        lines = []
+        for test_id in sorted(self.results):
+            outcomes = self.results[test_id]
+            cells = "  ".join(f"{browser}: {outcomes.get(browser, '-'):<7}" for browser in MATRIX_BROWSERS)
+            marker = "  <- differs across browsers" if len(set(outcomes.values())) > 1 else ""
+            lines.append(f"{test_id:<{width}}  {cells}".rstrip() + marker)
+        return lines
+
+    def save(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(temp_path, "w", encoding="utf-8") as matrix_file:
+                json.dump(self.results, matrix_file, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"Could not save browser matrix: {str(e)}")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.results:
+            return
+        terminalreporter.write_sep("=", "browser matrix")
+        for line in self.format_lines():
+            terminalreporter.write_line(line)
+        self.save()
@@ -0,0 +1,198 @@
+import logging
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from test_helpers import BlueOriginLocators, BlueOriginUrls, WebDriverPool
+
+
+class NavigationState:
+    """A named browser state reached by a fixed navigation prefix, e.g. a search page with a query entered
+
+    build(helpers) navigates from the parent state (or from a blank driver) and returns True on success.
+    verify(helpers) checks that a restored copy really shows the state.
+    """
+
+    def __init__(self, name, build, verify=None, parent=None):
+        self.name = name
+        self.build = build
+        self.verify = verify
+        self.parent = parent
+
+    def __repr__(self):
+        return f"NavigationState({self.name!r})"
+
+
+class NavigationStateCache:
+    """Captures navigation states once per browser and restores them into pooled drivers
+
+    A capture holds the cookies, localStorage and sessionStorage of the state's origin and the URL
+    it ended on. Restoring writes them into a clean driver and loads the URL instead of repeating
+    the navigation. A restored copy that fails the state's check is rebuilt by navigation, and that
+    state is not restored again in the session.
+    """
+
+    STORAGE_READ_SCRIPT = (
+        "function dump(storage) {"
+        "  var items = {};"
+        "  for (var i = 0; i < storage.length; i++) { items[storage.key(i)] = storage.getItem(storage.key(i)); }"
+        "  return items;"
+        "}"
+        "return [dump(window.localStorage), dump(window.sessionStorage)];"
+    )
+    STORAGE_WRITE_SCRIPT = (
+        "var local = arguments[0], session = arguments[1];"
+        "for (var key in local) { window.localStorage.setItem(key, local[key]); }"
+        "for (var key in session) { window.sessionStorage.setItem(key, session[key]); }"
+    )
+    # Network.getAllCookies returns more fields than Network.setCookies accepts
+    CDP_COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+
+    def __init__(self):
+        self._captures = {}
+        self._not_restorable = set()
+        self.stats = {"built": 0, "restored": 0, "rebuilt": 0}
+        self.logger = logging.getLogger(__name__)
+
+    def enter(self, state, helpers):
+        """Bring the helpers' driver into the state; returns False if it could not be reached"""
+        key = (state.name, helpers.browser_name)
+        capture = self._captures.get(key)
+        if capture is not None:
+            if self.restore(helpers, capture) and (state.verify is None or state.verify(helpers)):
+                self.stats["restored"] += 1
+                self.logger.info(f"Restored navigation state '{state.name}' on {helpers.browser_name}")
+                return True
+            self.logger.warning(f"Restored navigation state '{state.name}' did not verify, navigating instead")
+            del self._captures[key]
+            self._not_restorable.add(key)
+            self.stats["rebuilt"] += 1
+            if not WebDriverPool.reset_driver_state(helpers.driver):
+                return False
+
+        if state.parent is not None and not self.enter(state.parent, helpers):
+            return False
+        if not state.build(helpers):
+            self.logger.warning(f"Could not reach navigation state '{state.name}'")
+            return False
+        self.stats["built"] += 1
+
+        if key not in self._not_restorable:
+            capture = self.capture(helpers.driver)
+            if capture is not None:
+                self._captures[key] = capture
+        return True
+
+    def capture(self, driver):
+        """Cookies, web storage, URL and consent-seeded domains of the driver's current page, or None"""
+        try:
+            url = driver.current_url
+            cookies, cookies_via_cdp = self._read_cookies(driver)
+            local_storage, session_storage = driver.execute_script(self.STORAGE_READ_SCRIPT)
+        except (WebDriverException, TypeError, ValueError) as e:
+            self.logger.debug(f"Could not capture navigation state: {str(e)}")
+            return None
+        return {
+            "url": url,
+            "cookies": cookies,
+            "cookies_via_cdp": cookies_via_cdp,
+            "local_storage": local_storage or {},
+            "session_storage": session_storage or {},
+            "consent_domains": sorted(getattr(driver, "_consent_seeded_domains", set()))
+        }
+
+    def restore(self, helpers, capture):
+        """Write a capture into a clean driver and load its URL; returns False if any step fails"""
+        driver = helpers.driver
+        parsed = urlparse(capture["url"])
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        storage = capture["local_storage"] or capture["session_storage"]
+        try:
+            cookies_set = not capture["cookies"] or (
+                capture["cookies_via_cdp"] and self._set_cookies_with_cdp(driver, capture["cookies"])
+            )
+            if storage or not cookies_set:
+                # Cookies and storage can only be written for the loaded origin
+                driver.get(f"{origin}/robots.txt")
+            if not cookies_set:
+                for cookie in capture["cookies"]:
+                    driver.add_cookie(cookie)
+            if storage:
+                driver.execute_script(self.STORAGE_WRITE_SCRIPT, capture["local_storage"],
+                                      capture["session_storage"])
+            driver.get(capture["url"])
+        except WebDriverException as e:
+            self.logger.debug(f"Could not restore navigation state: {str(e)}")
+            return False
+        driver._consent_seeded_domains = set(capture["consent_domains"])
+        helpers.wait_for_page_load()
+        return True
+
+    def _read_cookies(self, driver):
+        """(cookies, read through CDP): all cookies on Chrome/Edge, otherwise those of the loaded origin"""
+        if hasattr(driver, "execute_cdp_cmd"):
+            try:
+                cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+                return [
+                    {field: cookie[field] for field in self.CDP_COOKIE_FIELDS
+                     if field in cookie and not (field == "expires" and cookie.get("session"))}
+                    for cookie in cookies
+                ], True
+            except (WebDriverException, KeyError):
+                pass
+        return driver.get_cookies(), False
+
+    @staticmethod
+    def _set_cookies_with_cdp(driver, cookies):
+        """Set cookies without loading the site first; False if they need add_cookie on the origin"""
+        try:
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+            return True
+        except WebDriverException:
+            return False
+
+
+def _open_careers_search(helpers):
+    helpers.open_url(BlueOriginUrls.CAREERS_SEARCH_URL)
+    helpers.handle_cookie_consent()
+    helpers.wait_for_dom_settle()
+    return True
+
+
+def _has_search_input(helpers):
+    return bool(helpers.snapshot_find_elements(BlueOriginLocators.SEARCH_INPUT))
+
+
+def _search(keyword):
+    def build(helpers):
+        if not helpers.search_for_keyword(keyword):
+            return False
+        try:
+            WebDriverWait(helpers.driver, 20).until(EC.presence_of_element_located(BlueOriginLocators.RESULTS_COUNT))
+        except TimeoutException:
+            return False
+        return True
+    return build
+
+
+def _search_applied(keyword):
+    def verify(helpers):
+        # A reload keeps the search only if the site carries the query in the URL
+        try:
+            value = helpers.driver.find_element(*BlueOriginLocators.SEARCH_INPUT).get_attribute("value") or ""
+        except WebDriverException:
+            return False
+        return value.strip().lower() == keyword and helpers.get_search_results_count() > 0
+    return verify
+
+
+class BlueOriginStates:
+    """Navigation prefixes shared by the careers search tests"""
+
+    # Careers search page loaded with cookie consent accepted
+    CAREERS_SEARCH = NavigationState("careers_search", build=_open_careers_search, verify=_has_search_input)
+    # ... and "software" searched, with the results counter shown
+    SOFTWARE_SEARCH = NavigationState("careers_search:software", build=_search("software"),
+                                      verify=_search_applied("software"), parent=CAREERS_SEARCH)
@@ -0,0 +1,128 @@
+import html
+import json
+import re
+from urllib.parse import parse_qs, urljoin, urlparse
+
+
+class EmbeddedPageData:
+    """Job list and total from the JSON a server-rendered page embeds (Next.js __NEXT_DATA__)"""
+
+    # Returns [embedded page data as a JSON string or null, rendered page text]
+    READ_SCRIPT = """
+        var node = document.getElementById('__NEXT_DATA__');
+        var data = window.__NEXT_DATA__ ? JSON.stringify(window.__NEXT_DATA__) : (node ? node.textContent : null);
+        return [data, document.body ? document.body.innerText : ''];
+    """
+    SCRIPT_PATTERN = re.compile(r'<script[^>]*\bid="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+
+    TITLE_KEYS = ("title", "jobTitle", "name")
+    URL_KEYS = ("absolute_url", "url", "href", "link", "externalPath", "path")
+    LOCATION_KEYS = ("location", "locationName", "locations", "locationsText")
+    TOTAL_KEYS = ("total", "totalCount", "totalJobs", "jobCount", "count", "nbHits")
+    REQUISITION_KEYS = ("requisitionId", "requisition_id", "jobReqId", "reqId")
+    # Requisition IDs such as R53757, alone or inside a job URL (".../Structural-Engineer_R53757")
+    REQUISITION_PATTERN = re.compile(r"(?<![A-Za-z0-9])R\d{3,}(?![A-Za-z0-9])")
+
+    def __init__(self, data, page_url=""):
+        self.data = data
+        self.page_url = page_url
+        self._jobs = None
+        self._total = None
+
+    @classmethod
+    def from_json(cls, text, page_url=""):
+        """None if text is empty or not JSON"""
+        if not text:
+            return None
+        try:
+            return cls(json.loads(text), page_url)
+        except ValueError:
+            return None
+
+    @classmethod
+    def from_html(cls, page_source, page_url=""):
+        match = cls.SCRIPT_PATTERN.search(page_source or "")
+        return cls.from_json(html.unescape(match.group(1)), page_url) if match else None
+
+    def is_current(self, page_url, page_text=None):
+        """False if the data no longer describes the page, e.g. after a client-side search
+
+        The data is rendered once per document, so it must match the query parameters of the
+        current URL, and the rendered page text must show every job title and the reported total.
+        A filtered search can keep showing jobs from the unfiltered list, but not its total.
+        """
+        query = self.data.get("query") if isinstance(self.data, dict) else None
+        if isinstance(query, dict):
+            for key, values in parse_qs(urlparse(page_url).query).items():
+                rendered = query.get(key)
+                rendered = rendered if isinstance(rendered, list) else [rendered]
+                if [str(value) for value in rendered] != values:
+                    return False
+        if page_text is not None:
+            text = " ".join(page_text.split()).casefold()
+            if not all(" ".join(job["title"].split()).casefold() in text for job in self.jobs()):
+                return False
+            if self._total is not None and not self._shows_number(text, self._total):
+                return False
+        return True
+
+    @staticmethod
+    def _shows_number(text, number):
+        return any(re.search(rf"(?<![\d,.]){re.escape(rendered)}(?![\d,])", text)
+                   for rendered in {str(number), f"{number:,}"})
+
+    def jobs(self):
+        """Structured jobs ({title, href, location}) from the longest list of job objects"""
+        if self._jobs is None:
+            self._find_job_list()
+        return self._jobs
+
+    def total(self):
+        """Total reported next to the job list; None if there is no job list or it comes without a total"""
+        if self._jobs is None:
+            self._find_job_list()
+        return self._total
+
+    def _find_job_list(self):
+        # Only items with a requisition ID count as jobs, so navigation links, menus and facet
+        # values (which also have titles or names, and URLs) are never taken for the job list
+        best, parent = [], None
+        stack = [(self.data, None)]
+        while stack:
+            node, node_parent = stack.pop()
+            if isinstance(node, dict):
+                stack.extend((value, node) for value in node.values())
+            elif isinstance(node, list):
+                if len(node) > len(best) and all(self._is_job(item) for item in node):
+                    best, parent = node, node_parent
+                stack.extend((item, node_parent) for item in node)
+
+        self._jobs = [self._job(item) for item in best]
+        self._total = None
+        if best and isinstance(parent, dict):
+            # Without a reported total the list may be just the first page of results
+            totals = [parent.get(key) for key in self.TOTAL_KEYS]
+            self._total = next((total for total in totals if type(total) is int), None)
+
+    def _is_job(self, item):
+        if not isinstance(item, dict) or not any(isinstance(item.get(key), str) for key in self.TITLE_KEYS):
+            return False
+        candidates = [item.get(key) for key in self.REQUISITION_KEYS] + [self._url(item)]
+        return any(isinstance(value, str) and self.REQUISITION_PATTERN.search(value) for value in candidates)
+
+    def _url(self, item):
+        return next((item[key] for key in self.URL_KEYS if isinstance(item.get(key), str)), None)
+
+    def _job(self, item):
+        title = next(item[key] for key in self.TITLE_KEYS if isinstance(item.get(key), str))
+        url = self._url(item)
+        location = next((item[key] for key in self.LOCATION_KEYS if item.get(key)), "")
+        if isinstance(location, dict):
+            location = location.get("name", "")
+        elif isinstance(location, list):
+            location = ", ".join(entry.get("name", "") if isinstance(entry, dict) else str(entry) for entry in location)
+        return {
+            "title": title.strip(),
+            "href": urljoin(self.page_url, url) if url else None,
+            "location": str(location).strip()
+        }
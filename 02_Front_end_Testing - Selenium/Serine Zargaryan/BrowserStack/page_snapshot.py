@@ -0,0 +1,569 @@
+import re
+from html.parser import HTMLParser
+
+
+class UnsupportedSelector(ValueError):
+    """Raised for locators outside the CSS/XPath subset the snapshot understands; callers fall back to the driver"""
+
+
+class SnapshotNode:
+    """Element of a parsed page snapshot; children are SnapshotNodes and text strings"""
+
+    __slots__ = ("tag", "attrs", "children", "parent")
+
+    # Content of these elements is not part of the rendered text
+    NON_TEXT_TAGS = {"script", "style", "template", "noscript", "head"}
+    BLOCK_TAGS = {"address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "fieldset", "figure",
+                  "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol",
+                  "p", "pre", "section", "table", "tr", "ul"}
+    VISIBILITY_PATTERN = re.compile(r"(?:^|;)visibility:(\w+)")
+
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.children = []
+        self.parent = parent
+
+    def __repr__(self):
+        return f"<SnapshotNode {self.tag} {self.attrs}>"
+
+    def get_attribute(self, name):
+        return self.attrs.get(name)
+
+    @property
+    def classes(self):
+        return self.attrs.get("class", "").split()
+
+    @property
+    def elements(self):
+        return [child for child in self.children if isinstance(child, SnapshotNode)]
+
+    @property
+    def own_text(self):
+        """Direct text children, as XPath text() sees them"""
+        return [child for child in self.children if isinstance(child, str)]
+
+    @property
+    def text_content(self):
+        parts = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                parts.append(node)
+            elif node is self or node.tag not in self.NON_TEXT_TAGS:
+                stack.extend(reversed(node.children))
+        return "".join(parts)
+
+    @property
+    def text(self):
+        """Rendered text with whitespace collapsed and block elements on separate lines, like WebElement.text"""
+        parts = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                parts.append(node)
+            elif node is self or node.tag not in self.NON_TEXT_TAGS:
+                if node.tag in self.BLOCK_TAGS:
+                    parts.append("\n")
+                    stack.append("\n")
+                stack.extend(reversed(node.children))
+        lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+    def iter(self):
+        """Descendant elements in document order"""
+        stack = list(reversed(self.elements))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.elements))
+
+    def is_displayed(self):
+        """Static approximation: hidden by attribute or inline style on the element or an ancestor"""
+        node = self
+        while node is not None and node.tag != "#document":
+            style = node.attrs.get("style", "").replace(" ", "").lower()
+            if ("hidden" in node.attrs or "display:none" in style or "visibility:hidden" in style
+                    or node.tag in self.NON_TEXT_TAGS
+                    or (node.tag == "input" and node.attrs.get("type", "").lower() == "hidden")):
+                return False
+            node = node.parent
+        return True
+
+    def is_hidden(self):
+        """True only if no stylesheet can make the element visible, so the browser need not be asked
+
+        That is the hidden attribute or inline display:none on the element or an ancestor, inline
+        visibility:hidden not overridden by a nearer inline visibility, or an input of type hidden.
+        """
+        if self.tag == "input" and self.attrs.get("type", "").lower() == "hidden":
+            return True
+        visibility = None
+        node = self
+        while node is not None and node.tag != "#document":
+            style = node.attrs.get("style", "").replace(" ", "").lower()
+            if "hidden" in node.attrs or "display:none" in style:
+                return True
+            match = self.VISIBILITY_PATTERN.search(style)
+            if visibility is None and match:
+                visibility = match.group(1)
+            node = node.parent
+        return visibility in ("hidden", "collapse")
+
+    def is_enabled(self):
+        return "disabled" not in self.attrs
+
+
+class _TreeBuilder(HTMLParser):
+    VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source",
+                 "track", "wbr"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = SnapshotNode("#document")
+        self.current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = SnapshotNode(tag, {name: value if value is not None else "" for name, value in attrs}, self.current)
+        self.current.children.append(node)
+        if tag not in self.VOID_TAGS:
+            self.current = node
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in self.VOID_TAGS:
+            self.current = self.current.parent
+
+    def handle_endtag(self, tag):
+        # Close up to the nearest open element with this tag; stray end tags are ignored
+        node = self.current
+        while node is not self.root and node.tag != tag:
+            node = node.parent
+        if node is not self.root:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        self.current.children.append(data)
+
+
+class PageSnapshot:
+    """Parsed copy of the page DOM that answers locator, text and regex queries without driver round trips"""
+
+    def __init__(self, html, url=None, token=None):
+        self.html = html
+        self.url = url
+        # Identifies the page state the snapshot was taken from (see BlueOriginHelpers.page_snapshot)
+        self.token = token
+        builder = _TreeBuilder()
+        builder.feed(html)
+        builder.close()
+        self.root = builder.root
+        self._css_cache = {}
+
+    @property
+    def title(self):
+        node = next((node for node in self.root.iter() if node.tag == "title"), None)
+        return node.text if node else ""
+
+    @property
+    def text(self):
+        body = next((node for node in self.root.iter() if node.tag == "body"), self.root)
+        return body.text
+
+    def search(self, pattern, flags=0):
+        return re.search(pattern, self.html, flags)
+
+    def findall(self, pattern, flags=0):
+        return re.findall(pattern, self.html, flags)
+
+    def find_elements(self, by, value, context=None):
+        """Same strategies as WebDriver.find_elements (By values are the W3C strategy names)
+
+        With a context node, searches below it like WebElement.find_elements.
+        """
+        nodes = (context or self.root).iter()
+        if by == "id":
+            return [node for node in nodes if node.attrs.get("id") == value]
+        if by == "class name":
+            return [node for node in nodes if value in node.classes]
+        if by == "tag name":
+            return [node for node in nodes if node.tag == value.lower()]
+        if by == "name":
+            return [node for node in nodes if node.attrs.get("name") == value]
+        if by == "link text":
+            return [node for node in nodes if node.tag == "a" and node.text == value]
+        if by == "partial link text":
+            return [node for node in nodes if node.tag == "a" and value in node.text]
+        if by == "css selector":
+            return self.select(value, context)
+        if by == "xpath":
+            return self.xpath(value, context)
+        raise UnsupportedSelector(f"Unsupported locator strategy: {by}")
+
+    def find_element(self, by, value, context=None):
+        """First match or None"""
+        matches = self.find_elements(by, value, context)
+        return matches[0] if matches else None
+
+    def select(self, selector, context=None):
+        if selector not in self._css_cache:
+            self._css_cache[selector] = _CssSelector(selector)
+        compiled = self._css_cache[selector]
+        return [node for node in (context or self.root).iter() if compiled.matches(node)]
+
+    def xpath(self, expression, context=None):
+        return _XPath(expression).evaluate(self.root, context)
+
+
+class _CssSelector:
+    """Tag, #id, .class and [attr op value (i)] compounds joined by descendant, >, + and ~ combinators"""
+
+    TOKEN_PATTERN = re.compile(r"""
+        \s*(?P<combinator>[>+~])\s*
+        | (?P<space>\s+)
+        | \#(?P<id>[\w-]+)
+        | \.(?P<class>[\w-]+)
+        | \[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[~|^$*]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\s\]]+))
+          \s*(?P<flag>[iIsS])?\s*)?\]
+        | (?P<tag>\*|[\w-]+)
+    """, re.VERBOSE)
+
+    def __init__(self, selector):
+        self.groups = [self._parse(part.strip()) for part in self._split_groups(selector)]
+
+    @staticmethod
+    def _split_groups(selector):
+        parts, depth, quote, start = [], 0, None, 0
+        for index, char in enumerate(selector):
+            if quote:
+                quote = None if char == quote else quote
+            elif char in "'\"":
+                quote = char
+            elif char in "[(":
+                depth += 1
+            elif char in "])":
+                depth -= 1
+            elif char == "," and depth == 0:
+                parts.append(selector[start:index])
+                start = index + 1
+        parts.append(selector[start:])
+        return parts
+
+    def _parse(self, selector):
+        """List of (combinator, compound) from left to right; the first combinator is None"""
+        steps, compound, combinator, position = [], [], None, 0
+        while position < len(selector):
+            match = self.TOKEN_PATTERN.match(selector, position)
+            if not match or match.end() == position:
+                raise UnsupportedSelector(f"Unsupported CSS selector: {selector}")
+            position = match.end()
+            if match.group("combinator") or match.group("space"):
+                if compound:
+                    steps.append((combinator, compound))
+                    compound = []
+                combinator = match.group("combinator") or " "
+            elif match.group("id"):
+                compound.append(("id", match.group("id")))
+            elif match.group("class"):
+                compound.append(("class", match.group("class")))
+            elif match.group("attr"):
+                value = next((group for group in match.group("dq", "sq", "bare") if group is not None), None)
+                compound.append(("attr", (match.group("attr").lower(), match.group("op"), value,
+                                          (match.group("flag") or "").lower() == "i")))
+            else:
+                compound.append(("tag", match.group("tag").lower()))
+        if not compound:
+            raise UnsupportedSelector(f"Unsupported CSS selector: {selector}")
+        steps.append((combinator, compound))
+        return steps
+
+    def matches(self, node):
+        return any(self._matches_steps(node, steps, len(steps) - 1) for steps in self.groups)
+
+    def _matches_steps(self, node, steps, index):
+        combinator, compound = steps[index]
+        if not self._matches_compound(node, compound):
+            return False
+        if index == 0:
+            return True
+        if combinator == ">":
+            return node.parent is not None and self._matches_steps(node.parent, steps, index - 1)
+        if combinator in "+~":
+            siblings = node.parent.elements[:node.parent.elements.index(node)] if node.parent else []
+            candidates = siblings[-1:] if combinator == "+" else siblings
+            return any(self._matches_steps(sibling, steps, index - 1) for sibling in candidates)
+        ancestor = node.parent
+        while ancestor is not None:
+            if self._matches_steps(ancestor, steps, index - 1):
+                return True
+            ancestor = ancestor.parent
+        return False
+
+    @staticmethod
+    def _matches_compound(node, compound):
+        if node.tag == "#document":
+            return False
+        for kind, value in compound:
+            if kind == "tag" and value not in ("*", node.tag):
+                return False
+            if kind == "id" and node.attrs.get("id") != value:
+                return False
+            if kind == "class" and value not in node.classes:
+                return False
+            if kind == "attr":
+                name, op, expected, ignore_case = value
+                actual = node.attrs.get(name)
+                if actual is None:
+                    return False
+                if op is None:
+                    continue
+                if ignore_case:
+                    actual, expected = actual.lower(), expected.lower()
+                if not {
+                    "=": lambda: actual == expected,
+                    "~=": lambda: expected in actual.split(),
+                    "|=": lambda: actual == expected or actual.startswith(expected + "-"),
+                    "^=": lambda: bool(expected) and actual.startswith(expected),
+                    "$=": lambda: bool(expected) and actual.endswith(expected),
+                    "*=": lambda: bool(expected) and expected in actual
+                }[op]():
+                    return False
+        return True
+
+
+class _XPath:
+    """Location paths with name/* tests, '.', '..', and predicates using @attr, text(), '.', nested paths,
+    =, !=, and, or, not(), contains(), starts-with(), normalize-space() and positions"""
+
+    TOKEN_PATTERN = re.compile(r"""\s*(?:(//|/|\.\.|\.|\[|\]|\(|\)|,|@|!=|=|\*)|"([^"]*)"|'([^']*)'|(\d+)|([\w:-]+))""")
+    FUNCTIONS = {"contains", "starts-with", "normalize-space", "not", "text", "string"}
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.tokens = []
+        position = 0
+        while position < len(expression.rstrip()):
+            match = self.TOKEN_PATTERN.match(expression, position)
+            if not match:
+                raise UnsupportedSelector(f"Unsupported XPath: {expression}")
+            symbol, double_quoted, single_quoted, number, name = match.groups()
+            if symbol is not None:
+                self.tokens.append(("symbol", symbol))
+            elif double_quoted is not None or single_quoted is not None:
+                self.tokens.append(("string", double_quoted if double_quoted is not None else single_quoted))
+            elif number is not None:
+                self.tokens.append(("number", int(number)))
+            else:
+                self.tokens.append(("name", name))
+            position = match.end()
+        self.index = 0
+        self.path = self._parse_path()
+        if self.index != len(self.tokens):
+            raise UnsupportedSelector(f"Unsupported XPath: {expression}")
+
+    # Parsing
+
+    def _peek(self, offset=0):
+        index = self.index + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def _take(self, expected=None):
+        token = self._peek()
+        if token[0] is None or (expected is not None and token[1] != expected):
+            raise UnsupportedSelector(f"Unsupported XPath: {self.expression}")
+        self.index += 1
+        return token
+
+    def _parse_path(self):
+        """[(axis, test, predicates)] with axis child, descendant, self or parent; absolute paths start at the root"""
+        steps = []
+        absolute = self._peek()[1] in ("/", "//")
+        axis = "child"
+        while True:
+            kind, value = self._peek()
+            if value == "//":
+                self._take()
+                axis = "descendant"
+            elif value == "/":
+                self._take()
+                axis = "child"
+            if self._peek()[1] == "..":
+                self._take()
+                steps.append(("parent", "*", []))
+            elif self._peek()[1] == ".":
+                self._take()
+                steps.append(("self", "*", []))
+            else:
+                kind, value = self._take()
+                if kind == "name" and value in self.FUNCTIONS:
+                    raise UnsupportedSelector(f"Unsupported XPath step: {self.expression}")
+                if value != "*" and kind != "name":
+                    raise UnsupportedSelector(f"Unsupported XPath: {self.expression}")
+                predicates = []
+                while self._peek()[1] == "[":
+                    self._take()
+                    predicates.append(self._parse_or())
+                    self._take("]")
+                steps.append((axis, value.lower(), predicates))
+            if self._peek()[1] not in ("/", "//"):
+                return absolute, steps
+
+    def _parse_or(self):
+        left = self._parse_and()
+        while self._peek() == ("name", "or"):
+            self._take()
+            left = ("or", left, self._parse_and())
+        return left
+
+    def _parse_and(self):
+        left = self._parse_comparison()
+        while self._peek() == ("name", "and"):
+            self._take()
+            left = ("and", left, self._parse_comparison())
+        return left
+
+    def _parse_comparison(self):
+        left = self._parse_operand()
+        if self._peek()[1] in ("=", "!="):
+            operator = self._take()[1]
+            return (operator, left, self._parse_operand())
+        return left
+
+    def _parse_operand(self):
+        kind, value = self._peek()
+        if kind == "string":
+            self._take()
+            return ("literal", value)
+        if kind == "number":
+            self._take()
+            return ("position", value)
+        if value == "(":
+            self._take()
+            expression = self._parse_or()
+            self._take(")")
+            return expression
+        if value == "@":
+            self._take()
+            return ("attribute", self._take()[1])
+        if kind == "name" and value in self.FUNCTIONS and self._peek(1)[1] == "(":
+            self._take()
+            self._take("(")
+            arguments = []
+            while self._peek()[1] != ")":
+                arguments.append(self._parse_or())
+                if self._peek()[1] == ",":
+                    self._take()
+            self._take(")")
+            return ("call", value, arguments)
+        if value == "." and self._peek(1)[1] not in ("/", "//"):
+            self._take()
+            return ("context",)
+        return ("path", self._parse_path())
+
+    # Evaluation
+
+    def evaluate(self, root, context=None):
+        return self._select(root, context or root, self.path)
+
+    def _select(self, root, context, path):
+        absolute, steps = path
+        nodes = [root if absolute else context]
+        for axis, test, predicates in steps:
+            selected, seen = [], set()
+            for node in nodes:
+                for candidate in self._filter(root, self._axis(node, axis, test), axis, predicates):
+                    if id(candidate) not in seen:
+                        seen.add(id(candidate))
+                        selected.append(candidate)
+            nodes = selected
+        return nodes
+
+    def _filter(self, root, candidates, axis, predicates):
+        """Candidates of one context node that pass the predicates, in document order
+
+        '//li' is short for descendant-or-self::node()/child::li, so positions count among the
+        children of each parent rather than across the whole node-set.
+        """
+        if not predicates:
+            return candidates
+        groups = {}
+        for candidate in candidates:
+            key = id(candidate.parent) if axis == "descendant" else None
+            groups.setdefault(key, []).append(candidate)
+        kept = set()
+        for group in groups.values():
+            for predicate in predicates:
+                group = [node for position, node in enumerate(group, 1)
+                         if self._truth(self._value(root, node, predicate, position))]
+            kept.update(id(node) for node in group)
+        return [candidate for candidate in candidates if id(candidate) in kept]
+
+    @staticmethod
+    def _axis(node, axis, test):
+        if axis == "self":
+            candidates = [node]
+        elif axis == "parent":
+            candidates = [node.parent] if node.parent is not None and node.parent.tag != "#document" else []
+        elif axis == "child":
+            candidates = node.elements
+        else:
+            candidates = node.iter()
+        return [candidate for candidate in candidates if test in ("*", candidate.tag)]
+
+    def _value(self, root, node, expression, position):
+        """Strings, lists of strings (node-sets), booleans or ints (positions)"""
+        kind = expression[0]
+        if kind == "literal":
+            return expression[1]
+        if kind == "position":
+            return expression[1] == position
+        if kind == "attribute":
+            value = node.attrs.get(expression[1])
+            return [] if value is None else [value]
+        if kind == "context":
+            return [node.text_content]
+        if kind == "path":
+            return [match.text_content for match in self._select(root, node, expression[1])]
+        if kind == "or":
+            return (self._truth(self._value(root, node, expression[1], position))
+                    or self._truth(self._value(root, node, expression[2], position)))
+        if kind == "and":
+            return (self._truth(self._value(root, node, expression[1], position))
+                    and self._truth(self._value(root, node, expression[2], position)))
+        if kind in ("=", "!="):
+            left = self._value(root, node, expression[1], position)
+            right = self._value(root, node, expression[2], position)
+            left = left if isinstance(left, list) else [self._string(left)]
+            right = right if isinstance(right, list) else [self._string(right)]
+            if kind == "=":
+                return any(a == b for a in left for b in right)
+            return any(a != b for a in left for b in right)
+        # Function calls
+        name, arguments = expression[1], expression[2]
+        values = [self._value(root, node, argument, position) for argument in arguments]
+        if name == "text":
+            return node.own_text
+        if name == "not":
+            return not self._truth(values[0])
+        if name == "string":
+            return self._string(values[0]) if values else node.text_content
+        if name == "normalize-space":
+            return " ".join((self._string(values[0]) if values else node.text_content).split())
+        if name == "contains":
+            return self._string(values[1]) in self._string(values[0])
+        if name == "starts-with":
+            return self._string(values[0]).startswith(self._string(values[1]))
+        raise UnsupportedSelector(f"Unsupported XPath function: {name}")
+
+    @staticmethod
+    def _string(value):
+        """XPath string(): a node-set converts to the string value of its first node"""
+        if isinstance(value, list):
+            return value[0] if value else ""
+        return value if isinstance(value, str) else str(value).lower()
+
+    @staticmethod
+    def _truth(value):
+        return bool(value)
@@ -0,0 +1,183 @@
+import json
+import logging
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from duration_store import partition_by_duration
+
+
+class ParallelRunner:
+    """Runs collected test items in worker pytest processes and replays their reports"""
+
+    POLL_INTERVAL = 0.2
+    # Seconds a terminated worker gets to exit before it is killed
+    TERMINATE_TIMEOUT = 10
+
+    def __init__(self, config, workers, reports_dir, durations=None):
+        self.config = config
+        self.workers = workers
+        self.durations = durations
+        self.workers_dir = Path(reports_dir) / "workers"
+        self.logger = logging.getLogger(__name__)
+
+    def shard_items(self, items, workers=None):
+        """Split items into one list per worker, balanced by recorded durations when available"""
+        workers = workers or self.workers
+        if self.durations is not None:
+            return partition_by_duration(items, workers, self.durations)
+
+        shards = [[] for _ in range(workers)]
+        for index, item in enumerate(items):
+            shards[index % workers].append(item)
+        return shards
+
+    def run(self, items):
+        """Execute items across worker processes and feed results into this session"""
+        self.workers_dir.mkdir(parents=True, exist_ok=True)
+        shards = [shard for shard in self.shard_items(items) if shard]
+        if self.durations is not None:
+            for index, shard in enumerate(shards):
+                expected = sum(self.durations.estimate(item.nodeid) for item in shard)
+                self.logger.info(f"Worker gw{index}: {len(shard)} tests, expected {expected:.1f}s")
+
+        workers = []
+        try:
+            for index, shard in enumerate(shards):
+                workers.append(self._start_worker(f"gw{index}", shard))
+            self.logger.info(f"Started {len(workers)} worker processes for {len(items)} tests")
+
+            while workers:
+                for worker in list(workers):
+                    finished = worker.process.poll() is not None
+                    # Drain after the exit check so no lines written before exit are missed
+                    self._replay_new_reports(worker)
+                    if finished:
+                        worker.close()
+                        self._report_lost_items(worker)
+                        workers.remove(worker)
+                time.sleep(self.POLL_INTERVAL)
+        finally:
+            # Interrupted (e.g. Ctrl+C) or failed: no worker may outlive the main process
+            for worker in workers:
+                self._stop_worker(worker)
+
+    def _stop_worker(self, worker):
+        """Terminate a worker process, kill it if it does not exit, and wait for it"""
+        try:
+            if worker.process.poll() is None:
+                worker.process.terminate()
+                try:
+                    worker.process.wait(timeout=self.TERMINATE_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    self.logger.warning(f"Worker {worker.worker_id} did not exit, killing it")
+                    worker.process.kill()
+                    worker.process.wait()
+        finally:
+            worker.close()
+
+    def _start_worker(self, worker_id, shard):
+        """Launch a pytest process that only runs the given shard"""
+        shard_file = self.workers_dir / f"{worker_id}.nodeids"
+        results_file = self.workers_dir / f"{worker_id}.results.jsonl"
+        output_file = self.workers_dir / f"{worker_id}.out"
+
+        shard_file.write_text("\n".join(item.nodeid for item in shard), encoding="utf-8")
+        results_file.write_text("", encoding="utf-8")
+
+        # Later options win, so the original arguments can be passed through unchanged
+        command = [
+            sys.executable, "-m", "pytest",
+            *self.config.invocation_params.args,
+            "--parallel=1",
+            f"--worker-id={worker_id}",
+            f"--shard-file={shard_file}",
+            f"--results-file={results_file}"
+        ]
+        output = open(output_file, "w", encoding="utf-8")
+        process = subprocess.Popen(
+            command,
+            cwd=str(self.config.invocation_params.dir),
+            stdout=output,
+            stderr=subprocess.STDOUT
+        )
+        return _Worker(worker_id, process, shard, results_file, output)
+
+    def _replay_new_reports(self, worker):
+        """Read reports appended by a worker and pass them to this session's hooks"""
+        for line in worker.read_new_lines():
+            report = self.config.hook.pytest_report_from_serializable(config=self.config, data=json.loads(line))
+            self._log_report(report)
+            worker.reported.setdefault(report.nodeid, set()).add(report.when)
+
+    def _report_lost_items(self, worker):
+        """Fail items a worker never reported on, e.g. because it crashed"""
+        for item in worker.shard:
+            phases = worker.reported.get(item.nodeid, set())
+            if "teardown" in phases:
+                continue
+            longrepr = (f"Worker {worker.worker_id} exited with code {worker.process.returncode} "
+                        f"before finishing this test, see {worker.output.name}")
+            # A crash after setup is reported as a failed call, otherwise as a failed setup
+            failed_phase = "call" if "setup" in phases else "setup"
+            for when, outcome in ((failed_phase, "failed"), ("teardown", "passed")):
+                report = pytest.TestReport(
+                    item.nodeid, item.location, {},
+                    outcome, longrepr if outcome == "failed" else None, when,
+                    lost=True
+                )
+                self._log_report(report)
+
+    def _log_report(self, report):
+        """Send a report through the same hooks a serial run would call"""
+        hook = self.config.hook
+        if report.when == "setup":
+            hook.pytest_runtest_logstart(nodeid=report.nodeid, location=report.location)
+        hook.pytest_runtest_logreport(report=report)
+        if report.when == "teardown":
+            hook.pytest_runtest_logfinish(nodeid=report.nodeid, location=report.location)
+
+
+class _Worker:
+    """Bookkeeping for one worker process"""
+
+    def __init__(self, worker_id, process, shard, results_file, output):
+        self.worker_id = worker_id
+        self.process = process
+        self.shard = shard
+        self.results_file = results_file
+        self.output = output
+        self.reported = {}
+        self._offset = 0
+        self._partial = b""
+
+    def read_new_lines(self):
+        """Return complete lines appended to the results file since the last read"""
+        # Read bytes so a line the worker is still writing is never decoded half-way
+        with open(self.results_file, "rb") as results:
+            results.seek(self._offset)
+            chunk = results.read()
+            self._offset = results.tell()
+
+        lines = (self._partial + chunk).split(b"\n")
+        self._partial = lines.pop()
+        return [line.decode("utf-8") for line in lines if line.strip()]
+
+    def close(self):
+        self.output.close()
+
+
+class WorkerReporter:
+    """Plugin registered in worker processes that streams reports to the main process"""
+
+    def __init__(self, config, results_file):
+        self.config = config
+        self.results_file = results_file
+
+    def pytest_runtest_logreport(self, report):
+        data = self.config.hook.pytest_report_to_serializable(config=self.config, report=report)
+        with open(self.results_file, "a", encoding="utf-8") as results:
+            results.write(json.dumps(data) + "\n")
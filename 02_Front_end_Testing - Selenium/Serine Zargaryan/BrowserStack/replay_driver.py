@@ -0,0 +1,213 @@
+import contextlib
+import html
+from urllib.parse import urljoin
+
+import selenium.webdriver.support.wait as selenium_wait
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+
+from page_data import EmbeddedPageData
+from page_snapshot import PageSnapshot, UnsupportedSelector
+from snapshot_corpus import SnapshotCorpus
+from test_helpers import BlueOriginHelpers
+
+
+class ReplayElement:
+    """Read-only WebElement over a node of a recorded snapshot"""
+
+    def __init__(self, driver, node):
+        self._driver = driver
+        self._node = node
+
+    def __eq__(self, other):
+        return isinstance(other, ReplayElement) and other._node is self._node
+
+    def __hash__(self):
+        return id(self._node)
+
+    @property
+    def tag_name(self):
+        return self._node.tag
+
+    @property
+    def text(self):
+        return self._node.text if self._node.is_displayed() else ""
+
+    @property
+    def rect(self):
+        return {"x": 0, "y": 0, "width": 0, "height": 0}
+
+    def get_attribute(self, name):
+        value = self._node.get_attribute(name)
+        # Like the browser, link targets come back resolved against the page URL
+        if value is not None and name in ("href", "src"):
+            return urljoin(self._driver.current_url or "", value)
+        return value
+
+    def get_dom_attribute(self, name):
+        return self._node.get_attribute(name)
+
+    def is_displayed(self):
+        return self._node.is_displayed()
+
+    def is_enabled(self):
+        return self._node.is_enabled()
+
+    def is_selected(self):
+        return "selected" in self._node.attrs or "checked" in self._node.attrs
+
+    def find_element(self, by, value):
+        return self._driver._find_element(by, value, self._node)
+
+    def find_elements(self, by, value):
+        return self._driver._find_elements(by, value, self._node)
+
+    def click(self):
+        raise WebDriverException("Recorded snapshots are read-only")
+
+    send_keys = clear = submit = click
+
+
+class ReplayDriver:
+    """WebDriver stand-in that serves recorded page snapshots to BlueOriginHelpers without a browser
+
+    Supports the read-only subset the helpers use: navigation between recorded URLs, locators,
+    page source and title, and the helpers' own scripts. Other scripts raise WebDriverException,
+    which sends the helpers down their no-JavaScript fallbacks.
+    """
+
+    capabilities = {"browserName": "replay"}
+
+    def __init__(self, corpus=None, html_text=None, url=None):
+        self.corpus = corpus or SnapshotCorpus()
+        self.current_url = url
+        self.snapshot = None
+        if html_text is not None:
+            self.load(html_text, url)
+
+    @classmethod
+    def from_html(cls, html_text, url="https://www.blueorigin.com/"):
+        return cls(html_text=html_text, url=url)
+
+    def load(self, html_text, url=None):
+        self.snapshot = PageSnapshot(html_text, url=url, token=SnapshotCorpus.digest(html_text))
+        self.current_url = url
+
+    def get(self, url):
+        """Load the latest recording of url"""
+        entry = self.corpus.latest(url=url)
+        if entry is None:
+            raise WebDriverException(f"No recorded snapshot for {url}")
+        self.load(self.corpus.get(entry["sha"]), url)
+
+    @property
+    def page_source(self):
+        return self.snapshot.html
+
+    @property
+    def title(self):
+        return self.snapshot.title
+
+    def find_element(self, by, value):
+        return self._find_element(by, value)
+
+    def find_elements(self, by, value):
+        return self._find_elements(by, value)
+
+    def _find_element(self, by, value, context=None):
+        elements = self._find_elements(by, value, context)
+        if not elements:
+            raise NoSuchElementException(f"No recorded element matches {by}={value}")
+        return elements[0]
+
+    def _find_elements(self, by, value, context=None):
+        try:
+            return [ReplayElement(self, node) for node in self.snapshot.find_elements(by, value, context)]
+        except UnsupportedSelector as e:
+            raise WebDriverException(str(e))
+
+    def execute_script(self, script, *args):
+        if script.strip() == "return document.readyState":
+            return "complete"
+        if script == BlueOriginHelpers.SETTLE_MONITOR_SCRIPT:
+            # A recording never changes: complete, nothing in flight, idle for a long time
+            return ["complete", 0, 10 ** 9]
+        if script == BlueOriginHelpers.SNAPSHOT_SCRIPT:
+            token = self.snapshot.token
+            return [token, None if args and args[0] == token else self.snapshot.html]
+        if script == EmbeddedPageData.READ_SCRIPT:
+            match = EmbeddedPageData.SCRIPT_PATTERN.search(self.snapshot.html)
+            return [html.unescape(match.group(1)) if match else None, self.snapshot.text]
+        if script == BlueOriginHelpers.MATCH_SELECTORS_SCRIPT:
+            return self._match_selectors(args[0])
+        if script == BlueOriginHelpers.EXTRACT_LISTINGS_SCRIPT:
+            return self._extract_listings(args[0])
+        raise WebDriverException("Script is not available in snapshot replay")
+
+    def _match_selectors(self, selectors):
+        matches = []
+        for index, (by, value) in enumerate(selectors):
+            try:
+                found = self._find_elements(by, value)
+            except WebDriverException:
+                continue
+            visible = next((element for element in found if element.is_displayed()), None)
+            if visible is not None:
+                matches.append([visible, index])
+        return matches
+
+    def _extract_listings(self, selectors):
+        for index, (by, value) in enumerate(selectors):
+            try:
+                found = self._find_elements(by, value)
+            except WebDriverException:
+                continue
+            if found:
+                return [index, [[element, element._node.text, self._link_of(element), element.is_displayed(),
+                                 element.rect] for element in found]]
+        return None
+
+    def _link_of(self, element):
+        node = element._node
+        while node is not None and node.tag != "a":
+            node = node.parent
+        if node is None:
+            node = next((child for child in element._node.iter() if child.tag == "a"), None)
+        return ReplayElement(self, node).get_attribute("href") if node is not None else None
+
+    def get_cookies(self):
+        return []
+
+    def delete_all_cookies(self):
+        pass
+
+    def quit(self):
+        pass
+
+    close = quit
+
+
+class _InstantClock:
+    """Stands in for the time module inside WebDriverWait: sleeping advances a virtual clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@contextlib.contextmanager
+def instant_waits():
+    """Make WebDriverWait time out immediately instead of polling a recording that cannot change"""
+    original = selenium_wait.time
+    selenium_wait.time = _InstantClock()
+    try:
+        yield
+    finally:
+        selenium_wait.time = original
@@ -0,0 +1,85 @@
+import bisect
+import re
+
+from job_snapshot import WORKDAY
+
+
+class SearchOracle:
+    """Inverted index over job records that predicts how many postings a keyword search should return
+
+    The Workday stand-in matches searches by its own rules (word prefixes, descriptions included), so a
+    sweep against it shows where this model of the site's search falls short.
+    """
+
+    FIELDS = ("title", "location")
+    TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+    def __init__(self, records, fields=FIELDS, prefix=False):
+        self.fields = fields
+        # With prefix matching "eng" also matches "engineer", as type-ahead search boxes do
+        self.prefix = prefix
+        self.documents = []
+        self.index = {}
+        for record in records:
+            document_id = len(self.documents)
+            self.documents.append(record)
+            text = " ".join(str(record.get(field) or "") for field in fields)
+            for token in set(self.tokenize(text)):
+                self.index.setdefault(token, set()).add(document_id)
+        self.vocabulary = sorted(self.index)
+
+    @classmethod
+    def from_snapshot(cls, snapshot, source=WORKDAY, **kwargs):
+        return cls(snapshot.jobs(source), **kwargs)
+
+    @classmethod
+    def tokenize(cls, text):
+        """Lowercase alphanumeric runs: "Engineer II - GN&C" -> ["engineer", "ii", "gn", "c"]"""
+        return cls.TOKEN_PATTERN.findall(text.lower())
+
+    def matches(self, keyword):
+        """Indexes of the documents containing every term of the keyword (AND semantics)"""
+        terms = keyword.split()
+        if not terms:
+            return set(range(len(self.documents)))
+
+        result = None
+        for term in terms:
+            tokens = self.tokenize(term)
+            if not tokens:
+                # A term made only of symbols ("@@") matches nothing, as on the careers site
+                return set()
+            for token in tokens:
+                postings = self._postings(token)
+                result = postings if result is None else result & postings
+                if not result:
+                    return set()
+        return result
+
+    def predict_count(self, keyword):
+        return len(self.matches(keyword))
+
+    def predict_counts(self, keywords):
+        return {keyword: self.predict_count(keyword) for keyword in keywords}
+
+    def matching_titles(self, keyword):
+        return [self.documents[document_id].get("title") for document_id in sorted(self.matches(keyword))]
+
+    def outliers(self, observed_counts, tolerance=0):
+        """Keywords whose observed count differs from the prediction by more than tolerance"""
+        outliers = []
+        for keyword, observed in observed_counts.items():
+            expected = self.predict_count(keyword)
+            if observed is None or abs(observed - expected) > tolerance:
+                outliers.append({"keyword": keyword, "expected": expected, "observed": observed})
+        return outliers
+
+    def _postings(self, token):
+        if not self.prefix:
+            return self.index.get(token, set())
+        postings = set()
+        position = bisect.bisect_left(self.vocabulary, token)
+        while position < len(self.vocabulary) and self.vocabulary[position].startswith(token):
+            postings |= self.index[self.vocabulary[position]]
+            position += 1
+        return postings
@@ -0,0 +1,111 @@
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+
+class SelectorMemo:
+    """Remembers which fallback selector last matched, per locator list and browser, across runs"""
+
+    DEFAULT_PATH = Path("test_reports") / "selector_memo.json"
+    # Entries that have not matched for two weeks are dropped, so a selector whose
+    # CSS-module hash went stale does not stay at the front of the list
+    MAX_AGE_SECONDS = 14 * 24 * 3600
+
+    _shared = {}
+
+    def __init__(self, path=None, clock=time.time):
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.clock = clock
+        self.entries = self._load()
+        self.dirty = False
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def shared(cls, path=None):
+        """Return one memo per file so all helpers in a process share it"""
+        key = str(Path(path) if path else cls.DEFAULT_PATH)
+        if key not in cls._shared:
+            cls._shared[key] = cls(key)
+        return cls._shared[key]
+
+    @classmethod
+    def flush_shared(cls):
+        """Save every shared memo with unsaved matches; called once at session end"""
+        for memo in cls._shared.values():
+            memo.flush()
+
+    @staticmethod
+    def selector_key(selector):
+        by, value = selector
+        return f"{by}={value}"
+
+    def order(self, list_name, browser, selectors):
+        """Return selectors with the most recently successful ones first, otherwise in original order"""
+        bucket = self.entries.get(self._bucket(list_name, browser), {})
+        now = self.clock()
+        last_success = {key: entry["last_success"] for key, entry in bucket.items()
+                        if now - entry["last_success"] <= self.MAX_AGE_SECONDS}
+        ranked = sorted(
+            enumerate(selectors),
+            key=lambda pair: (-last_success.get(self.selector_key(pair[1]), 0.0), pair[0])
+        )
+        return [selector for _, selector in ranked]
+
+    def record(self, list_name, browser, selector):
+        """Remember that a selector matched; written to disk by flush()"""
+        bucket = self.entries.setdefault(self._bucket(list_name, browser), {})
+        key = self.selector_key(selector)
+        bucket[key] = {
+            "hits": bucket.get(key, {}).get("hits", 0) + 1,
+            "last_success": self.clock()
+        }
+        self.dirty = True
+
+    def flush(self):
+        """Save the memo if anything matched since the last save"""
+        if self.dirty:
+            self.save()
+
+    def save(self):
+        """Merge with the file on disk (other workers may have written it) and replace it atomically"""
+        merged = self._load()
+        for bucket_name, bucket in self.entries.items():
+            target = merged.setdefault(bucket_name, {})
+            for key, entry in bucket.items():
+                if key not in target or target[key]["last_success"] <= entry["last_success"]:
+                    target[key] = entry
+        self.entries = self._prune(merged)
+        self.dirty = False
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(temp_path, "w", encoding="utf-8") as memo_file:
+                json.dump(self.entries, memo_file, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"Could not save selector memo: {str(e)}")
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as memo_file:
+                return self._prune(json.load(memo_file))
+        except (OSError, ValueError):
+            return {}
+
+    def _prune(self, entries):
+        """Drop entries older than MAX_AGE_SECONDS"""
+        now = self.clock()
+        pruned = {}
+        for bucket_name, bucket in entries.items():
+            fresh = {key: entry for key, entry in bucket.items()
+                     if now - entry.get("last_success", 0) <= self.MAX_AGE_SECONDS}
+            if fresh:
+                pruned[bucket_name] = fresh
+        return pruned
+
+    @staticmethod
+    def _bucket(list_name, browser):
+        return f"{list_name}:{(browser or 'unknown').lower()}"
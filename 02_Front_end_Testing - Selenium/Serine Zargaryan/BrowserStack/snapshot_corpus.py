@@ -0,0 +1,100 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+
+class SnapshotCorpus:
+    """Content-addressed store of page snapshots recorded during live runs, for offline replay
+
+    Each distinct page HTML is stored once as objects/<sha256>.html.gz; index.jsonl lists every
+    recording with its URL, the test that saw it and when.
+    """
+
+    DEFAULT_DIR = Path("test_reports") / "snapshots"
+
+    # Set by --record-snapshots; BlueOriginHelpers.page_snapshot records every new capture into it
+    recorder = None
+
+    def __init__(self, directory=None, clock=time.time):
+        self.directory = Path(directory) if directory else self.DEFAULT_DIR
+        self.objects_dir = self.directory / "objects"
+        self.index_path = self.directory / "index.jsonl"
+        self.clock = clock
+        # Test node ID attached to recordings, updated per test by conftest
+        self.label = None
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def start_recording(cls, directory=None):
+        cls.recorder = cls(directory)
+        return cls.recorder
+
+    @classmethod
+    def stop_recording(cls):
+        cls.recorder = None
+
+    @staticmethod
+    def digest(html):
+        return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+    def put(self, html):
+        """Store the HTML unless an identical snapshot exists; returns its digest"""
+        digest = self.digest(html)
+        path = self.objects_dir / f"{digest}.html.gz"
+        if not path.exists():
+            self.objects_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with gzip.open(temp_path, "wt", encoding="utf-8") as object_file:
+                object_file.write(html)
+            os.replace(temp_path, path)
+        return digest
+
+    def record(self, html, url, label=None):
+        """Store a snapshot and add it to the index; failures are logged, never raised into the test"""
+        try:
+            digest = self.put(html)
+            entry = {"sha": digest, "url": url, "label": label or self.label, "recorded_at": self.clock()}
+            with self._lock:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                # One short append per line keeps concurrent workers from interleaving entries
+                with open(self.index_path, "a", encoding="utf-8") as index_file:
+                    index_file.write(json.dumps(entry) + "\n")
+            return digest
+        except OSError as e:
+            self.logger.warning(f"Could not record page snapshot: {str(e)}")
+            return None
+
+    def get(self, digest):
+        with gzip.open(self.objects_dir / f"{digest}.html.gz", "rt", encoding="utf-8") as object_file:
+            return object_file.read()
+
+    def entries(self, url=None, label=None):
+        """Index entries in recording order, optionally filtered by URL and by test node ID prefix"""
+        try:
+            with open(self.index_path, encoding="utf-8") as index_file:
+                lines = index_file.readlines()
+        except OSError:
+            return []
+        entries = []
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if url is not None and entry["url"] != url:
+                continue
+            if label is not None and not (entry.get("label") or "").startswith(label):
+                continue
+            entries.append(entry)
+        return entries
+
+    def latest(self, url=None, label=None):
+        """Most recent matching index entry, or None"""
+        entries = self.entries(url, label)
+        return entries[-1] if entries else None
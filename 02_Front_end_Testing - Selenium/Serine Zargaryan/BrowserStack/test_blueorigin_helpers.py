@@ -0,0 +1,203 @@
+import time
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from selector_memo import SelectorMemo
+from test_helpers import BlueOriginHelpers, BlueOriginLocators
+
+MISSING = (By.ID, "missing")
+HIDDEN = (By.ID, "cookie-hidden")
+CONSENT = (By.CSS_SELECTOR, "button.consent")
+LOGO = (By.ID, "header-logo")
+
+
+class FakeSettleDriver:
+    """Answers the settle monitor with scripted [readyState, requests in flight, idle ms] states
+
+    The last state repeats once the script runs out; None stands for a page without JavaScript.
+    """
+
+    def __init__(self, *states):
+        self.states = list(states)
+        self.polls = 0
+
+    def execute_script(self, script, *args):
+        if script != BlueOriginHelpers.SETTLE_MONITOR_SCRIPT:
+            raise WebDriverException("Only the settle monitor is available")
+        self.polls += 1
+        state = self.states.pop(0) if len(self.states) > 1 else self.states[0]
+        if state is None:
+            raise WebDriverException("JavaScript is disabled")
+        return state
+
+
+class FakeElement:
+    def __init__(self, tag_name, text="", displayed=True, href=None):
+        self.tag_name = tag_name
+        self.text = text
+        self.displayed = displayed
+        self.href = href
+        self.rect = {"x": 0, "y": 0, "width": 100, "height": 20}
+
+    def is_displayed(self):
+        return self.displayed
+
+    def get_attribute(self, name):
+        return self.href if name == "href" else None
+
+
+class FakeScriptDriver:
+    """Returns canned results for the helpers' scripts; other scripts fail as with JavaScript disabled
+
+    elements maps (By, value) selectors to what find_elements returns on the per-element fallback.
+    """
+
+    def __init__(self, script_results=None, elements=None):
+        self.script_results = script_results or {}
+        self.elements = elements or {}
+        self.capabilities = {"browserName": "fake"}
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        if script not in self.script_results:
+            raise WebDriverException("JavaScript is disabled")
+        self.scripts.append(args)
+        return self.script_results[script]
+
+    def find_elements(self, by, value):
+        return list(self.elements.get((by, value), []))
+
+
+class TestWaitForDomSettle:
+    """Quiet-window wait on DOM mutations and in-flight requests"""
+
+    def test_waits_for_load_and_requests_to_finish(self):
+        driver = FakeSettleDriver(["loading", 0, 0], ["complete", 2, 0], ["complete", 0, 10 ** 6])
+
+        assert BlueOriginHelpers(driver).wait_for_dom_settle(quiet_ms=50, timeout=2)
+        assert driver.polls >= 3
+
+    def test_quiet_window_also_counts_from_the_call(self):
+        # The page has long been idle, but an action may be about to start a request
+        helpers = BlueOriginHelpers(FakeSettleDriver(["complete", 0, 10 ** 6]))
+        started = time.time()
+
+        assert helpers.wait_for_dom_settle(quiet_ms=200, timeout=2)
+        assert time.time() - started >= 0.2
+
+    def test_busy_page_times_out(self):
+        helpers = BlueOriginHelpers(FakeSettleDriver(["complete", 1, 0]))
+
+        assert not helpers.wait_for_dom_settle(quiet_ms=50, timeout=0.3)
+
+    def test_without_javascript_the_quiet_window_is_waited_out(self):
+        helpers = BlueOriginHelpers(FakeSettleDriver(None))
+        started = time.time()
+
+        assert not helpers.wait_for_dom_settle(quiet_ms=100, timeout=2)
+        assert time.time() - started >= 0.1
+
+
+class TestFindFirstVisible:
+    """One-round-trip race of fallback selectors"""
+
+    consent = FakeElement("button", "Accept All")
+    logo = FakeElement("a", "Home", href="/")
+
+    def test_first_selector_with_a_visible_match_wins(self):
+        driver = FakeScriptDriver({BlueOriginHelpers.MATCH_SELECTORS_SCRIPT: [[self.consent, 2], [self.logo, 3]]})
+        helpers = BlueOriginHelpers(driver)
+
+        element, selector = helpers.find_first_visible([MISSING, HIDDEN, CONSENT, LOGO], timeout=1)
+
+        assert (element, selector) == (self.consent, CONSENT)
+        assert driver.scripts == [([list(MISSING), list(HIDDEN), list(CONSENT), list(LOGO)],)]
+
+    def test_accept_skips_matches_it_rejects(self):
+        driver = FakeScriptDriver({BlueOriginHelpers.MATCH_SELECTORS_SCRIPT: [[self.consent, 0], [self.logo, 1]]})
+        helpers = BlueOriginHelpers(driver)
+
+        _, selector = helpers.find_first_visible([CONSENT, LOGO], timeout=1,
+                                                 accept=lambda element: element.tag_name == "a")
+
+        assert selector == LOGO
+
+    def test_no_visible_match_times_out(self):
+        helpers = BlueOriginHelpers(FakeScriptDriver({BlueOriginHelpers.MATCH_SELECTORS_SCRIPT: []}))
+
+        assert helpers.find_first_visible([MISSING, HIDDEN], timeout=0.3) == (None, None)
+
+    def test_memo_key_tries_the_last_match_first(self, tmp_path):
+        driver = FakeScriptDriver(elements={CONSENT: [self.consent], LOGO: [self.logo]})
+        helpers = BlueOriginHelpers(driver)
+        helpers.selector_memo = SelectorMemo(tmp_path / "selector_memo.json")
+        helpers.find_first_visible([MISSING, LOGO], timeout=1, memo_key="LOGO_SELECTORS")
+
+        _, selector = helpers.find_first_visible([CONSENT, LOGO], timeout=1, memo_key="LOGO_SELECTORS")
+
+        assert selector == LOGO
+
+    def test_without_javascript_each_selector_is_checked_through_the_driver(self):
+        hidden = FakeElement("button", "Accept", displayed=False)
+        driver = FakeScriptDriver(elements={HIDDEN: [hidden], CONSENT: [self.consent]})
+        helpers = BlueOriginHelpers(driver)
+
+        element, selector = helpers.find_first_visible([MISSING, HIDDEN, CONSENT], timeout=1)
+
+        assert (element, selector) == (self.consent, CONSENT)
+
+
+class TestExtractJobListings:
+    """Text, link and visibility of every listing in one script call"""
+
+    selectors = BlueOriginLocators.JOB_LISTING_SELECTORS
+    open_role = FakeElement("li", "Software Engineer II", href="https://www.blueorigin.com/careers/job/R12001")
+    filled_role = FakeElement("li", "Filled Role", displayed=False,
+                              href="https://www.blueorigin.com/careers/job/R12002")
+
+    def make_helpers(self, tmp_path, driver):
+        helpers = BlueOriginHelpers(driver)
+        helpers.selector_memo = SelectorMemo(tmp_path / "selector_memo.json")
+        return helpers
+
+    def script_rows(self, *elements):
+        return [[element, element.text, element.href, element.displayed, element.rect] for element in elements]
+
+    def test_listings_are_read_with_links_and_visibility(self, tmp_path):
+        rows = self.script_rows(self.open_role, self.filled_role)
+        helpers = self.make_helpers(tmp_path, FakeScriptDriver({BlueOriginHelpers.EXTRACT_LISTINGS_SCRIPT: [2, rows]}))
+
+        listings = helpers.extract_job_listings()
+
+        assert [(listing["text"], listing["href"], listing["visible"]) for listing in listings] == [
+            ("Software Engineer II", "https://www.blueorigin.com/careers/job/R12001", True),
+            ("Filled Role", "https://www.blueorigin.com/careers/job/R12002", False)
+        ]
+        # The selector that found the listings is tried first next time
+        assert helpers.ordered_selectors("JOB_LISTING_SELECTORS")[0] == self.selectors[2]
+
+    def test_without_javascript_listings_are_read_per_element(self, tmp_path):
+        driver = FakeScriptDriver(elements={self.selectors[1]: [self.open_role, self.filled_role]})
+        helpers = self.make_helpers(tmp_path, driver)
+
+        listings = helpers.extract_job_listings()
+
+        assert [listing["visible"] for listing in listings] == [True, False]
+        assert listings[0]["text"] == "Software Engineer II"
+        assert listings[0]["href"] == "https://www.blueorigin.com/careers/job/R12001"
+
+    def test_page_without_listings_gives_no_listings(self, tmp_path):
+        helpers = self.make_helpers(tmp_path, FakeScriptDriver({BlueOriginHelpers.EXTRACT_LISTINGS_SCRIPT: None}))
+
+        assert helpers.extract_job_listings(timeout=0.3) == []
+
+    def test_relevance_counts_visible_listings_with_the_keyword(self, tmp_path):
+        hidden_match = FakeElement("li", "Software Test Role", displayed=False)
+        rows = self.script_rows(self.open_role, hidden_match)
+        helpers = self.make_helpers(tmp_path, FakeScriptDriver({BlueOriginHelpers.EXTRACT_LISTINGS_SCRIPT: [0, rows]}))
+
+        relevant, _ = helpers.check_keyword_relevance_in_results("software")
+
+        assert relevant == 1
+        assert helpers.relevance_summary["irrelevant_titles"] == []
@@ -0,0 +1,118 @@
+import threading
+import time
+
+import pytest
+
+from browserstack_scheduler import BrowserStackSessionScheduler, PlatformSlots, load_parallels_per_platform
+
+
+class FakeGrid:
+    """Local stand-in for a Selenium Grid that counts sessions and concurrency"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sessions_created = 0
+        self.active = 0
+        self.max_active = 0
+
+    def create_driver(self):
+        with self.lock:
+            self.sessions_created += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        return FakeRemoteDriver(self)
+
+
+class FakeRemoteDriver:
+    """Records executor commands the scheduler sends to a remote session"""
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.scripts = []
+        self.quit_called = False
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+
+    def quit(self):
+        with self.grid.lock:
+            self.grid.active -= 1
+        self.quit_called = True
+
+
+class TestBrowserStackSessionScheduler:
+    """Session reuse and parallelsPerPlatform enforcement against a fake grid"""
+
+    @pytest.fixture
+    def grid(self):
+        return FakeGrid()
+
+    def make_scheduler(self, tmp_path, limit=1, reset_state=None):
+        slots = PlatformSlots(tmp_path / "slots", limit=limit, poll_interval=0.01)
+        return BrowserStackSessionScheduler(slots, reset_state=reset_state)
+
+    def test_consecutive_tests_reuse_one_session(self, tmp_path, grid):
+        scheduler = self.make_scheduler(tmp_path, reset_state=lambda driver: True)
+
+        first = scheduler.acquire("chrome", "test_a - chrome", grid.create_driver)
+        scheduler.release(first)
+        second = scheduler.acquire("chrome", "test_b - chrome", grid.create_driver)
+
+        assert first is second
+        assert grid.sessions_created == 1
+        assert 'setSessionName' in second.scripts[-1] and "test_b - chrome" in second.scripts[-1]
+
+    def test_switching_platform_closes_previous_session(self, tmp_path, grid):
+        scheduler = self.make_scheduler(tmp_path)
+
+        chrome = scheduler.acquire("chrome", "test_a - chrome", grid.create_driver)
+        scheduler.release(chrome)
+        scheduler.acquire("firefox", "test_a - firefox", grid.create_driver)
+
+        assert chrome.quit_called
+        assert grid.active == 1
+        assert not (tmp_path / "slots" / "chrome_0.lease").exists()
+
+    def test_failed_reset_closes_session(self, tmp_path, grid):
+        scheduler = self.make_scheduler(tmp_path, reset_state=lambda driver: False)
+
+        driver = scheduler.acquire("chrome", "test_a - chrome", grid.create_driver)
+        scheduler.release(driver)
+
+        assert driver.quit_called
+        assert scheduler.acquire("chrome", "test_b - chrome", grid.create_driver) is not driver
+
+    def test_concurrency_capped_at_parallels_per_platform(self, tmp_path, grid):
+        def run_worker():
+            # Each worker process has its own scheduler sharing the lease directory
+            scheduler = self.make_scheduler(tmp_path, limit=2)
+            driver = scheduler.acquire("chrome", "test - chrome", grid.create_driver)
+            time.sleep(0.05)
+            scheduler.release(driver)
+            scheduler.close_all()
+
+        workers = [threading.Thread(target=run_worker) for _ in range(6)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert grid.sessions_created == 6
+        assert grid.max_active == 2
+
+    def test_driver_creation_error_frees_slot(self, tmp_path):
+        scheduler = self.make_scheduler(tmp_path)
+
+        def broken_driver():
+            raise RuntimeError("grid unavailable")
+
+        with pytest.raises(RuntimeError):
+            scheduler.acquire("edge", "test - edge", broken_driver)
+        assert list((tmp_path / "slots").iterdir()) == []
+
+    def test_parallels_per_platform_read_from_config(self, tmp_path):
+        config = tmp_path / "browserstack.yml"
+        config.write_text("platforms:\n  - os: Windows\nparallelsPerPlatform: 3\n")
+
+        assert load_parallels_per_platform(config) == 3
+        assert load_parallels_per_platform(tmp_path / "missing.yml") == 1
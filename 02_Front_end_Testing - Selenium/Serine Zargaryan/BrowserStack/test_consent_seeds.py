@@ -0,0 +1,62 @@
+from selenium.common.exceptions import WebDriverException
+
+from consent_seeds import ConsentSeeder
+from testing_support import FakeCdpDriver, FakeDriver
+
+CAREERS_URL = "https://www.blueorigin.com/careers"
+WORKDAY_ORIGIN = "https://blueorigin.wd5.myworkdayjobs.com"
+
+
+class TestConsentSeeder:
+    """Consent cookies written before the first visit, and seeds recorded from accepted banners"""
+
+    def test_builtin_seed_is_written_once_per_driver(self, tmp_path):
+        seeder = ConsentSeeder(tmp_path / "seeds.json")
+        driver = FakeDriver()
+
+        assert seeder.seed(driver, CAREERS_URL)
+        assert seeder.seed(driver, f"{CAREERS_URL}/search")
+
+        assert driver.visited == ["https://www.blueorigin.com/robots.txt"]
+        assert [cookie["name"] for cookie in driver.get_cookies()] == ["OptanonAlertBoxClosed", "OptanonConsent"]
+        assert "{now}" not in driver.get_cookies()[0]["value"]
+        assert ConsentSeeder.is_seeded(driver, "www.blueorigin.com")
+
+    def test_cdp_drivers_are_seeded_without_navigation(self, tmp_path):
+        driver = FakeCdpDriver()
+
+        assert ConsentSeeder(tmp_path / "seeds.json").seed(driver, CAREERS_URL)
+
+        assert driver.visited == []
+        assert len(driver.cdp_cookies) == 2
+
+    def test_domains_without_a_seed_are_left_alone(self, tmp_path):
+        driver = FakeDriver()
+
+        assert not ConsentSeeder(tmp_path / "seeds.json").seed(driver, "https://example.com/")
+        assert driver.visited == []
+
+    def test_accepted_banner_is_recorded_for_later_runs(self, tmp_path):
+        path = tmp_path / "seeds.json"
+        driver = FakeDriver(current_url=f"{WORKDAY_ORIGIN}/BlueOrigin")
+        driver.add_cookie({"name": "wd-cookie-consent", "value": "yes", "domain": "blueorigin.wd5.myworkdayjobs.com",
+                           "path": "/", "httpOnly": False})
+        driver.add_cookie({"name": "session", "value": "abc", "path": "/"})
+        driver.storage[WORKDAY_ORIGIN] = ({"cookieConsentAccepted": "true", "theme": "dark"}, {})
+
+        assert ConsentSeeder(path).record(driver)
+
+        replayed = FakeDriver()
+        assert ConsentSeeder(path).seed(replayed, f"{WORKDAY_ORIGIN}/BlueOrigin")
+        assert [cookie["name"] for cookie in replayed.get_cookies()] == ["wd-cookie-consent"]
+        assert replayed.storage[WORKDAY_ORIGIN][0] == {"cookieConsentAccepted": "true"}
+
+    def test_failed_seed_leaves_the_domain_unseeded(self, tmp_path):
+        class BrokenDriver(FakeDriver):
+            def get(self, url):
+                raise WebDriverException("Navigation failed")
+
+        driver = BrokenDriver()
+
+        assert not ConsentSeeder(tmp_path / "seeds.json").seed(driver, CAREERS_URL)
+        assert not ConsentSeeder.is_seeded(driver, "www.blueorigin.com")
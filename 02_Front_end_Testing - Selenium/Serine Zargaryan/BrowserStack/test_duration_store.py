@@ -0,0 +1,82 @@
+import pytest
+
+from duration_store import DurationRecorder, DurationStore, partition_by_duration
+from testing_support import FakeItem
+
+
+def make_report(nodeid, when, duration, outcome="passed", **extra):
+    return pytest.TestReport(nodeid, ("t.py", 0, nodeid), {}, outcome, None, when, duration=duration, **extra)
+
+
+class TestDurationStore:
+    """Historical durations and estimates for tests without history"""
+
+    def test_measurements_are_smoothed_and_saved(self, tmp_path):
+        path = tmp_path / "durations.json"
+        store = DurationStore(path)
+        store.record("t.py::test_a", 10.0)
+        store.record("t.py::test_a", 20.0)
+        store.save()
+
+        assert DurationStore(path).estimate("t.py::test_a") == 15.0
+
+    def test_missing_or_corrupt_file_starts_empty(self, tmp_path):
+        path = tmp_path / "durations.json"
+        assert DurationStore(path).estimate("t.py::test_a") == DurationStore.DEFAULT_DURATION
+
+        path.write_text("[1, 2", encoding="utf-8")
+        assert DurationStore(path).durations == {}
+
+    def test_unknown_tests_get_the_median_until_a_new_measurement(self, tmp_path):
+        store = DurationStore(tmp_path / "durations.json")
+        for nodeid, duration in (("a", 1.0), ("b", 5.0), ("c", 9.0)):
+            store.record(nodeid, duration)
+
+        assert store.estimate("unknown") == 5.0
+        store.record("d", 20.0)
+        store.record("e", 30.0)
+        assert store.estimate("unknown") == 9.0
+
+
+class TestPartitionByDuration:
+    """Longest-first bin packing of items onto workers"""
+
+    def test_loads_are_balanced_and_collection_order_is_kept(self, tmp_path):
+        store = DurationStore(tmp_path / "durations.json")
+        durations = {"a": 8.0, "b": 1.0, "c": 7.0, "d": 2.0, "e": 3.0, "f": 3.0}
+        for nodeid, duration in durations.items():
+            store.record(nodeid, duration)
+        items = [FakeItem(nodeid) for nodeid in durations]
+
+        shards = partition_by_duration(items, 2, store)
+
+        assert sorted(sum(durations[item.nodeid] for item in shard) for shard in shards) == [12.0, 12.0]
+        for shard in shards:
+            assert [item.nodeid for item in shard] == sorted(item.nodeid for item in shard)
+
+    def test_more_workers_than_items_leaves_shards_empty(self, tmp_path):
+        shards = partition_by_duration([FakeItem("a")], 3, DurationStore(tmp_path / "durations.json"))
+
+        assert sorted(len(shard) for shard in shards) == [0, 0, 1]
+
+
+class TestDurationRecorder:
+    """Per-test totals fed into the store at teardown"""
+
+    def test_reports_made_up_for_lost_items_are_not_recorded(self, tmp_path):
+        store = DurationStore(tmp_path / "durations.json")
+        recorder = DurationRecorder(store)
+        recorder.pytest_runtest_logreport(make_report("t.py::test_ok", "call", 2.0))
+        recorder.pytest_runtest_logreport(make_report("t.py::test_ok", "teardown", 0.5))
+        recorder.pytest_runtest_logreport(make_report("t.py::test_lost", "setup", 0.0, "failed", lost=True))
+        recorder.pytest_runtest_logreport(make_report("t.py::test_lost", "teardown", 0.0, lost=True))
+
+        assert store.durations == {"t.py::test_ok": 2.5}
+
+    def test_skipped_tests_are_not_recorded(self, tmp_path):
+        store = DurationStore(tmp_path / "durations.json")
+        recorder = DurationRecorder(store)
+        recorder.pytest_runtest_logreport(make_report("t.py::test_skip", "setup", 0.1, "skipped"))
+        recorder.pytest_runtest_logreport(make_report("t.py::test_skip", "teardown", 0.1))
+
+        assert store.durations == {}
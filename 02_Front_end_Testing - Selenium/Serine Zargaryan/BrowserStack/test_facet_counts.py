@@ -0,0 +1,66 @@
+from facet_counts import FacetAggregator
+from workday_client import WorkdayClient
+from workday_standin import SAMPLE_POSTINGS, WorkdayStandIn
+
+
+def detail(posting, time_type="Full time", family="Engineering", additional=None):
+    return {"jobPostingInfo": {"title": posting["title"], "location": posting["locationsText"],
+                               "additionalLocations": additional or [], "timeType": time_type,
+                               "jobFamilyGroup": family, "jobReqId": posting["bulletFields"][0]}}
+
+
+def facet(parameter, counts):
+    return {"facetParameter": parameter,
+            "values": [{"descriptor": descriptor, "id": descriptor, "count": count} for descriptor, count in counts]}
+
+
+DETAILS = {posting["externalPath"]: detail(posting) for posting in SAMPLE_POSTINGS}
+DETAILS[SAMPLE_POSTINGS[2]["externalPath"]] = detail(SAMPLE_POSTINGS[2], "Part time", "Manufacturing", ["Kent, WA"])
+
+FACETS = [
+    {"facetParameter": "locationMainGroup",
+     "values": [facet("locations", [("Kent, WA", 3), ("Seattle, WA", 1), ("Van Horn, TX", 1), ("Huntsville, AL", 1)])]},
+    facet("jobFamilyGroup", [("Engineering", 4), ("Manufacturing", 1)]),
+    facet("timeType", [("Full time", 4), ("Part time", 1)])
+]
+
+
+class TestFacetAggregator:
+    """Local facet counts over the crawled catalog against the facets block"""
+
+    def run_against(self, facets, details=DETAILS):
+        with WorkdayStandIn(details=details, facets=facets) as standin:
+            client = WorkdayClient(standin.url)
+            drift = FacetAggregator().run(client, concurrency=4)
+            client.close()
+        return drift
+
+    def test_counts_cover_every_location_of_a_job(self):
+        local = FacetAggregator().count(info["jobPostingInfo"] for info in DETAILS.values())
+
+        assert local["locations"]["kent, wa"] == 3
+        assert local["timeType"] == {"full time": 4, "part time": 1}
+
+    def test_nested_facet_groups_are_flattened(self):
+        reported = FacetAggregator.reported(FACETS)
+
+        assert reported["locations"]["van horn, tx"] == 1
+        assert reported["jobFamilyGroup"] == {"engineering": 4, "manufacturing": 1}
+
+    def test_matching_facets_produce_no_drift(self):
+        drift = self.run_against(FACETS)
+
+        assert drift == []
+        assert FacetAggregator.format_report(drift) == "Facet counts match Workday"
+
+    def test_drift_is_reported_per_value(self):
+        facets = FACETS[:2] + [facet("timeType", [("Full time", 5), ("Intern", 2)])]
+
+        drift = self.run_against(facets)
+
+        assert drift == [
+            {"facet": "timeType", "value": "full time", "local": 4, "workday": 5},
+            {"facet": "timeType", "value": "intern", "local": 0, "workday": 2},
+            {"facet": "timeType", "value": "part time", "local": 1, "workday": 0}
+        ]
+        assert FacetAggregator.format_report(drift).splitlines()[0] == "3 facet values drift from Workday:"
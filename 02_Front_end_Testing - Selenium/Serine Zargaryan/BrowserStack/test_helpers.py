@@ -1,4 +1,5 @@
 #helpers changed just little from Unittest
+import html
 import os
 import time
 import re
@@ -11,9 +12,19 @@ from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, ElementClickInterceptedException,
+                                        StaleElementReferenceException, WebDriverException)
 import logging
 
+from selector_memo import SelectorMemo
+from consent_seeds import ConsentSeeder
+from workday_client import WorkdayClient
+from job_snapshot import BLUEORIGIN, WORKDAY, JobSnapshotStore
+from page_data import EmbeddedPageData
+from page_snapshot import PageSnapshot, UnsupportedSelector
+from snapshot_corpus import SnapshotCorpus
+from title_classifier import TitleClassifier
+
 
 class WebDriverFactory:
     """Factory class for creating browser instances with proper configuration"""
@@ -160,6 +171,144 @@ class WebDriverFactory:
         return driver_methods[browser_name](disable_javascript, headless)
 
 
+class WebDriverPool:
+    """Pool of warm WebDriver instances keyed by (browser, headless, disable_javascript)"""
+
+    # Origins the tests visit; their cookies and storage are wiped between tests
+    RESET_ORIGINS = [
+        "https://www.blueorigin.com",
+        "https://blueorigin.wd5.myworkdayjobs.com"
+    ]
+
+    def __init__(self, factory=None):
+        self.factory = factory or WebDriverFactory.get_driver
+        self.launch_count = 0
+        self._idle = {}
+        # id(driver) -> (driver, key); the driver is kept so quit_all can reach drivers never released
+        self._in_use = {}
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def make_key(browser_name, headless=False, disable_javascript=False):
+        """Build the pool key for a browser configuration"""
+        return browser_name.lower(), bool(headless), bool(disable_javascript)
+
+    def acquire(self, browser_name, headless=False, disable_javascript=False):
+        """Get a clean driver for the configuration, launching one only if none is idle"""
+        key = self.make_key(browser_name, headless, disable_javascript)
+        idle_drivers = self._idle.setdefault(key, [])
+
+        while idle_drivers:
+            driver = idle_drivers.pop()
+            if self._is_alive(driver):
+                self._in_use[id(driver)] = (driver, key)
+                self.logger.info(f"Reusing warm {key[0]} driver from pool")
+                return driver
+            self._quit_quietly(driver)
+
+        driver = self.factory(key[0], disable_javascript=key[2], headless=key[1])
+        self.launch_count += 1
+        self._in_use[id(driver)] = (driver, key)
+        self.logger.info(f"Launched new {key[0]} driver (total launches: {self.launch_count})")
+        return driver
+
+    def release(self, driver):
+        """Reset driver state and return it to the pool, quitting it if the reset fails"""
+        _, key = self._in_use.pop(id(driver), (driver, None))
+        if key is None:
+            self._quit_quietly(driver)
+            return
+
+        if self.reset_driver_state(driver, javascript_enabled=not key[2]):
+            self._idle.setdefault(key, []).append(driver)
+        else:
+            self.logger.warning(f"Could not reset {key[0]} driver, discarding it")
+            self._quit_quietly(driver)
+
+    def discard(self, driver):
+        """Quit a driver instead of returning it to the pool"""
+        self._in_use.pop(id(driver), None)
+        self._quit_quietly(driver)
+
+    def quit_all(self):
+        """Quit every driver owned by the pool, including those still checked out"""
+        for drivers in self._idle.values():
+            for driver in drivers:
+                self._quit_quietly(driver)
+        for driver, _ in self._in_use.values():
+            self._quit_quietly(driver)
+        self._idle.clear()
+        self._in_use.clear()
+
+    @classmethod
+    def reset_driver_state(cls, driver, javascript_enabled=True):
+        """Close extra windows and clear cookies, localStorage and sessionStorage"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            if cls._clear_with_cdp(driver):
+                cls._clear_current_origin(driver, javascript_enabled)
+            else:
+                # Without CDP cookies and storage can only be cleared for the loaded origin,
+                # so visit a lightweight resource on each origin the tests touch
+                cls._clear_current_origin(driver, javascript_enabled)
+                for origin in cls.RESET_ORIGINS:
+                    driver.get(f"{origin}/robots.txt")
+                    cls._clear_current_origin(driver, javascript_enabled)
+
+            driver.get("about:blank")
+            ConsentSeeder.forget(driver)
+            return True
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Driver state reset failed: {str(e)}")
+            return False
+
+    @classmethod
+    def _clear_with_cdp(cls, driver):
+        """Clear cookies and storage for all test origins through CDP (Chrome/Edge only)"""
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for origin in cls.RESET_ORIGINS:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                    "origin": origin,
+                    "storageTypes": "local_storage,session_storage,indexeddb,cache_storage"
+                })
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _clear_current_origin(driver, javascript_enabled):
+        """Clear cookies and web storage visible to the currently loaded page"""
+        driver.delete_all_cookies()
+        if javascript_enabled:
+            driver.execute_script(
+                "try { window.localStorage.clear(); } catch (e) {}"
+                "try { window.sessionStorage.clear(); } catch (e) {}"
+            )
+
+    @staticmethod
+    def _is_alive(driver):
+        """Check that the browser session still responds"""
+        try:
+            return len(driver.window_handles) > 0
+        except Exception:
+            return False
+
+    def _quit_quietly(self, driver):
+        """Quit a driver ignoring errors from already-dead sessions"""
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.debug(f"Ignoring error while quitting driver: {str(e)}")
+
+
 class BlueOriginLocators:
     """Class containing all locators for Blue Origin career website"""
 
@@ -256,14 +405,130 @@ class BlueOriginLocators:
 class BlueOriginHelpers:
     """Helper class containing all methods for Blue Origin career testing"""
 
+    # Installed once per document: tracks DOM mutations, scrolling and in-flight fetch/XHR requests.
+    # Requests pending longer than 10s (analytics beacons, long polls) are not counted as activity.
+    SETTLE_MONITOR_SCRIPT = """
+        if (!window.__boSettle) {
+            var state = window.__boSettle = {lastActivity: Date.now(), pending: {}, nextId: 0};
+            var touch = function () { state.lastActivity = Date.now(); };
+            var start = function () { var id = state.nextId++; state.pending[id] = Date.now(); touch(); return id; };
+            var finish = function (id) { delete state.pending[id]; touch(); };
+
+            new MutationObserver(touch).observe(document, {childList: true, subtree: true, characterData: true});
+            window.addEventListener('scroll', touch, true);
+
+            if (window.fetch) {
+                var originalFetch = window.fetch;
+                window.fetch = function () {
+                    var id = start();
+                    return originalFetch.apply(this, arguments).finally(function () { finish(id); });
+                };
+            }
+            var originalSend = XMLHttpRequest.prototype.send;
+            XMLHttpRequest.prototype.send = function () {
+                var id = start();
+                this.addEventListener('loadend', function () { finish(id); });
+                return originalSend.apply(this, arguments);
+            };
+        }
+        var now = Date.now();
+        var inflight = Object.keys(window.__boSettle.pending).filter(function (id) {
+            return now - window.__boSettle.pending[id] < 10000;
+        }).length;
+        return [document.readyState, inflight, now - window.__boSettle.lastActivity];
+    """
+
+    # Shared by the scripts below; By values are the W3C strategy names
+    FIND_ALL_FUNCTIONS = """
+        function isVisible(element) {
+            var style = window.getComputedStyle(element);
+            return element.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+        }
+        function findAll(by, value) {
+            if (by === 'id') { var element = document.getElementById(value); return element ? [element] : []; }
+            if (by === 'css selector') { return Array.prototype.slice.call(document.querySelectorAll(value)); }
+            if (by === 'class name') { return Array.prototype.slice.call(document.getElementsByClassName(value)); }
+            if (by === 'tag name') { return Array.prototype.slice.call(document.getElementsByTagName(value)); }
+            if (by === 'name') { return Array.prototype.slice.call(document.getElementsByName(value)); }
+            if (by === 'link text' || by === 'partial link text') {
+                return Array.prototype.slice.call(document.getElementsByTagName('a')).filter(function (link) {
+                    var text = (link.innerText || link.textContent || '').trim();
+                    return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+                });
+            }
+            if (by === 'xpath') {
+                var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                var nodes = [];
+                for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+                return nodes;
+            }
+            return [];
+        }
+    """
+
+    # Evaluates a list of (By, value) selectors in one round trip
+    MATCH_SELECTORS_SCRIPT = "var selectors = arguments[0];" + FIND_ALL_FUNCTIONS + """
+        var matches = [];
+        for (var i = 0; i < selectors.length; i++) {
+            var found;
+            try { found = findAll(selectors[i][0], selectors[i][1]); } catch (e) { continue; }
+            for (var j = 0; j < found.length; j++) {
+                if (found[j].nodeType === 1 && isVisible(found[j])) { matches.push([found[j], i]); break; }
+            }
+        }
+        return matches;
+    """
+
+    # Returns [selector index, [[element, text, href, visible, rect], ...]] for the first selector with matches
+    EXTRACT_LISTINGS_SCRIPT = "var selectors = arguments[0];" + FIND_ALL_FUNCTIONS + """
+        for (var i = 0; i < selectors.length; i++) {
+            var found;
+            try { found = findAll(selectors[i][0], selectors[i][1]); } catch (e) { continue; }
+            found = found.filter(function (node) { return node.nodeType === 1; });
+            if (!found.length) { continue; }
+            return [i, found.map(function (element) {
+                var link = element.closest('a') || element.querySelector('a');
+                var box = element.getBoundingClientRect();
+                return [element, (element.innerText || element.textContent || '').trim(), link ? link.href : null,
+                        isVisible(element), {x: box.x, y: box.y, width: box.width, height: box.height}];
+            })];
+        }
+        return null;
+    """
+
+    # Counts DOM mutations per document so an unchanged page is not serialized again.
+    # Returns [page state token, outerHTML or null while the caller's token (arguments[0]) is still current]
+    SNAPSHOT_SCRIPT = """
+        var state = window.__boSnapshot;
+        if (!state) {
+            state = window.__boSnapshot = {id: Date.now() + '-' + Math.random(), version: 0};
+            new MutationObserver(function () { state.version++; }).observe(
+                document, {childList: true, subtree: true, attributes: true, characterData: true}
+            );
+        }
+        var token = state.id + ':' + state.version;
+        return [token, token === arguments[0] ? null : document.documentElement.outerHTML];
+    """
+
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
         self.long_wait = WebDriverWait(driver, 30)
         self.search_results_count = 0
-        self.workday_url = "https://blueorigin.wd5.myworkdayjobs.com/en-US/BlueOrigin"
         self.workday_job_count = 0
+        self.relevance_summary = {}
+        self.job_listing_records = []
+        self._page_snapshot = None
         self.logger = logging.getLogger(__name__)
+        # Fallback locator lists are tried in the order that last worked for this browser
+        self.selector_memo = SelectorMemo.shared()
+        self.title_classifier = TitleClassifier.shared()
+        self.browser_name = (getattr(driver, "capabilities", None) or {}).get("browserName", "unknown")
+        # Consent banners are avoided by writing their cookies before the first page load
+        self.consent_seeder = ConsentSeeder.shared()
+        # Workday counts and titles are read from the CXS API; the browser is only a fallback
+        self.workday_client = WorkdayClient.shared()
+        self.workday_url = BlueOriginUrls.workday_url()
 
     def safe_execute(self, func, *args, fallback_result=None, error_message="Operation failed", **kwargs):
         """Safely execute function with error handling and logging"""
@@ -273,6 +538,56 @@ class BlueOriginHelpers:
             self.logger.warning(f"{error_message}: {str(e)}")
             return fallback_result
 
+    def page_snapshot(self):
+        """Parsed copy of the current DOM, captured again only after the page has mutated or navigated
+
+        Locator, text and regex checks on the snapshot need no further round trips. Form field
+        values typed by the user are not part of it. With --record-snapshots every new capture is
+        added to the SnapshotCorpus for offline replay.
+        """
+        known_token = self._page_snapshot.token if self._page_snapshot is not None else None
+        try:
+            token, page_html = self.driver.execute_script(self.SNAPSHOT_SCRIPT, known_token)
+        except (WebDriverException, TypeError, ValueError):
+            # Without script access, every call captures the page source again
+            self._page_snapshot = None
+            page_html = self.driver.page_source
+            self._record_snapshot(page_html)
+            return PageSnapshot(page_html)
+        if page_html is not None or self._page_snapshot is None:
+            self._page_snapshot = PageSnapshot(page_html or "", token=token)
+            self._record_snapshot(page_html)
+        return self._page_snapshot
+
+    def _record_snapshot(self, page_html):
+        if SnapshotCorpus.recorder is not None and page_html:
+            SnapshotCorpus.recorder.record(page_html, self.driver.current_url)
+
+    def snapshot_find_elements(self, selector, displayed_only=True, snapshot=None):
+        """Match a (By, value) locator against the page snapshot; None if the locator is outside its subset"""
+        try:
+            nodes = (snapshot or self.page_snapshot()).find_elements(*selector)
+        except UnsupportedSelector:
+            return None
+        return [node for node in nodes if node.is_displayed()] if displayed_only else nodes
+
+    def find_displayed_elements(self, selector, snapshot=None, accept=None):
+        """Driver elements of a locator that the browser reports as displayed and accept(element) allows
+
+        The snapshot only knows inline styles and attributes, so it rules a locator out only when every
+        match is certainly hidden or rejected by accept. Whether the rest are displayed is up to the
+        driver, which also applies stylesheets.
+        """
+        candidates = self.snapshot_find_elements(selector, displayed_only=False, snapshot=snapshot)
+        if candidates is not None and not any(not node.is_hidden() and (accept is None or accept(node))
+                                              for node in candidates):
+            return []
+        try:
+            return [element for element in self.driver.find_elements(*selector)
+                    if element.is_displayed() and (accept is None or accept(element))]
+        except (NoSuchElementException, StaleElementReferenceException):
+            return []
+
     def wait_for_page_load(self, timeout=10):
         """Wait for page to be fully loaded"""
         try:
@@ -281,65 +596,115 @@ class BlueOriginHelpers:
             )
         except TimeoutException:
             self.logger.warning("Page load timeout")
+        if SnapshotCorpus.recorder is not None:
+            self.page_snapshot()
 
-    def handle_cookie_consent(self, max_retries=3):
-        """Handle cookie consent popup with retry mechanism"""
-        for attempt in range(max_retries):
-            for selector_type, selector_value in BlueOriginLocators.COOKIE_SELECTORS:
-                try:
-                    cookie_button = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((selector_type, selector_value))
-                    )
+    def install_settle_monitor(self):
+        """Start tracking DOM and network activity before triggering an action"""
+        try:
+            return self.driver.execute_script(self.SETTLE_MONITOR_SCRIPT)
+        except Exception as e:
+            self.logger.debug(f"Could not install settle monitor: {str(e)}")
+            return None
 
-                    if cookie_button.is_displayed():
-                        self.scroll_to_element(cookie_button)
-                        time.sleep(0.5)
-
-                        # Try different click methods
-                        click_methods = [
-                            lambda: cookie_button.click(),
-                            lambda: self.driver.execute_script("arguments[0].click();", cookie_button),
-                            lambda: ActionChains(self.driver).click(cookie_button).perform()
-                        ]
-
-                        for click_method in click_methods:
-                            try:
-                                click_method()
-                                time.sleep(1)
-                                self.logger.info("Cookie consent handled successfully")
-                                return True
-                            except ElementClickInterceptedException:
-                                continue
+    def wait_for_dom_settle(self, quiet_ms=500, timeout=10):
+        """Wait until the DOM and network have been quiet for quiet_ms milliseconds"""
+        started = time.time()
 
-                except (TimeoutException, NoSuchElementException):
-                    continue
+        def is_settled(driver):
+            state = self.install_settle_monitor()
+            if state is None:
+                raise WebDriverException("Settle monitor unavailable")
+            ready_state, inflight, idle_ms = state
+            # The quiet window also counts from the call, so activity an action is about
+            # to trigger (e.g. a search request) is not missed on an idle page
+            waited_ms = (time.time() - started) * 1000
+            return ready_state == "complete" and inflight == 0 and min(idle_ms, waited_ms) >= quiet_ms
 
-            if attempt < max_retries - 1:
-                time.sleep(1)  # Wait before retry
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(is_settled)
+            if SnapshotCorpus.recorder is not None:
+                self.page_snapshot()
+            return True
+        except TimeoutException:
+            self.logger.warning(f"DOM did not settle within {timeout}s")
+            return False
+        except WebDriverException:
+            # JavaScript disabled or unavailable: fall back to waiting out the quiet window
+            time.sleep(quiet_ms / 1000)
+            return False
 
-        self.logger.info("No cookie consent popup found or couldn't handle it")
-        return False
+    def ordered_selectors(self, list_name):
+        """Get a BlueOriginLocators list with the selectors that matched before first"""
+        selectors = getattr(BlueOriginLocators, list_name)
+        return self.selector_memo.order(list_name, self.browser_name, selectors)
+
+    def remember_selector(self, list_name, selector):
+        """Record the selector that matched so later lookups try it first"""
+        self.selector_memo.record(list_name, self.browser_name, selector)
+
+    def open_url(self, url):
+        """Seed cookie consent for the URL's domain, then navigate to it"""
+        self.consent_seeder.seed(self.driver, url)
+        self.driver.get(url)
+
+    def handle_cookie_consent(self, max_retries=3):
+        """Dismiss the cookie consent banner unless consent was seeded for this domain"""
+        return self._accept_consent_banner("COOKIE_SELECTORS", timeout=5, max_retries=max_retries)
 
     def handle_workday_cookie_consent(self):
         """Handle cookie consent on Workday site"""
         return self.safe_execute(
-            self._handle_workday_cookie_consent_impl,
+            self._accept_consent_banner,
+            "WORKDAY_COOKIE_SELECTORS",
+            timeout=3,
             fallback_result=False,
             error_message="Failed to handle Workday cookie consent"
         )
 
-    def _handle_workday_cookie_consent_impl(self):
-        """Implementation for Workday cookie consent handling"""
-        for selector_type, selector_value in BlueOriginLocators.WORKDAY_COOKIE_SELECTORS:
-            try:
-                cookie_button = WebDriverWait(self.driver, 3).until(
-                    EC.element_to_be_clickable((selector_type, selector_value))
-                )
-                cookie_button.click()
-                time.sleep(1)
+    def _accept_consent_banner(self, list_name, timeout, max_retries=1):
+        """Probe all consent selectors at once and click the first visible button"""
+        domain = ConsentSeeder.domain_of(self.driver.current_url)
+        seeded = ConsentSeeder.is_seeded(self.driver, domain)
+        if seeded:
+            # Single immediate probe in case the seed is outdated and the banner still shows
+            timeout = 0
+
+        cookie_button, _ = self.find_first_visible(
+            getattr(BlueOriginLocators, list_name), timeout=timeout, memo_key=list_name
+        )
+        if cookie_button is None:
+            if seeded:
+                self.logger.info(f"Cookie consent pre-seeded for {domain}")
                 return True
-            except (TimeoutException, NoSuchElementException):
-                continue
+            self.logger.info("No cookie consent popup found or couldn't handle it")
+            return False
+
+        self.scroll_to_element(cookie_button)
+
+        # Try different click methods
+        click_methods = [
+            lambda: cookie_button.click(),
+            lambda: self.driver.execute_script("arguments[0].click();", cookie_button),
+            lambda: ActionChains(self.driver).click(cookie_button).perform()
+        ]
+
+        for attempt in range(max_retries):
+            for click_method in click_methods:
+                try:
+                    click_method()
+                    self.wait_for_dom_settle(quiet_ms=300, timeout=5)
+                    # Reuse whatever the banner stored so later drivers skip it entirely
+                    self.consent_seeder.record(self.driver)
+                    self.logger.info("Cookie consent handled successfully")
+                    return True
+                except (ElementClickInterceptedException, StaleElementReferenceException):
+                    continue
+
+            if attempt < max_retries - 1:
+                self.wait_for_dom_settle(quiet_ms=300, timeout=3)  # Let the page settle before retry
+
+        self.logger.info("No cookie consent popup found or couldn't handle it")
         return False
 
     def scroll_to_element(self, element):
@@ -349,26 +714,64 @@ class BlueOriginHelpers:
                 "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});",
                 element
             )
-            time.sleep(0.5)
+            # Smooth scrolling fires scroll events until it stops
+            self.wait_for_dom_settle(quiet_ms=150, timeout=2)
         except Exception as e:
             self.logger.warning(f"Failed to scroll to element: {str(e)}")
 
-    def find_element_with_multiple_selectors(self, selectors, timeout=10):
+    def find_element_with_multiple_selectors(self, selectors, timeout=10, memo_key=None):
         """Find element using multiple selectors as fallback"""
-        wait = WebDriverWait(self.driver, timeout)
+        element, _ = self.find_first_visible(selectors, timeout, memo_key=memo_key)
+        return element
 
-        for selector_type, selector_value in selectors:
-            try:
-                element = wait.until(EC.presence_of_element_located((selector_type, selector_value)))
-                if element.is_displayed():
-                    return element
-            except TimeoutException:
-                continue
-        return None
+    def find_first_visible(self, selectors, timeout=10, accept=None, memo_key=None):
+        """Check every selector on each poll tick and return (element, selector) for the first visible match"""
+        if memo_key:
+            selectors = self.selector_memo.order(memo_key, self.browser_name, selectors)
+        selectors = list(selectors)
+
+        def first_match(driver):
+            for element, index in self._match_selectors(selectors):
+                try:
+                    if accept is None or accept(element):
+                        return element, selectors[index]
+                except StaleElementReferenceException:
+                    continue
+            return False
+
+        try:
+            element, selector = WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(first_match)
+        except TimeoutException:
+            return None, None
+
+        if memo_key:
+            self.remember_selector(memo_key, selector)
+        return element, selector
+
+    def _match_selectors(self, selectors):
+        """Return (element, selector index) for the first visible match of each selector, in selector order"""
+        try:
+            return self.driver.execute_script(
+                self.MATCH_SELECTORS_SCRIPT, [[by, value] for by, value in selectors]
+            )
+        except WebDriverException:
+            # Without JavaScript fall back to one find_elements call per selector, still without waiting
+            matches = []
+            for index, (selector_type, selector_value) in enumerate(selectors):
+                try:
+                    for element in self.driver.find_elements(selector_type, selector_value):
+                        if element.is_displayed():
+                            matches.append((element, index))
+                            break
+                except WebDriverException:
+                    continue
+            return matches
 
     def find_first_job_listing(self):
         """Find and return the first job listing element"""
-        element = self.find_element_with_multiple_selectors(BlueOriginLocators.JOB_LISTING_SELECTORS)
+        element = self.find_element_with_multiple_selectors(
+            BlueOriginLocators.JOB_LISTING_SELECTORS, memo_key="JOB_LISTING_SELECTORS"
+        )
         if element:
             try:
                 WebDriverWait(self.driver, 5).until(EC.element_to_be_clickable(element))
@@ -394,15 +797,16 @@ class BlueOriginHelpers:
         for attempt in range(max_retries):
             for method in click_methods:
                 try:
+                    self.install_settle_monitor()
                     method()
-                    time.sleep(0.5)
+                    self.wait_for_dom_settle(quiet_ms=300, timeout=5)
                     return True
                 except (ElementClickInterceptedException, Exception) as e:
                     self.logger.debug(f"Click method failed: {str(e)}")
                     continue
 
             if attempt < max_retries - 1:
-                time.sleep(1)
+                self.wait_for_dom_settle(quiet_ms=300, timeout=3)
 
         self.logger.error("All click methods failed")
         return False
@@ -417,7 +821,7 @@ class BlueOriginHelpers:
 
             # Try to find and click search button
             search_button = self.find_element_with_multiple_selectors(
-                BlueOriginLocators.SEARCH_BUTTON_SELECTORS, timeout=5
+                BlueOriginLocators.SEARCH_BUTTON_SELECTORS, timeout=5, memo_key="SEARCH_BUTTON_SELECTORS"
             )
 
             if search_button and self.click_element_safely(search_button):
@@ -450,12 +854,35 @@ class BlueOriginHelpers:
         search_input = self.wait.until(EC.presence_of_element_located(BlueOriginLocators.SEARCH_INPUT))
         search_input.clear()
         search_input.send_keys(query_with_special_chars)
+        self.install_settle_monitor()
         search_input.send_keys(Keys.RETURN)
-        time.sleep(3)
+        self.wait_for_dom_settle()
         return True
 
+    def read_embedded_job_list(self):
+        """Jobs and total from the page data the careers site embeds, in one script call; None if unavailable
+
+        Returns {"jobs": [{"title", "href", "location"}, ...], "total": int or None}. The data is only
+        used while it still describes the rendered page, since client-side searches do not update it.
+        """
+        try:
+            page_url = self.driver.current_url
+            data_text, page_text = self.driver.execute_script(EmbeddedPageData.READ_SCRIPT)
+        except (WebDriverException, TypeError, ValueError) as e:
+            self.logger.debug(f"Could not read embedded page data: {str(e)}")
+            return None
+        page_data = EmbeddedPageData.from_json(data_text, page_url)
+        if page_data is None or not page_data.jobs() or not page_data.is_current(page_url, page_text):
+            return None
+        return {"jobs": page_data.jobs(), "total": page_data.total()}
+
     def get_search_results_count(self):
-        """Get the count of search results with improved parsing"""
+        """Get the count of search results from the embedded page data, or by parsing the results counter"""
+        embedded = self.read_embedded_job_list()
+        if embedded is not None and embedded["total"] is not None:
+            self.search_results_count = embedded["total"]
+            return self.search_results_count
+
         try:
             results_count_element = self.wait.until(
                 EC.presence_of_element_located(BlueOriginLocators.RESULTS_COUNT)
@@ -488,34 +915,69 @@ class BlueOriginHelpers:
             self.logger.warning("Could not find search results count element")
             return 0
 
-    def check_keyword_relevance_in_results(self, keyword, max_results=5):
-        """Check relevance of keyword in search results with robust locators."""
-        job_listings = []
-        # Try multiple selectors to find the job listings, making the test more robust
-        for selector_type, selector_value in BlueOriginLocators.JOB_LISTING_SELECTORS:
-            try:
-                # Wait for at least one element to be present using the current selector
-                self.wait.until(EC.presence_of_element_located((selector_type, selector_value)))
-                # If found, get all matching elements
-                job_listings = self.driver.find_elements(selector_type, selector_value)
-                if job_listings:
-                    self.logger.info(f"Found {len(job_listings)} job listings with selector: {selector_value}")
-                    break  # Exit loop once listings are found
-            except TimeoutException:
-                continue  # Try the next selector in the list
+    def extract_job_listings(self, timeout=10):
+        """Read text, href, visibility and bounding box of every job listing in one script call"""
+        selectors = self.ordered_selectors("JOB_LISTING_SELECTORS")
 
-        if not job_listings:
+        def extract(driver):
+            result = driver.execute_script(
+                self.EXTRACT_LISTINGS_SCRIPT, [[by, value] for by, value in selectors]
+            )
+            return result or False
+
+        try:
+            index, rows = WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(extract)
+        except TimeoutException:
+            return []
+        except WebDriverException:
+            return self._extract_job_listings_per_element(selectors)
+
+        self.logger.info(f"Found {len(rows)} job listings with selector: {selectors[index][1]}")
+        self.remember_selector("JOB_LISTING_SELECTORS", selectors[index])
+        return [
+            {"element": element, "text": text, "href": href, "visible": visible, "rect": rect}
+            for element, text, href, visible, rect in rows
+        ]
+
+    def _extract_job_listings_per_element(self, selectors):
+        """Slow path without JavaScript: several round trips per listing"""
+        for selector_type, selector_value in selectors:
+            elements = self.driver.find_elements(selector_type, selector_value)
+            if not elements:
+                continue
+            self.remember_selector("JOB_LISTING_SELECTORS", (selector_type, selector_value))
+            return [
+                {"element": element, "text": element.text, "href": element.get_attribute("href"),
+                 "visible": element.is_displayed(), "rect": element.rect}
+                for element in elements
+            ]
+        return []
+
+    def check_keyword_relevance_in_results(self, keyword, max_results=5):
+        """Count keyword matches in the top max_results listings; the whole result set is summarised in relevance_summary"""
+        listings = self.extract_job_listings()
+        if not listings:
             self.logger.warning("Could not find job listings for relevance check using any available selector.")
             return 0, []
 
-        top_results = job_listings[:max_results]
-        relevant_count = 0
-
-        for result in top_results:
-            if result.is_displayed() and keyword.lower() in result.text.lower():
-                relevant_count += 1
+        self.job_listing_records = listings
+        keyword = keyword.lower()
+        relevant = [listing["visible"] and keyword in listing["text"].lower() for listing in listings]
+        visible_count = sum(1 for listing in listings if listing["visible"])
+        self.relevance_summary = {
+            "keyword": keyword,
+            "total": len(listings),
+            "visible": visible_count,
+            "relevant": sum(relevant),
+            "relevant_ratio": sum(relevant) / visible_count if visible_count else 0.0,
+            "irrelevant_titles": [listing["text"] for listing, is_relevant in zip(listings, relevant)
+                                  if listing["visible"] and not is_relevant]
+        }
+        self.logger.info(
+            f"Keyword '{keyword}' found in {self.relevance_summary['relevant']} of {visible_count} visible listings"
+        )
 
-        return relevant_count, job_listings
+        return sum(relevant[:max_results]), [listing["element"] for listing in listings]
 
     def navigate_to_search_jobs(self):
         """Navigate to search jobs page using button or logo link"""
@@ -550,8 +1012,9 @@ class BlueOriginHelpers:
         )
         search_input.clear()
         search_input.send_keys(keyword)
+        self.install_settle_monitor()
         search_input.send_keys(Keys.RETURN)
-        time.sleep(2)
+        self.wait_for_dom_settle()
         return True
 
     def get_new_system_results_count(self):
@@ -570,25 +1033,20 @@ class BlueOriginHelpers:
 
     def find_header_logo(self):
         """Find the header logo element with improved validation"""
-        for selector_type, selector_value in BlueOriginLocators.HEADER_LOGO_SELECTORS:
-            try:
-                header_logo = self.wait.until(EC.presence_of_element_located((selector_type, selector_value)))
-
-                if header_logo.is_displayed() and header_logo.is_enabled():
-                    href = header_logo.get_attribute("href") or ""
-                    if href.endswith("/") or "blueorigin.com" in href:
-                        return header_logo
+        def is_home_link(header_logo):
+            href = header_logo.get_attribute("href") or ""
+            return header_logo.is_enabled() and (href.endswith("/") or "blueorigin.com" in href)
 
-            except (TimeoutException, NoSuchElementException):
-                continue
-
-        return None
+        header_logo, _ = self.find_first_visible(
+            BlueOriginLocators.HEADER_LOGO_SELECTORS, accept=is_home_link, memo_key="HEADER_LOGO_SELECTORS"
+        )
+        return header_logo
 
     def verify_blue_origin_content(self):
         """Verify that we're on a valid Blue Origin page"""
-        # Check page title
-        page_title = self.driver.title.lower()
-        if "blue origin" in page_title:
+        # Title and elements are checked on one page snapshot
+        snapshot = self.page_snapshot()
+        if "blue origin" in snapshot.title.lower():
             return True
 
         # Check for Blue Origin elements
@@ -598,17 +1056,14 @@ class BlueOriginHelpers:
             (By.CSS_SELECTOR, "[alt*='Blue Origin']")
         ]
 
-        for selector_type, selector_value in blue_origin_selectors:
-            try:
-                elements = self.driver.find_elements(selector_type, selector_value)
-                for element in elements:
-                    if element.is_displayed():
-                        element_text = element.text.lower() if element.text else ""
-                        alt_text = element.get_attribute("alt") or ""
-                        if "blue origin" in (element_text + alt_text).lower():
-                            return True
-            except NoSuchElementException:
-                continue
+        def mentions_blue_origin(element):
+            element_text = element.text.lower() if element.text else ""
+            alt_text = element.get_attribute("alt") or ""
+            return "blue origin" in (element_text + alt_text).lower()
+
+        for selector in blue_origin_selectors:
+            if self.find_displayed_elements(selector, snapshot=snapshot, accept=mentions_blue_origin):
+                return True
 
         return False
 
@@ -619,7 +1074,7 @@ class BlueOriginHelpers:
         for i in range(max_tabs):
             try:
                 actions.send_keys(Keys.TAB).perform()
-                time.sleep(0.5)
+                self.wait_for_dom_settle(quiet_ms=100, timeout=2)
 
                 focused_element = self.driver.switch_to.active_element
                 element_text = (focused_element.text or "").lower()
@@ -643,7 +1098,7 @@ class BlueOriginHelpers:
         for i in range(max_tabs):
             try:
                 actions.send_keys(Keys.TAB).perform()
-                time.sleep(0.5)
+                self.wait_for_dom_settle(quiet_ms=100, timeout=2)
 
                 focused_element = self.driver.switch_to.active_element
                 if (focused_element.tag_name == "input" and
@@ -657,14 +1112,47 @@ class BlueOriginHelpers:
         return False
 
     # Workday-specific methods with improved error handling
-    def get_workday_job_count(self):
-        """Get job count from Workday careers page"""
+    def workday_api(self, func, *args, **kwargs):
+        """Call a WorkdayClient method, returning None if the API is unavailable"""
+        return self.safe_execute(
+            func, *args,
+            fallback_result=None,
+            error_message="Workday API request failed, falling back to the browser",
+            **kwargs
+        )
+
+    def open_workday_page(self):
+        """Load the Workday careers page and dismiss its cookie banner"""
+        self.open_url(self.workday_url)
+        self.wait_for_page_load()
+        self.handle_workday_cookie_consent()
+
+    def refresh_workday_snapshot(self, snapshot):
+        """Bring the Workday part of a JobSnapshotStore up to date; False if it is stale and unreachable"""
+        self.workday_api(snapshot.refresh_workday, self.workday_client)
+        return snapshot.is_fresh(WORKDAY)
+
+    def record_blueorigin_listings(self, snapshot):
+        """Add the listings from the last relevance check to the blueorigin.com part of the snapshot"""
+        records = [JobSnapshotStore.listing_record(listing) for listing in self.job_listing_records]
+        # Only one results page is loaded, so listings missing from it are not removals
+        return snapshot.sync(BLUEORIGIN, records, complete=False)
+
+    def get_workday_job_count(self, snapshot=None):
+        """Get total job count from the job snapshot or the Workday API, or from the careers page if both fail"""
+        if snapshot is not None and self.refresh_workday_snapshot(snapshot):
+            self.workday_job_count = snapshot.synced_total(WORKDAY)
+            return self.workday_job_count
+
+        count = self.workday_api(self.workday_client.job_count)
+        if count is not None:
+            self.workday_job_count = count
+            return count
+
         try:
-            self.driver.get(self.workday_url)
-            self.wait_for_page_load()
-            self.handle_workday_cookie_consent()
+            self.open_workday_page()
 
-            for selector_type, selector_value in BlueOriginLocators.WORKDAY_JOB_COUNT_SELECTORS:
+            for selector_type, selector_value in self.ordered_selectors("WORKDAY_JOB_COUNT_SELECTORS"):
                 try:
                     element = WebDriverWait(self.driver, 10).until(
                         EC.presence_of_element_located((selector_type, selector_value))
@@ -682,6 +1170,7 @@ class BlueOriginHelpers:
                         match = re.search(pattern, text, re.IGNORECASE)
                         if match:
                             self.workday_job_count = int(match.group(1))
+                            self.remember_selector("WORKDAY_JOB_COUNT_SELECTORS", (selector_type, selector_value))
                             return self.workday_job_count
 
                 except (TimeoutException, NoSuchElementException):
@@ -699,16 +1188,17 @@ class BlueOriginHelpers:
 
     def search_workday_platform(self, keyword):
         """Search for keyword on Workday platform"""
-        for selector_type, selector_value in BlueOriginLocators.WORKDAY_SEARCH_SELECTORS:
+        for selector_type, selector_value in self.ordered_selectors("WORKDAY_SEARCH_SELECTORS"):
             try:
                 search_input = WebDriverWait(self.driver, 10).until(
                     EC.presence_of_element_located((selector_type, selector_value))
                 )
+                self.remember_selector("WORKDAY_SEARCH_SELECTORS", (selector_type, selector_value))
                 search_input.clear()
                 search_input.send_keys(keyword)
+                self.install_settle_monitor()
                 search_input.send_keys(Keys.RETURN)
-                time.sleep(3)
-                self.wait_for_page_load()
+                self.wait_for_dom_settle()
                 return True
             except (TimeoutException, NoSuchElementException):
                 continue
@@ -716,22 +1206,40 @@ class BlueOriginHelpers:
         self.logger.error("Could not find search input on Workday")
         return False
 
-    def get_first_workday_job_title(self):
+    def get_first_workday_job_title(self, snapshot=None):
         """Get the title of the first available job listing from Workday"""
+        if snapshot is not None and self.refresh_workday_snapshot(snapshot):
+            titles = [job["title"] for job in snapshot.jobs(WORKDAY)]
+        else:
+            titles = self.workday_api(self.workday_client.job_titles)
+        job_title = self.title_classifier.first_title(titles or [])
+        if job_title:
+            self.logger.info(f"Found job title via Workday API: '{job_title}'")
+            return job_title
+
+        if not self.driver.current_url.startswith(self.workday_url):
+            self.open_workday_page()
         self.wait_for_page_load()
 
-        for selector_type, selector_value in BlueOriginLocators.WORKDAY_JOB_TITLE_SELECTORS:
+        for selector_type, selector_value in self.ordered_selectors("WORKDAY_JOB_TITLE_SELECTORS"):
             try:
                 job_elements = WebDriverWait(self.driver, 10).until(
                     EC.presence_of_all_elements_located((selector_type, selector_value))
                 )
 
-                for element in job_elements:
-                    if element.is_displayed():
-                        job_title = element.text.strip()
-                        if self._is_valid_job_title(job_title):
-                            self.logger.info(f"Found job title: '{job_title}'")
-                            return job_title
+                # Visibility comes from the browser; texts come from one page snapshot when it
+                # matched the same elements, and are classified together
+                displayed = [element.is_displayed() for element in job_elements]
+                nodes = self.snapshot_find_elements((selector_type, selector_value), displayed_only=False)
+                if nodes is None or len(nodes) != len(job_elements):
+                    nodes = job_elements
+                job_title = self.title_classifier.first_title(
+                    node.text for node, shown in zip(nodes, displayed) if shown
+                )
+                if job_title:
+                    self.logger.info(f"Found job title: '{job_title}'")
+                    self.remember_selector("WORKDAY_JOB_TITLE_SELECTORS", (selector_type, selector_value))
+                    return job_title
 
             except (TimeoutException, NoSuchElementException):
                 continue
@@ -740,35 +1248,13 @@ class BlueOriginHelpers:
         return self._extract_job_title_from_page_source()
 
     def _is_valid_job_title(self, job_title):
-        """Validate if text looks like a job title"""
-        if not job_title or len(job_title) <= 5:
-            return False
-
-        job_keywords = [
-            'engineer', 'manager', 'analyst', 'specialist', 'technician',
-            'developer', 'designer', 'coordinator', 'director', 'associate',
-            'intern', 'senior', 'junior', 'lead', 'principal', 'staff',
-            'supervisor', 'administrator', 'consultant', 'officer'
-        ]
-
-        job_title_lower = job_title.lower()
-
-        # Check for job keywords
-        if any(keyword in job_title_lower for keyword in job_keywords):
-            return True
-
-        # Check for professional multi-word titles
-        if (len(job_title) > 10 and
-                job_title.count(' ') >= 1 and
-                not any(char in job_title for char in ['@', '#', '$', '%', '&'])):
-            return True
-
-        return False
+        """Validate if text looks like a job title (job keyword, or a longer multi-word title)"""
+        return self.title_classifier.is_title(job_title)
 
     def _extract_job_title_from_page_source(self):
         """Extract job title using regex patterns from page source"""
         try:
-            page_source = self.driver.page_source
+            page_source = self.page_snapshot().html
 
             # Workday-specific patterns
             patterns = [
@@ -781,11 +1267,13 @@ class BlueOriginHelpers:
 
             for pattern in patterns:
                 matches = re.findall(pattern, page_source, re.IGNORECASE)
-                for match in matches:
-                    job_title = match.strip()
-                    if self._is_valid_job_title(job_title):
-                        self.logger.info(f"Found job title via regex: '{job_title}'")
-                        return job_title
+                # Markup line breaks inside a title are collapsed like the browser renders them
+                job_title = self.title_classifier.first_title(
+                    " ".join(html.unescape(match).split()) for match in matches
+                )
+                if job_title:
+                    self.logger.info(f"Found job title via regex: '{job_title}'")
+                    return job_title
 
             self.logger.warning("Could not extract job title from page source")
             return None
@@ -794,6 +1282,18 @@ class BlueOriginHelpers:
             self.logger.error(f"Error extracting job title from page source: {str(e)}")
             return None
 
+    def get_workday_keyword_count(self, keyword):
+        """Number of Workday postings matching keyword, from the API or by searching on the careers page"""
+        count = self.workday_api(self.workday_client.job_count, keyword)
+        if count is not None:
+            return count
+
+        if not self.driver.current_url.startswith(self.workday_url):
+            self.open_workday_page()
+        if not self.search_workday_platform(keyword):
+            return None
+        return self.get_workday_search_results_count()
+
     def get_workday_search_results_count(self):
         """Get search results count from Workday after search"""
         self.wait_for_page_load()
@@ -913,11 +1413,14 @@ class BlueOriginHelpers:
     def check_video_elements_disabled(self):
         """Check if video elements are not functional (indicating JS is disabled)"""
         try:
-            # Look for video elements
-            video_elements = self.driver.find_elements(By.TAG_NAME, "video")
-            iframe_elements = self.driver.find_elements(By.TAG_NAME, "iframe")
+            # Look for video elements; counts come from one page snapshot
+            snapshot = self.page_snapshot()
+            video_nodes = snapshot.find_elements(By.TAG_NAME, "video")
+            iframe_elements = snapshot.find_elements(By.TAG_NAME, "iframe")
+            # Playback state is only known to the browser
+            video_elements = self.driver.find_elements(By.TAG_NAME, "video") if video_nodes else []
 
-            print(f"Found {len(video_elements)} video elements and {len(iframe_elements)} iframes")
+            print(f"Found {len(video_nodes)} video elements and {len(iframe_elements)} iframes")
 
             # Check if videos are not playing (good sign for JS disabled)
             videos_not_playing = True
@@ -948,7 +1451,7 @@ class BlueOriginHelpers:
 
             js_video_containers = []
             for selector in js_video_selectors:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                elements = snapshot.find_elements(By.CSS_SELECTOR, selector)
                 js_video_containers.extend(elements)
 
             print(f"Found {len(js_video_containers)} potential JS video containers")
@@ -998,7 +1501,11 @@ class BlueOriginHelpers:
 
             try:
                 test_link.click()
-                time.sleep(3)  # Wait for navigation
+                try:
+                    # Wait for navigation
+                    WebDriverWait(self.driver, 5).until(lambda driver: driver.current_url != current_url_before)
+                except TimeoutException:
+                    pass
 
                 current_url_after = self.driver.current_url
 
@@ -1054,7 +1561,7 @@ class BlueOriginHelpers:
             # Try form submission
             try:
                 search_input.send_keys(Keys.RETURN)
-                time.sleep(2)
+                self.wait_for_dom_settle()
                 new_url = self.driver.current_url
                 self.logger.info(f"Form submission attempted, current URL: {new_url}")
             except Exception as e:
@@ -1074,13 +1581,10 @@ class BlueOriginHelpers:
             (By.CSS_SELECTOR, "input[placeholder*='search' i]")
         ]
 
+        snapshot = self.page_snapshot()
         for selector in search_selectors:
-            try:
-                search_element = self.driver.find_element(*selector)
-                if search_element.is_displayed() and search_element.is_enabled():
-                    return True
-            except NoSuchElementException:
-                continue
+            if self.find_displayed_elements(selector, snapshot=snapshot, accept=lambda element: element.is_enabled()):
+                return True
 
         return False
 
@@ -1127,6 +1631,12 @@ class BlueOriginUrls:
     CAREERS_SEARCH_URL = f"{BASE_URL}/careers/search"
     WORKDAY_URL = "https://blueorigin.wd5.myworkdayjobs.com/en-US/BlueOrigin"
 
+    @classmethod
+    def workday_url(cls):
+        """Workday careers page, served by the stand-in when WORKDAY_API_URL points at one"""
+        api_url = os.getenv("WORKDAY_API_URL")
+        return f"{api_url.rstrip('/')}/en-US/BlueOrigin" if api_url else cls.WORKDAY_URL
+
     @classmethod
     def get_all_urls(cls):
         """Get all available URLs as a dictionary"""
@@ -1134,7 +1644,7 @@ class BlueOriginUrls:
             'base': cls.BASE_URL,
             'careers': cls.CAREERS_URL,
             'careers_search': cls.CAREERS_SEARCH_URL,
-            'workday': cls.WORKDAY_URL
+            'workday': cls.workday_url()
         }
 
     @classmethod
@@ -0,0 +1,98 @@
+import os
+
+import pytest
+
+from http_cache import HttpCache
+from testing_support import FakeClock
+from workday_client import WorkdayClient
+from workday_standin import WorkdayStandIn
+
+
+class TestHttpCache:
+    """TTL, ETag revalidation and byte-bounded LRU of the shared response cache"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def standin(self):
+        with WorkdayStandIn() as server:
+            yield server
+
+    def test_repeated_lookups_are_served_from_cache(self, tmp_path, clock, standin):
+        cache = HttpCache(tmp_path, ttl=60, clock=clock)
+        client = WorkdayClient(standin.url, cache=cache)
+
+        counts = [client.job_count("software") for _ in range(5)]
+
+        assert counts == [2] * 5
+        assert len(standin.requests) == 1
+        assert cache.hits == 4
+
+    def test_streamed_pages_are_served_from_cache(self, tmp_path, clock, standin):
+        cache = HttpCache(tmp_path, ttl=60, clock=clock)
+        client = WorkdayClient(standin.url, cache=cache)
+
+        titles = [client.job_titles("engineer") for _ in range(3)]
+
+        assert titles[0] == titles[2] and titles[0]
+        assert len(standin.requests) == 1
+        assert cache.hits == 2
+
+    def test_stale_entry_is_revalidated_with_etag(self, tmp_path, clock, standin):
+        cache = HttpCache(tmp_path, ttl=60, clock=clock)
+        client = WorkdayClient(standin.url, cache=cache)
+        client.job_count()
+
+        clock.now += 61
+        assert client.job_count() == 5
+        assert cache.revalidations == 1
+
+        # A changed catalog produces a new ETag and a full response
+        standin.load(standin.postings[:3])
+        clock.now += 61
+        assert client.job_count() == 3
+        assert cache.revalidations == 1
+
+    def test_entries_are_shared_through_disk(self, tmp_path, clock, standin):
+        WorkdayClient(standin.url, cache=HttpCache(tmp_path, clock=clock)).job_count()
+        # A second process starts with an empty memory layer
+        other_worker = HttpCache(tmp_path, clock=clock)
+
+        assert WorkdayClient(standin.url, cache=other_worker).job_count() == 5
+        assert len(standin.requests) == 1
+        assert other_worker.hits == 1
+
+    def test_memory_layer_evicts_least_recently_used_by_bytes(self, tmp_path, clock):
+        cache = HttpCache(tmp_path, max_bytes=25, clock=clock)
+        cache.put("a", b"x" * 10)
+        cache.put("b", b"x" * 10)
+        cache.get("a")
+        cache.put("c", b"x" * 10)
+
+        assert list(cache._entries) == ["a", "c"]
+
+    def test_disk_store_is_bounded(self, tmp_path, clock):
+        cache = HttpCache(tmp_path, max_bytes=1000, clock=clock)
+        for index in range(20):
+            cache.put(f"key{index}", os.urandom(200))
+
+        assert sum(path.stat().st_size for path in tmp_path.glob("*.json")) <= 1000
+        assert (tmp_path / "key19.json").exists()
+
+    def test_disk_store_is_scanned_only_when_over_budget(self, tmp_path, clock, monkeypatch):
+        cache = HttpCache(tmp_path, max_bytes=5000, clock=clock)
+        scans = []
+        evict = cache._evict_from_disk
+        monkeypatch.setattr(cache, "_evict_from_disk", lambda: scans.append(1) or evict())
+
+        for index in range(10):
+            cache.put(f"key{index}", os.urandom(200))
+        # Only the first write has to learn the size of the store
+        assert len(scans) == 1
+
+        for index in range(10, 30):
+            cache.put(f"key{index}", os.urandom(200))
+        assert 1 < len(scans) < 10
+        assert sum(path.stat().st_size for path in tmp_path.glob("*.json")) <= 5000
@@ -0,0 +1,56 @@
+from job_details import JobDetailFetcher
+from workday_client import WorkdayClient
+from workday_standin import SAMPLE_POSTINGS, WorkdayStandIn
+
+
+def recorded_detail(posting, **overrides):
+    info = {"title": posting["title"], "location": posting["locationsText"], "postedOn": posting["postedOn"],
+            "jobReqId": posting["bulletFields"][0], "jobDescription": "<p>Build &amp; test <b>rockets</b></p>"}
+    info.update(overrides)
+    return {"jobPostingInfo": info}
+
+
+class TestJobDetailFetcher:
+    """Concurrent detail fetch and list/detail diff against the stand-in"""
+
+    def run_against(self, details, postings=SAMPLE_POSTINGS, listed=None):
+        with WorkdayStandIn(postings, details=details) as standin:
+            client = WorkdayClient(standin.url, pool_size=4)
+            fetcher = JobDetailFetcher(client, concurrency=4)
+            mismatches = fetcher.run(listed)
+            client.close()
+        return mismatches, standin
+
+    def test_matching_details_produce_no_report(self):
+        details = {posting["externalPath"]: recorded_detail(posting) for posting in SAMPLE_POSTINGS}
+        mismatches, standin = self.run_against(details)
+
+        assert mismatches == []
+        assert standin.connections <= 4
+        assert JobDetailFetcher.format_report(mismatches) == "Job details match the job list"
+
+    def test_differing_fields_are_reported(self):
+        details = {posting["externalPath"]: recorded_detail(posting) for posting in SAMPLE_POSTINGS}
+        details[SAMPLE_POSTINGS[1]["externalPath"]] = recorded_detail(SAMPLE_POSTINGS[1], title="Staff Engineer")
+        details[SAMPLE_POSTINGS[3]["externalPath"]] = recorded_detail(SAMPLE_POSTINGS[3], postedOn="Posted Today")
+
+        mismatches, _ = self.run_against(details)
+
+        assert [(m["requisition_id"], m["field"]) for m in mismatches] == [("R12002", "title"), ("R12004", "posted")]
+        report = JobDetailFetcher.format_report(mismatches)
+        assert report.splitlines()[0] == "2 job detail mismatches:"
+        assert "R12002: list 'Senior Software Engineer - Ground Systems' != detail 'Staff Engineer'" in report
+
+    def test_multi_location_listing_is_not_a_mismatch(self):
+        posting = dict(SAMPLE_POSTINGS[0], locationsText="3 Locations")
+        mismatches, _ = self.run_against({posting["externalPath"]: recorded_detail(SAMPLE_POSTINGS[0])}, [posting])
+
+        assert mismatches == []
+
+    def test_missing_detail_is_reported(self):
+        # Listed, but the job was removed before its detail was fetched
+        posting = dict(SAMPLE_POSTINGS[0], externalPath="/job/Kent-WA/Removed-Job_R99999")
+        mismatches, _ = self.run_against({}, listed=[posting])
+
+        assert mismatches == [{"requisition_id": "R99999", "path": posting["externalPath"], "field": "fetch",
+                               "list": None, "detail": None}]
@@ -0,0 +1,76 @@
+import pytest
+
+from job_snapshot import BLUEORIGIN, WORKDAY, JobSnapshotStore
+from testing_support import FakeClock
+from workday_client import WorkdayClient
+from workday_standin import WorkdayStandIn
+
+
+def make_posting(number, title="Structural Design Engineer III - New Glenn"):
+    slug = title.replace(" ", "-")
+    return {"title": title, "externalPath": f"/job/Seattle-WA/{slug}_R{number}", "locationsText": "Seattle, WA"}
+
+
+class TestJobSnapshotStore:
+    """Incremental catalog sync keyed by requisition ID"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def store(self, tmp_path, clock):
+        store = JobSnapshotStore(tmp_path / "snapshot.sqlite", clock=clock)
+        yield store
+        store.close()
+
+    def test_requisition_id_from_job_urls(self):
+        assert JobSnapshotStore.requisition_id(
+            "/job/Seattle-WA/Structural-Design-Engineer-III---New-Glenn_R53757") == "R53757"
+        assert JobSnapshotStore.requisition_id(
+            "https://blueorigin.wd5.myworkdayjobs.com/en-US/BlueOrigin/job/Kent-WA/Engineer_R50001-1?source=x") == "R50001"
+        assert JobSnapshotStore.requisition_id("https://www.blueorigin.com/careers/search") is None
+
+    def test_sync_applies_only_the_delta(self, store):
+        first = store.sync(WORKDAY, [JobSnapshotStore.workday_record(make_posting(n)) for n in (1, 2, 3)])
+        second = store.sync(WORKDAY, [JobSnapshotStore.workday_record(make_posting(n)) for n in (2, 3, 4)])
+
+        assert first == {"added": ["R1", "R2", "R3"], "removed": [], "total": 3}
+        assert second == {"added": ["R4"], "removed": ["R1"], "total": 3}
+        assert store.requisitions(WORKDAY) == {"R2", "R3", "R4"}
+
+    def test_partial_listing_never_removes(self, store):
+        store.sync(BLUEORIGIN, [{"requisition_id": "R1", "title": "A", "url": "u1", "location": ""}])
+        delta = store.sync(BLUEORIGIN, [{"requisition_id": "R2", "title": "B", "url": "u2", "location": ""}],
+                           complete=False)
+
+        assert delta["removed"] == []
+        assert store.requisitions(BLUEORIGIN) == {"R1", "R2"}
+
+    def test_diff_between_sources(self, store):
+        store.sync(WORKDAY, [JobSnapshotStore.workday_record(make_posting(n)) for n in (1, 2)])
+        store.sync(BLUEORIGIN, [{"requisition_id": rid, "title": "", "url": "", "location": ""} for rid in ("R2", "R9")])
+
+        assert store.diff(WORKDAY, BLUEORIGIN) == {"only_in_workday": ["R1"], "only_in_blueorigin": ["R9"]}
+
+    def test_refresh_crawls_only_when_stale_and_changed(self, store, clock):
+        with WorkdayStandIn([make_posting(n) for n in range(30)]) as standin:
+            client = WorkdayClient(standin.url)
+
+            assert store.refresh_workday(client)["total"] == 30
+            crawl_requests = len(standin.requests)
+
+            # Fresh snapshot: no requests at all
+            assert store.refresh_workday(client) is None
+            assert len(standin.requests) == crawl_requests
+
+            # Stale but unchanged: only the count request
+            clock.now += JobSnapshotStore.MAX_AGE_SECONDS + 1
+            assert store.refresh_workday(client) is None
+            assert len(standin.requests) == crawl_requests + 1
+
+            # Stale and changed: crawl again and apply the delta
+            standin.load(standin.postings + [make_posting(99)])
+            clock.now += JobSnapshotStore.MAX_AGE_SECONDS + 1
+            assert store.refresh_workday(client)["added"] == ["R99"]
+            client.close()
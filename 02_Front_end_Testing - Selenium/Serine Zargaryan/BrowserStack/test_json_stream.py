@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from json_stream import JsonArrayStream
+from testing_support import make_postings
+from workday_client import WorkdayClient
+from workday_standin import WorkdayStandIn
+
+
+def escaped_postings(count):
+    # Quotes, brackets, braces and non-ASCII text that must survive any chunk boundary
+    return make_postings(count, title='Engineer {i} ["Propulsion"] {{Kent}}', locationsText="Kent, WA – HQ")
+
+
+def chunked(data, size):
+    return (data[start:start + size] for start in range(0, len(data), size))
+
+
+class TestJsonArrayStream:
+    """Incremental jobPostings parsing over arbitrary chunk boundaries"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 100000])
+    def test_items_and_fields_survive_any_chunking(self, chunk_size):
+        document = {"total": 12345, "jobPostings": escaped_postings(30), "facets": [{"facetParameter": "locations"}]}
+        stream = JsonArrayStream(chunked(json.dumps(document, ensure_ascii=False).encode("utf-8"), chunk_size),
+                                 "jobPostings")
+
+        assert list(stream) == document["jobPostings"]
+        assert stream.fields == {"total": 12345, "facets": document["facets"]}
+
+    def test_items_are_yielded_before_the_document_ends(self):
+        def chunks():
+            yield b'{"total": 2, "jobPostings": [{"title": "First"}, '
+            raise AssertionError("read past the first posting")
+
+        stream = iter(JsonArrayStream(chunks(), "jobPostings"))
+
+        assert next(stream) == {"title": "First"}
+
+    def test_buffer_stays_flat_for_large_pages(self):
+        def chunks(count):
+            yield b'{"total": %d, "jobPostings": [' % count
+            for index in range(count):
+                yield (b"," if index else b"") + json.dumps(escaped_postings(1)[0]).encode("utf-8")
+            yield b"]}"
+
+        small = JsonArrayStream(chunks(10), "jobPostings")
+        large = JsonArrayStream(chunks(20000), "jobPostings")
+
+        assert sum(1 for _ in small) == 10
+        assert sum(1 for _ in large) == 20000
+        assert large.max_buffered <= small.max_buffered * 2
+
+    def test_truncated_document_raises(self):
+        with pytest.raises(json.JSONDecodeError):
+            list(JsonArrayStream([b'{"total": 1, "jobPostings": [{"title": "Fir'], "jobPostings"))
+
+
+class TestWorkdayClientStreaming:
+    """stream_search against the stand-in server"""
+
+    def test_stream_search_yields_postings_and_total(self):
+        with WorkdayStandIn(escaped_postings(500), page_limit=500) as standin:
+            client = WorkdayClient(standin.url, page_limit=500)
+            page = client.stream_search(limit=500)
+            postings = list(page)
+            # The connection went back to the pool and is reused
+            assert client.job_count() == 500
+            client.close()
+
+        assert postings == escaped_postings(500)
+        assert page.fields["total"] == 500
+        assert standin.connections == 1
+
+    def test_abandoned_stream_does_not_return_its_connection(self):
+        with WorkdayStandIn(escaped_postings(500), page_limit=500) as standin:
+            client = WorkdayClient(standin.url, page_limit=500)
+            stream = iter(client.stream_search(limit=500))
+            next(stream)
+            stream.close()
+
+            assert client.job_count() == 500
+            client.close()
+
+        assert standin.connections == 2
@@ -0,0 +1,90 @@
+from job_snapshot import JobSnapshotStore
+from keyword_sweep import INJECTION_KEYWORDS, KeywordCorpus, KeywordSweep
+from search_oracle import SearchOracle
+from workday_client import WorkdayClient
+from workday_standin import SAMPLE_POSTINGS, WorkdayStandIn
+
+
+class FakeHelpers:
+    """Records the browser searches an escalation performs"""
+
+    def __init__(self, counts):
+        self.counts = counts
+        self.searches = []
+
+    def open_url(self, url):
+        pass
+
+    def handle_cookie_consent(self):
+        return True
+
+    def search_for_keyword(self, keyword):
+        self.searches.append(keyword)
+        return True
+
+    def wait_for_dom_settle(self):
+        return True
+
+    def get_search_results_count(self):
+        return self.counts.get(self.searches[-1], 0)
+
+
+class TestKeywordSweep:
+    """Keyword corpus generation and API sweep against the stand-in server"""
+
+    def test_corpus_is_large_unique_and_reproducible(self):
+        corpus = KeywordCorpus(["software", "engineer"], seed=7).build(10000)
+
+        assert len(corpus) == len(set(corpus))
+        assert len(corpus) > 1000
+        assert corpus == KeywordCorpus(["software", "engineer"], seed=7).build(10000)
+        assert "  software engineer @@ ##  " in corpus
+        assert "123" in corpus
+
+    def test_sweep_reports_only_discrepancies(self):
+        oracle = SearchOracle(JobSnapshotStore.workday_record(posting) for posting in SAMPLE_POSTINGS)
+        keywords = ["software", "engineer", "software engineer", "eng", "123"] + INJECTION_KEYWORDS[:3]
+
+        with WorkdayStandIn() as standin:
+            client = WorkdayClient(standin.url, pool_size=4)
+            discrepancies = KeywordSweep(client, oracle, concurrency=4).run(keywords)
+            client.close()
+
+        # Both sides see the same catalog, so what disagrees is where the oracle models the search wrongly:
+        # the stand-in matches word prefixes and drops punctuation
+        assert sorted(discrepancies, key=lambda item: item["keyword"]) == [
+            {"keyword": "  software engineer @@ ##  ", "expected": 0, "observed": 2},
+            {"keyword": "eng", "expected": 0, "observed": 3}
+        ]
+        assert len(standin.requests) == len(keywords)
+
+    def test_sweep_of_a_recorded_catalog_shows_the_oracle_gaps(self, tmp_path):
+        recording = tmp_path / "recording.json"
+        described = {SAMPLE_POSTINGS[2]["externalPath"]: {"jobPostingInfo": {
+            "jobDescription": "<p>Hot-fire testing of <b>BE-4</b> engines</p>"}}}
+        with WorkdayStandIn(details=described) as live:
+            WorkdayStandIn.record(WorkdayClient(live.url), recording)
+
+        # As in the keyword_discrepancies fixture: the snapshot and the search both come from the recording
+        with WorkdayStandIn.from_recording(recording) as standin:
+            client = WorkdayClient(standin.url, pool_size=4)
+            store = JobSnapshotStore(tmp_path / "snapshot.sqlite")
+            store.refresh_workday(client)
+            oracle = SearchOracle.from_snapshot(store)
+            discrepancies = KeywordSweep(client, oracle, concurrency=4).run(["kent", "hot fire", "manufactur", "kent wa"])
+            store.close()
+            client.close()
+
+        assert discrepancies == [
+            {"keyword": "hot fire", "expected": 0, "observed": 1},
+            {"keyword": "manufactur", "expected": 0, "observed": 1}
+        ]
+
+    def test_only_discrepancies_reach_the_browser(self):
+        discrepancies = [{"keyword": f"kw{i}", "expected": 0, "observed": 1} for i in range(50)]
+        helpers = FakeHelpers({"kw0": 1})
+
+        escalated = KeywordSweep.escalate(helpers, discrepancies, "https://example.test", limit=5)
+
+        assert helpers.searches == ["kw0", "kw1", "kw2", "kw3", "kw4"]
+        assert escalated[0] == {"keyword": "kw0", "expected": 0, "observed": 1, "browser": 1}
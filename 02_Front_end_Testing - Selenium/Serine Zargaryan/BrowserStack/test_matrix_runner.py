@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from matrix_runner import MatrixRunner, MatrixSummary, parse_caps, split_browser
+from testing_support import FakeItem
+
+
+class FakeReport:
+    def __init__(self, nodeid, when, outcome):
+        self.nodeid = nodeid
+        self.when = when
+        self.failed = outcome == "failed"
+        self.skipped = outcome == "skipped"
+
+
+class FakeDurations:
+    def estimate(self, nodeid):
+        return 10.0
+
+
+class TestMatrixRunner:
+    """Grouping browser variants into concurrent per-browser worker groups"""
+
+    def test_caps(self):
+        assert parse_caps("chrome=2, EDGE=3") == {"chrome": 2, "firefox": 1, "edge": 3, "shared": 1}
+        assert parse_caps(None, default=5)["firefox"] == 5
+        with pytest.raises(ValueError, match="safari=1"):
+            parse_caps("safari=1")
+        with pytest.raises(ValueError):
+            parse_caps("chrome=0")
+
+    @pytest.mark.parametrize("nodeid, expected", [
+        ("test_a.py::TestA::test_x[chrome]", ("test_a.py::TestA::test_x", "chrome")),
+        ("test_a.py::test_y[edge-0]", ("test_a.py::test_y[0]", "edge")),
+        ("test_a.py::test_z[1-2]", ("test_a.py::test_z[1-2]", None)),
+        ("test_a.py::test_w", ("test_a.py::test_w", None)),
+    ])
+    def test_split_browser(self, nodeid, expected):
+        assert split_browser(nodeid) == expected
+
+    def test_each_browser_gets_its_own_capped_workers(self):
+        items = [FakeItem(f"t.py::test_{name}[{browser}]", browser)
+                 for name in "abcd" for browser in ("chrome", "firefox", "edge")]
+        items.append(FakeItem("t.py::test_unit"))
+        runner = MatrixRunner(None, parse_caps("chrome=2,firefox=1,edge=8"), "unused", durations=FakeDurations())
+
+        shards = runner.shard_items(items)
+
+        browsers = [{item.callspec.params["browser"] if hasattr(item, "callspec") else "shared" for item in shard}
+                    for shard in shards]
+        assert browsers == [{"chrome"}, {"chrome"}, {"firefox"}, {"edge"}, {"edge"}, {"edge"}, {"edge"}, {"shared"}]
+        assert sorted(len(shard) for shard in shards[:2]) == [2, 2]
+        assert sum(len(shard) for shard in shards) == len(items)
+
+
+class TestMatrixSummary:
+    """Outcomes of each test's browser variants, grouped by test ID"""
+
+    def test_outcomes_are_grouped_by_test_id(self, tmp_path):
+        summary = MatrixSummary(tmp_path / "browser_matrix.json")
+        phases = {
+            "chrome": [("setup", "passed"), ("call", "passed"), ("teardown", "passed")],
+            "firefox": [("setup", "passed"), ("call", "failed"), ("teardown", "passed")],
+            "edge": [("setup", "failed"), ("teardown", "passed")],
+        }
+        for browser, reports in phases.items():
+            for when, outcome in reports:
+                summary.pytest_runtest_logreport(FakeReport(f"t.py::test_search[{browser}]", when, outcome))
+                summary.pytest_runtest_logreport(FakeReport(f"t.py::test_home[{browser}]", when, "passed"))
+        summary.pytest_runtest_logreport(FakeReport("t.py::test_unit", "call", "passed"))
+
+        assert summary.results == {
+            "t.py::test_home": {"chrome": "passed", "firefox": "passed", "edge": "passed"},
+            "t.py::test_search": {"chrome": "passed", "firefox": "failed", "edge": "error"},
+        }
+        lines = summary.format_lines()
+        assert not lines[0].endswith("differs across browsers")
+        assert lines[1].endswith("<- differs across browsers")
+
+        summary.save()
+        assert json.loads((tmp_path / "browser_matrix.json").read_text()) == summary.results
@@ -0,0 +1,101 @@
+import pytest
+
+from navigation_state import NavigationState, NavigationStateCache
+from testing_support import FakeCdpDriver, FakeDriver
+
+
+class FakeHelpers:
+    def __init__(self, driver, browser_name="chrome"):
+        self.driver = driver
+        self.browser_name = browser_name
+
+    def wait_for_page_load(self):
+        pass
+
+
+SEARCH_URL = "https://www.blueorigin.com/careers/search"
+
+
+class TestNavigationStateCache:
+    """Building, capturing and restoring navigation prefixes"""
+
+    @pytest.fixture
+    def calls(self):
+        return []
+
+    @pytest.fixture
+    def states(self, calls):
+        def open_search(helpers):
+            calls.append("open")
+            helpers.driver.get(SEARCH_URL)
+            helpers.driver.add_cookie({"name": "OptanonAlertBoxClosed", "value": "now", "path": "/"})
+            helpers.driver.execute_script(NavigationStateCache.STORAGE_WRITE_SCRIPT, {"consent": "1"}, {})
+            helpers.driver._consent_seeded_domains = {"www.blueorigin.com"}
+            return True
+
+        def search(helpers):
+            calls.append("search")
+            helpers.driver.get(f"{SEARCH_URL}?query=software")
+            helpers.driver.execute_script(NavigationStateCache.STORAGE_WRITE_SCRIPT, {}, {"query": "software"})
+            return True
+
+        search_page = NavigationState("search_page", build=open_search)
+        return search_page, NavigationState("search_page:software", build=search, parent=search_page)
+
+    def test_state_is_built_once_and_restored_into_other_drivers(self, states, calls):
+        cache = NavigationStateCache()
+        _, software = states
+
+        assert cache.enter(software, FakeHelpers(FakeDriver()))
+        assert calls == ["open", "search"]
+
+        driver = FakeDriver()
+        assert cache.enter(software, FakeHelpers(driver))
+        assert calls == ["open", "search"]
+        assert driver.current_url == f"{SEARCH_URL}?query=software"
+        assert [cookie["name"] for cookie in driver.get_cookies()] == ["OptanonAlertBoxClosed"]
+        assert driver.storage["https://www.blueorigin.com"] == ({"consent": "1"}, {"query": "software"})
+        assert driver._consent_seeded_domains == {"www.blueorigin.com"}
+        assert cache.stats == {"built": 2, "restored": 1, "rebuilt": 0}
+
+    def test_captures_are_per_browser_and_prefixes_are_shared(self, states, calls):
+        cache = NavigationStateCache()
+        search_page, software = states
+
+        cache.enter(search_page, FakeHelpers(FakeDriver()))
+        cache.enter(software, FakeHelpers(FakeDriver()))
+        cache.enter(software, FakeHelpers(FakeDriver(), browser_name="firefox"))
+
+        # The second test restored the search page and only ran the search itself
+        assert calls == ["open", "search", "open", "search"]
+
+    def test_restored_state_that_does_not_verify_is_navigated_instead(self, calls):
+        cache = NavigationStateCache()
+        builds = []
+        state = NavigationState(
+            "search_page",
+            build=lambda helpers: builds.append(helpers.driver.get(SEARCH_URL)) is None,
+            verify=lambda helpers: False
+        )
+
+        cache.enter(state, FakeHelpers(FakeDriver()))
+        assert cache.enter(state, FakeHelpers(FakeDriver()))
+        assert cache.enter(state, FakeHelpers(FakeDriver()))
+
+        assert len(builds) == 3
+        assert cache.stats == {"built": 3, "restored": 0, "rebuilt": 1}
+
+    def test_cdp_cookies_are_restored_without_loading_the_site(self):
+        cache = NavigationStateCache()
+        source = FakeCdpDriver()
+        source.cdp_cookies.append({"name": "OptanonConsent", "value": "groups", "domain": ".blueorigin.com",
+                                   "path": "/", "secure": True})
+        state = NavigationState("search_page", build=lambda helpers: helpers.driver.get(SEARCH_URL) is None)
+        cache.enter(state, FakeHelpers(source))
+
+        target = FakeCdpDriver()
+        assert cache.enter(state, FakeHelpers(target))
+
+        assert target.visited == [SEARCH_URL]
+        assert target.cdp_cookies == [{"name": "OptanonConsent", "value": "groups", "domain": ".blueorigin.com",
+                                       "path": "/", "secure": True}]
@@ -0,0 +1,97 @@
+import json
+
+from page_data import EmbeddedPageData
+from test_helpers import BlueOriginHelpers
+from testing_support import FakeDriver
+
+PAGE_URL = "https://www.blueorigin.com/careers/search?q=engineer"
+
+NEXT_DATA = {
+    "page": "/careers/search",
+    "query": {"q": "engineer"},
+    "props": {"pageProps": {
+        "filters": [{"name": "Kent, WA"}, {"name": "Seattle, WA"}, {"name": "Van Horn, TX"}, {"name": "Denver, CO"}],
+        "navigation": [{"title": "Careers", "url": "/careers"}, {"title": "Benefits", "url": "/careers/benefits"},
+                       {"title": "Locations", "url": "/careers/locations"}, {"title": "Search", "url": "/careers/search"}],
+        "results": {
+            "total": 57,
+            "jobs": [
+                {"title": "Software Engineer II - Flight Software", "absolute_url": "/careers/job/R12001",
+                 "location": {"name": "Seattle, WA"}},
+                {"title": "Senior Software Engineer - Ground Systems", "absolute_url": "/careers/job/R12002",
+                 "location": {"name": "Kent, WA"}}
+            ]
+        }
+    }}
+}
+
+COUNTER_PAGE = '<html><body><div class="JobBoardJobCount_count__2Yol3">Showing jobs 1 – 2 of 57</div></body></html>'
+
+PAGE_TEXT = "Careers Benefits Locations Search\n57 JOBS\nSoftware Engineer II - Flight Software\nSeattle, WA\nSenior Software Engineer -  Ground Systems"
+
+
+class TestEmbeddedPageData:
+    """Job list and total from __NEXT_DATA__ instead of the DOM"""
+
+    def test_job_list_and_total_are_found(self):
+        page_data = EmbeddedPageData(NEXT_DATA, PAGE_URL)
+
+        assert page_data.total() == 57
+        assert page_data.jobs()[0] == {"title": "Software Engineer II - Flight Software",
+                                       "href": "https://www.blueorigin.com/careers/job/R12001",
+                                       "location": "Seattle, WA"}
+
+    def test_navigation_lists_are_not_job_lists(self):
+        # Longer than the job list, with titles and URLs that are all shown on the page
+        page_data = EmbeddedPageData({"props": {"pageProps": {k: v for k, v in NEXT_DATA["props"]["pageProps"].items()
+                                                               if k != "results"}}}, PAGE_URL)
+
+        assert page_data.jobs() == []
+        assert page_data.total() is None
+        assert EmbeddedPageData({"jobs": [{"title": "Propulsion Test Technician", "requisitionId": "R12003"}]}).total() is None
+
+    def test_script_tag_is_read_from_page_source(self):
+        source = f'<html><script id="__NEXT_DATA__" type="application/json">{json.dumps(NEXT_DATA)}</script></html>'
+
+        assert EmbeddedPageData.from_html(source, PAGE_URL).total() == 57
+        assert EmbeddedPageData.from_html("<html></html>") is None
+
+    def test_data_from_before_a_client_side_search_is_not_current(self):
+        page_data = EmbeddedPageData(NEXT_DATA, PAGE_URL)
+
+        assert page_data.is_current(PAGE_URL, PAGE_TEXT)
+        assert not page_data.is_current("https://www.blueorigin.com/careers/search?q=manager")
+        assert not page_data.is_current(PAGE_URL, "3 JOBS\nProgram Manager - Lunar Permanence")
+
+    def test_filtered_results_overlapping_the_stale_list_are_not_current(self):
+        # A client-side search for "ground" that keeps a job from the unfiltered list on screen
+        page_data = EmbeddedPageData(NEXT_DATA, PAGE_URL)
+        filtered_text = "1 JOBS\nSenior Software Engineer - Ground Systems\nKent, WA"
+
+        assert not page_data.is_current(PAGE_URL, filtered_text)
+        assert not page_data.is_current(PAGE_URL, PAGE_TEXT.replace("57 JOBS", "1 JOBS"))
+
+    def test_results_count_comes_from_one_script_call(self):
+        driver = FakeDriver(current_url=PAGE_URL,
+                            script_results={EmbeddedPageData.READ_SCRIPT: [json.dumps(NEXT_DATA), PAGE_TEXT]})
+        helpers = BlueOriginHelpers(driver)
+
+        assert helpers.get_search_results_count() == 57
+        assert driver.scripts == 1
+
+    def test_missing_page_data_falls_back_to_the_dom(self):
+        helpers = BlueOriginHelpers(FakeDriver(current_url=PAGE_URL,
+                                               script_results={EmbeddedPageData.READ_SCRIPT: [None, PAGE_TEXT]}))
+
+        assert helpers.read_embedded_job_list() is None
+
+    def test_list_without_a_total_falls_back_to_the_results_counter(self):
+        # The embedded list is one page of results; its length is not the result count
+        results = {"jobs": NEXT_DATA["props"]["pageProps"]["results"]["jobs"]}
+        data = dict(NEXT_DATA, props={"pageProps": {"results": results}})
+        driver = FakeDriver(COUNTER_PAGE, current_url=PAGE_URL,
+                            script_results={EmbeddedPageData.READ_SCRIPT: [json.dumps(data), PAGE_TEXT]})
+        helpers = BlueOriginHelpers(driver)
+
+        assert helpers.read_embedded_job_list()["total"] is None
+        assert helpers.get_search_results_count() == 57
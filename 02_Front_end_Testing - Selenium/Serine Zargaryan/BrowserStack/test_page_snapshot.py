@@ -0,0 +1,129 @@
+import pytest
+from selenium.webdriver.common.by import By
+
+from page_snapshot import PageSnapshot, UnsupportedSelector
+from test_helpers import BlueOriginHelpers, BlueOriginLocators
+from testing_support import FakeDriver
+
+PAGE = """<!DOCTYPE html>
+<html><head><title>Careers | Blue Origin</title><script>var template = "<div class='job'>";</script></head>
+<body>
+<span class="HeaderLogo_headerLogo__2vsJe"><a id="header-logo" href="/"><img alt="Blue Origin | Careers"></a></span>
+<h1>Join Blue Origin</h1>
+<form>
+  <input class="JobBoardSearch_input__Y3mFB" type="text" placeholder="Search Jobs">
+  <input type="hidden" name="token" value="x">
+  <button type="submit" class="JobBoardSearch_submitButton__SWZ48"><svg><title>Search</title></svg></button>
+</form>
+<p class="JobBoardJobCount_count__2Yol3">Showing jobs 1 – 2 of 57</p>
+<ul>
+  <li class="JobBoardListItem_title___2_Sp"><a href="/careers/job/R12001">Propulsion &amp; Test Engineer</a></li>
+  <li class="JobBoardListItem_title___2_Sp" style="display: none"><a href="/careers/job/R12002">Filled Role</a></li>
+</ul>
+<button disabled>Accept Cookies</button>
+</body></html>
+"""
+
+
+class TestPageSnapshot:
+    """CSS/XPath subset, text and regex queries over one parsed DOM"""
+
+    @pytest.fixture
+    def snapshot(self):
+        return PageSnapshot(PAGE)
+
+    @pytest.mark.parametrize("selector, expected", [
+        (BlueOriginLocators.RESULTS_COUNT, ["Showing jobs 1 – 2 of 57"]),
+        ((By.CSS_SELECTOR, ".JobBoardListItem_title___2_Sp a"), ["Propulsion & Test Engineer", "Filled Role"]),
+        ((By.CSS_SELECTOR, "span > a#header-logo, h1"), ["", "Join Blue Origin"]),
+        ((By.CSS_SELECTOR, "input[placeholder*='search' i]"), [""]),
+        ((By.XPATH, "//button[.//title[text()='Search']]"), ["Search"]),
+        ((By.XPATH, "//button[@type='submit' and contains(@class, 'JobBoardSearch_submitButton')]"), ["Search"]),
+        ((By.XPATH, "//img[contains(@alt, 'Blue Origin') and contains(@alt, 'Careers')]/.."), [""]),
+        ((By.XPATH, "//button[contains(text(), 'Accept') or contains(text(), 'OK')]"), ["Accept Cookies"]),
+        ((By.XPATH, "//div[contains(@class, 'job')]"), []),
+        ((By.TAG_NAME, "li"), ["Propulsion & Test Engineer", "Filled Role"]),
+        ((By.XPATH, "//li[1]"), ["Propulsion & Test Engineer"])
+    ])
+    def test_locators_match_like_the_browser(self, snapshot, selector, expected):
+        assert [node.text for node in snapshot.find_elements(*selector)] == expected
+
+    def test_visibility_and_state_are_approximated_statically(self, snapshot):
+        listings = snapshot.select(".JobBoardListItem_title___2_Sp a")
+
+        assert [listing.is_displayed() for listing in listings] == [True, False]
+        assert not snapshot.find_element(By.NAME, "token").is_displayed()
+        assert not snapshot.find_element(By.XPATH, "//button[contains(text(), 'Accept')]").is_enabled()
+
+    def test_hidden_means_no_stylesheet_can_show_the_element(self):
+        snapshot = PageSnapshot("""<div aria-hidden="true"><img id="logo" alt="Blue Origin"></div>
+<div hidden><p id="attribute">A</p></div>
+<div style="display: none"><p id="display">B</p></div>
+<div style="visibility: hidden"><p id="inherited">C</p><p id="override" style="visibility: visible">D</p></div>
+<input id="token" type="hidden">""")
+
+        hidden = {node.attrs["id"]: node.is_hidden() for node in snapshot.select("[id]")}
+
+        assert hidden == {"logo": False, "attribute": True, "display": True, "inherited": True, "override": False,
+                          "token": True}
+
+    def test_text_and_regex_checks(self, snapshot):
+        assert snapshot.title == "Careers | Blue Origin"
+        assert "Join Blue Origin\n" in snapshot.text
+        assert "<div class='job'>" not in snapshot.text
+        assert snapshot.search(r"of (\d+)</p>").group(1) == "57"
+
+    def test_positions_count_per_parent(self):
+        snapshot = PageSnapshot("<ul><li>A1</li><li>A2<ul><li>B1</li><li>B2</li></ul></li></ul><ul><li>C1</li></ul>")
+
+        assert ["".join(node.own_text) for node in snapshot.find_elements(By.XPATH, "//li[1]")] == ["A1", "B1", "C1"]
+        assert ["".join(node.own_text) for node in snapshot.find_elements(By.XPATH, "//ul/li[2]")] == ["A2", "B2"]
+        assert ["".join(node.own_text) for node in snapshot.find_elements(By.XPATH, "//ul[2]/li[1]")] == ["C1"]
+
+    def test_unsupported_locators_raise(self, snapshot):
+        with pytest.raises(UnsupportedSelector):
+            snapshot.find_elements(By.CSS_SELECTOR, "li:nth-child(2)")
+        with pytest.raises(UnsupportedSelector):
+            snapshot.find_elements(By.XPATH, "(//a)[1]")
+
+
+class TestHelpersPageSnapshot:
+    """Snapshot reuse and invalidation in BlueOriginHelpers"""
+
+    def test_unchanged_page_is_not_captured_again(self):
+        driver = FakeDriver(PAGE)
+        helpers = BlueOriginHelpers(driver)
+
+        first = helpers.page_snapshot()
+        assert helpers.verify_blue_origin_content()
+        assert helpers.check_for_search_functionality()
+        assert helpers.page_snapshot() is first
+        # One small token check per helper call; the page itself is serialized once
+        assert driver.scripts == 4
+        assert driver.captures == 1
+
+    def test_mutation_invalidates_the_snapshot(self):
+        driver = FakeDriver(PAGE)
+        helpers = BlueOriginHelpers(driver)
+        helpers.page_snapshot()
+
+        driver.mutate("<html><head><title>Maintenance</title></head><body></body></html>")
+
+        assert helpers.page_snapshot().title == "Maintenance"
+        assert not helpers.verify_blue_origin_content()
+
+    def test_visible_element_under_an_aria_hidden_ancestor_is_found(self):
+        # aria-hidden only hides the logo from assistive technology, not from the page
+        page = PAGE.replace("<title>Careers | Blue Origin</title>", "<title>Careers</title>").replace(
+            "<h1>Join Blue Origin</h1>", "").replace('<a id="header-logo"', '<a aria-hidden="true" id="header-logo"')
+        helpers = BlueOriginHelpers(FakeDriver(page))
+
+        assert helpers.find_displayed_elements((By.CSS_SELECTOR, "[alt*='Blue Origin']"))
+        assert helpers.verify_blue_origin_content()
+
+    def test_stylesheet_hidden_elements_are_not_counted_as_displayed(self):
+        helpers = BlueOriginHelpers(FakeDriver(PAGE, hidden=("JobBoardSearch_input",)))
+
+        assert helpers.snapshot_find_elements(BlueOriginLocators.SEARCH_INPUT)
+        assert not helpers.find_displayed_elements(BlueOriginLocators.SEARCH_INPUT)
+        assert not helpers.check_for_search_functionality()
@@ -0,0 +1,120 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from parallel_runner import ParallelRunner, WorkerReporter, _Worker
+from testing_support import FakeItem
+
+
+class FakeHook:
+    """Serializes reports like pytest and records the hooks the main session would see"""
+
+    def __init__(self):
+        self.calls = []
+
+    def pytest_report_to_serializable(self, config, report):
+        return report._to_json()
+
+    def pytest_report_from_serializable(self, config, data):
+        return pytest.TestReport._from_json(data)
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        self.calls.append(("start", nodeid))
+
+    def pytest_runtest_logreport(self, report):
+        self.calls.append((report.when, report.nodeid, report.outcome))
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        self.calls.append(("finish", nodeid))
+
+
+class FakeConfig:
+    def __init__(self):
+        self.hook = FakeHook()
+
+
+class FakeProcess:
+    def __init__(self, returncode):
+        self.returncode = returncode
+
+
+def make_report(item, when, outcome="passed"):
+    return pytest.TestReport(item.nodeid, item.location, {}, outcome, None, when)
+
+
+class TestParallelRunner:
+    """Worker processes, sharding and report replay"""
+
+    def test_items_are_dealt_round_robin_without_durations(self):
+        items = [FakeItem(f"t.py::test_{index}") for index in range(5)]
+
+        shards = ParallelRunner(None, 2, "unused").shard_items(items)
+
+        assert [[item.nodeid[-1] for item in shard] for shard in shards] == [["0", "2", "4"], ["1", "3"]]
+
+    def test_worker_reports_are_replayed_into_the_session(self, tmp_path):
+        config = FakeConfig()
+        item = FakeItem("t.py::test_a")
+        results_file = tmp_path / "gw0.results.jsonl"
+        results_file.write_text("", encoding="utf-8")
+        reporter = WorkerReporter(config, results_file)
+        runner = ParallelRunner(config, 1, tmp_path)
+        worker = _Worker("gw0", FakeProcess(0), [item], results_file, None)
+
+        reporter.pytest_runtest_logreport(make_report(item, "setup"))
+        # A line the worker is still writing is held back until it is complete
+        call_line = json.dumps(make_report(item, "call", "failed")._to_json()) + "\n"
+        with open(results_file, "a", encoding="utf-8") as results:
+            results.write(call_line[:40])
+        runner._replay_new_reports(worker)
+        assert config.hook.calls == [("start", "t.py::test_a"), ("setup", "t.py::test_a", "passed")]
+
+        with open(results_file, "a", encoding="utf-8") as results:
+            results.write(call_line[40:])
+        reporter.pytest_runtest_logreport(make_report(item, "teardown"))
+        runner._replay_new_reports(worker)
+        runner._report_lost_items(worker)
+
+        assert config.hook.calls[2:] == [("call", "t.py::test_a", "failed"), ("teardown", "t.py::test_a", "passed"),
+                                         ("finish", "t.py::test_a")]
+
+    def test_items_a_crashed_worker_never_finished_fail(self, tmp_path):
+        config = FakeConfig()
+        started, unstarted = FakeItem("t.py::test_a"), FakeItem("t.py::test_b")
+        runner = ParallelRunner(config, 1, tmp_path)
+        worker = _Worker("gw0", FakeProcess(-9), [started, unstarted], tmp_path / "gw0.results.jsonl",
+                         open(tmp_path / "gw0.out", "w"))
+        worker.reported = {started.nodeid: {"setup"}}
+        worker.close()
+
+        runner._report_lost_items(worker)
+
+        assert [call for call in config.hook.calls if len(call) == 3] == [
+            ("call", "t.py::test_a", "failed"), ("teardown", "t.py::test_a", "passed"),
+            ("setup", "t.py::test_b", "failed"), ("teardown", "t.py::test_b", "passed")
+        ]
+
+    def test_interrupted_run_stops_its_workers(self, tmp_path, monkeypatch):
+        runner = ParallelRunner(None, 2, tmp_path)
+        processes = []
+
+        def start_worker(worker_id, shard):
+            process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+            processes.append(process)
+            results_file = tmp_path / f"{worker_id}.results.jsonl"
+            results_file.write_text("", encoding="utf-8")
+            return _Worker(worker_id, process, shard, results_file, open(tmp_path / f"{worker_id}.out", "w"))
+
+        def interrupt(worker):
+            raise KeyboardInterrupt()
+
+        monkeypatch.setattr(runner, "_start_worker", start_worker)
+        monkeypatch.setattr(runner, "_replay_new_reports", interrupt)
+
+        with pytest.raises(KeyboardInterrupt):
+            runner.run([FakeItem("t.py::test_a"), FakeItem("t.py::test_b")])
+
+        assert len(processes) == 2
+        assert all(process.returncode is not None for process in processes)
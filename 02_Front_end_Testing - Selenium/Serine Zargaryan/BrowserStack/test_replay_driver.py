@@ -0,0 +1,201 @@
+import time
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from replay_driver import ReplayDriver, instant_waits
+from snapshot_corpus import SnapshotCorpus
+from test_helpers import BlueOriginHelpers, BlueOriginUrls, WebDriverFactory
+
+CAREERS_SEARCH_PAGE = """<!DOCTYPE html>
+<html><head><title>Search Jobs | Blue Origin</title></head>
+<body>
+<header><span class="HeaderLogo_headerLogo__2vsJe"><a id="header-logo" href="/">
+  <img alt="Blue Origin | Careers"></a></span></header>
+<input class="JobBoardSearch_input__Y3mFB" type="text" placeholder="Search Jobs">
+<p class="JobBoardJobCount_count__2Yol3">Showing jobs 1 – 3 of 573</p>
+<ul>
+  <li class="JobBoardListItem_title___2_Sp"><a href="/careers/job/R12001">Software Engineer II - Flight Software</a></li>
+  <li class="JobBoardListItem_title___2_Sp"><a href="/careers/job/R12003">Propulsion Test Technician</a></li>
+  <li class="JobBoardListItem_title___2_Sp"><a href="/careers/job/R12006">Senior Software Engineer</a></li>
+</ul>
+</body></html>
+"""
+
+WORKDAY_PAGE = """<!DOCTYPE html>
+<html><head><title>Careers at Blue Origin</title></head>
+<body>
+<p data-automation-id="jobFoundText">2 JOBS FOUND</p>
+<ul>
+  <li><h3><a data-automation-id="jobTitle" href="/en-US/BlueOrigin/job/Kent-WA/Manager_R12005">Program Manager &amp;
+      Lunar Permanence Lead</a></h3></li>
+  <li><h3><a data-automation-id="jobTitle" href="/en-US/BlueOrigin/job/Kent-WA/Engineer_R12002">Senior Software
+      Engineer - Ground Systems</a></h3></li>
+</ul>
+</body></html>
+"""
+
+# Visible and hidden variants for every locator strategy, to run the page scripts and their replay over
+SCRIPT_PAGE = """<!DOCTYPE html>
+<html><head><title>Page script check</title></head>
+<body>
+<div id="banner-hidden" style="display: none"><button class="consent" id="consent-in-banner">Accept</button></div>
+<button class="consent" id="consent-invisible" style="visibility: hidden">Accept</button>
+<button class="consent" id="consent">Accept All</button>
+<header><a id="home" href="https://www.blueorigin.com/">Home</a><h1 id="heading">Careers</h1></header>
+<form><input type="hidden" name="q" id="q-hidden" value=""><input type="search" name="q" id="q"></form>
+<ul>
+  <li class="role" id="role-filled" hidden><a href="https://www.blueorigin.com/careers/job/R12000">Filled Role</a></li>
+  <li class="role" id="role-1"><a href="https://www.blueorigin.com/careers/job/R12001">Software Engineer II</a></li>
+  <li class="role" id="role-3"><a href="https://www.blueorigin.com/careers/job/R12003">Propulsion Test Technician</a></li>
+  <li class="role" id="role-2" style="display:none">
+    <a href="https://www.blueorigin.com/careers/job/R12002">Senior Software Engineer</a></li>
+</ul>
+</body></html>
+"""
+
+STRATEGIES = [By.ID, By.CSS_SELECTOR, By.CLASS_NAME, By.TAG_NAME, By.NAME, By.XPATH, By.LINK_TEXT,
+              By.PARTIAL_LINK_TEXT]
+
+
+@pytest.fixture(scope="module")
+def headless_chrome():
+    """A local headless Chrome to run the page scripts in; tests using it skip when none can start"""
+    try:
+        driver = WebDriverFactory.create_chrome_driver(headless=True)
+    except WebDriverException as e:
+        pytest.skip(f"No local headless Chrome: {str(e)}")
+    yield driver
+    driver.quit()
+
+
+@pytest.fixture
+def script_page(tmp_path, headless_chrome):
+    """SCRIPT_PAGE loaded in the browser and in a ReplayDriver at the same URL"""
+    path = tmp_path / "script_page.html"
+    path.write_text(SCRIPT_PAGE, encoding="utf-8")
+    headless_chrome.get(path.as_uri())
+    return headless_chrome, ReplayDriver.from_html(SCRIPT_PAGE, path.as_uri())
+
+
+def describe(element):
+    return element.tag_name, element.get_dom_attribute("id"), element.text
+
+
+class TestPageScriptsAgainstReplay:
+    """ReplayDriver answers the helpers' page scripts in Python; these keep both implementations in step"""
+
+    def test_every_replay_strategy_is_handled_by_the_script(self):
+        replay = ReplayDriver.from_html(SCRIPT_PAGE)
+
+        for strategy in STRATEGIES:
+            assert f"'{strategy}'" in BlueOriginHelpers.FIND_ALL_FUNCTIONS
+            replay.find_elements(strategy, "a")
+
+    @pytest.mark.browser
+    def test_match_selectors_script_agrees_with_replay(self, script_page):
+        selectors = [[By.ID, "missing"], [By.ID, "banner-hidden"], [By.CSS_SELECTOR, "button.consent"],
+                     [By.CLASS_NAME, "role"], [By.TAG_NAME, "h1"], [By.NAME, "q"],
+                     [By.XPATH, "//a[contains(@href, 'R12002')]"], [By.LINK_TEXT, "Home"],
+                     [By.PARTIAL_LINK_TEXT, "Propulsion"], [By.CSS_SELECTOR, "li[hidden]"]]
+
+        results = [[(index, describe(element)) for element, index in
+                    driver.execute_script(BlueOriginHelpers.MATCH_SELECTORS_SCRIPT, selectors)]
+                   for driver in script_page]
+
+        assert results[0] == results[1]
+        assert [index for index, _ in results[0]] == [2, 3, 4, 5, 7, 8]
+
+    @pytest.mark.browser
+    def test_extract_listings_script_agrees_with_replay(self, script_page):
+        selectors = [[By.CSS_SELECTOR, "li.job"], [By.XPATH, "//li[@class='role']"], [By.TAG_NAME, "li"]]
+
+        results = []
+        for driver in script_page:
+            index, rows = driver.execute_script(BlueOriginHelpers.EXTRACT_LISTINGS_SCRIPT, selectors)
+            results.append((index, [(describe(element)[1], text, href, visible)
+                                    for element, text, href, visible, _ in rows]))
+
+        assert results[0] == results[1]
+        assert results[0][0] == 1
+        # Hidden listings are still read, with their text, and reported as not visible
+        assert [visible for _, _, _, visible in results[0][1]] == [False, True, True, False]
+
+
+class TestSnapshotCorpus:
+    """Content-addressed recording of page snapshots"""
+
+    def test_identical_pages_are_stored_once(self, tmp_path):
+        corpus = SnapshotCorpus(tmp_path)
+        first = corpus.record(CAREERS_SEARCH_PAGE, BlueOriginUrls.CAREERS_SEARCH_URL, label="test_a")
+        second = corpus.record(CAREERS_SEARCH_PAGE, BlueOriginUrls.CAREERS_SEARCH_URL, label="test_b")
+
+        assert first == second
+        assert len(list((tmp_path / "objects").iterdir())) == 1
+        assert [entry["label"] for entry in corpus.entries()] == ["test_a", "test_b"]
+        assert corpus.get(first) == CAREERS_SEARCH_PAGE
+
+    def test_helpers_record_new_captures_while_recording(self, tmp_path):
+        corpus = SnapshotCorpus.start_recording(tmp_path)
+        corpus.label = "test_blueorigin_positive_pytest.py::test_tc_p_002[chrome]"
+        try:
+            helpers = BlueOriginHelpers(ReplayDriver.from_html(WORKDAY_PAGE, BlueOriginUrls.WORKDAY_URL))
+            helpers.wait_for_page_load()
+            helpers.page_snapshot()
+        finally:
+            SnapshotCorpus.stop_recording()
+
+        entry = corpus.latest(url=BlueOriginUrls.WORKDAY_URL)
+        assert entry["label"].endswith("[chrome]")
+        assert len(corpus.entries()) == 1
+
+
+class TestHelpersOnReplay:
+    """BlueOriginHelpers parsing and decisions on recorded pages, without a browser"""
+
+    @pytest.fixture
+    def corpus(self, tmp_path):
+        corpus = SnapshotCorpus(tmp_path)
+        corpus.record(CAREERS_SEARCH_PAGE, BlueOriginUrls.CAREERS_SEARCH_URL)
+        corpus.record(WORKDAY_PAGE, BlueOriginUrls.WORKDAY_URL)
+        return corpus
+
+    @pytest.fixture
+    def helpers(self, corpus):
+        with instant_waits():
+            yield BlueOriginHelpers(ReplayDriver(corpus))
+
+    def test_careers_search_page(self, helpers):
+        helpers.driver.get(BlueOriginUrls.CAREERS_SEARCH_URL)
+
+        assert helpers.verify_blue_origin_content()
+        assert helpers.get_search_results_count() == 573
+        assert helpers.find_exact_job_title_in_results("Propulsion Test Technician")
+        assert not helpers.find_exact_job_title_in_results("Propulsion Test")
+
+        relevant, _ = helpers.check_keyword_relevance_in_results("software")
+        assert relevant == 2
+        assert helpers.relevance_summary["irrelevant_titles"] == ["Propulsion Test Technician"]
+        assert helpers.job_listing_records[0]["href"] == "https://www.blueorigin.com/careers/job/R12001"
+
+    def test_workday_page(self, helpers):
+        helpers.driver.get(BlueOriginUrls.WORKDAY_URL)
+
+        assert helpers.get_workday_search_results_count() == 2
+        # Regexes run over the raw recorded HTML; markup line breaks are collapsed
+        assert helpers._extract_job_title_from_page_source() == "Program Manager & Lunar Permanence Lead"
+
+    def test_replay_is_fast(self, helpers):
+        started = time.perf_counter()
+        for _ in range(20):
+            helpers.driver.get(BlueOriginUrls.CAREERS_SEARCH_URL)
+            helpers.verify_blue_origin_content()
+            helpers.get_search_results_count()
+            helpers.find_exact_job_title_in_results("Nonexistent Role")
+
+        assert time.perf_counter() - started < 2
+
+    def test_unrecorded_url_is_an_error(self, helpers):
+        with pytest.raises(WebDriverException, match="No recorded snapshot"):
+            helpers.driver.get(BlueOriginUrls.CAREERS_URL)
@@ -0,0 +1,61 @@
+from job_snapshot import WORKDAY, JobSnapshotStore
+from search_oracle import SearchOracle
+
+
+RECORDS = [
+    {"requisition_id": "R1", "title": "Software Engineer II - Flight Software", "location": "Seattle, WA"},
+    {"requisition_id": "R2", "title": "Senior Software Engineer - Ground Systems", "location": "Kent, WA"},
+    {"requisition_id": "R3", "title": "Propulsion Test Technician", "location": "Van Horn, TX"},
+    {"requisition_id": "R4", "title": "GN&C Engineer III", "location": "Kent, WA"}
+]
+
+
+class TestSearchOracle:
+    """Expected keyword search counts predicted from the job catalog"""
+
+    def test_tokenize_splits_on_punctuation(self):
+        assert SearchOracle.tokenize("GN&C Engineer III - New Glenn") == ["gn", "c", "engineer", "iii", "new", "glenn"]
+
+    def test_terms_are_combined_with_and(self):
+        oracle = SearchOracle(RECORDS)
+
+        assert oracle.predict_count("software") == 2
+        assert oracle.predict_count("Software  ENGINEER") == 2
+        assert oracle.predict_count("engineer kent") == 2
+        assert oracle.predict_count("software technician") == 0
+
+    def test_location_is_indexed(self):
+        oracle = SearchOracle(RECORDS)
+
+        assert oracle.matching_titles("gn&c") == ["GN&C Engineer III"]
+        assert oracle.predict_count("van horn") == 1
+
+    def test_symbol_only_terms_match_nothing(self):
+        oracle = SearchOracle(RECORDS)
+
+        assert oracle.predict_count("  software engineer @@ ##  ") == 0
+        assert oracle.predict_count("123") == 0
+        assert oracle.predict_count("") == 4
+
+    def test_prefix_matching(self):
+        assert SearchOracle(RECORDS, prefix=True).predict_count("eng") == 3
+        assert SearchOracle(RECORDS).predict_count("eng") == 0
+
+    def test_outliers_compare_observed_counts(self):
+        oracle = SearchOracle(RECORDS)
+        observed = {"software": 2, "engineer": 5, "technician": None}
+
+        assert oracle.outliers(observed) == [
+            {"keyword": "engineer", "expected": 3, "observed": 5},
+            {"keyword": "technician", "expected": 1, "observed": None}
+        ]
+        assert oracle.outliers(observed, tolerance=2) == [{"keyword": "technician", "expected": 1, "observed": None}]
+
+    def test_built_from_snapshot(self, tmp_path):
+        store = JobSnapshotStore(tmp_path / "snapshot.sqlite")
+        store.sync(WORKDAY, RECORDS)
+        oracle = SearchOracle.from_snapshot(store)
+
+        assert oracle.predict_count("engineer") == 3
+        assert oracle.matching_titles("test horn") == ["Propulsion Test Technician"]
+        store.close()
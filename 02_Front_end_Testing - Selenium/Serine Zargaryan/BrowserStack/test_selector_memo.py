@@ -0,0 +1,73 @@
+import json
+
+from selector_memo import SelectorMemo
+from testing_support import FakeClock
+
+SELECTORS = [("css selector", ".a"), ("css selector", ".b"), ("xpath", "//c")]
+
+
+class TestSelectorMemo:
+    """Ordering, expiry and batched saving of remembered selectors"""
+
+    def test_last_successful_selector_goes_first(self, tmp_path):
+        clock = FakeClock()
+        memo = SelectorMemo(tmp_path / "memo.json", clock=clock)
+        memo.record("LIST", "Chrome", SELECTORS[2])
+        clock.now += 1
+        memo.record("LIST", "chrome", SELECTORS[1])
+
+        assert memo.order("LIST", "chrome", SELECTORS) == [SELECTORS[1], SELECTORS[2], SELECTORS[0]]
+        # Other browsers and lists keep the original order
+        assert memo.order("LIST", "firefox", SELECTORS) == SELECTORS
+        assert memo.order("OTHER", "chrome", SELECTORS) == SELECTORS
+
+    def test_old_matches_expire(self, tmp_path):
+        clock = FakeClock()
+        memo = SelectorMemo(tmp_path / "memo.json", clock=clock)
+        memo.record("LIST", "chrome", SELECTORS[2])
+        memo.save()
+
+        clock.now += SelectorMemo.MAX_AGE_SECONDS + 1
+
+        assert memo.order("LIST", "chrome", SELECTORS) == SELECTORS
+        assert SelectorMemo(tmp_path / "memo.json", clock=clock).entries == {}
+
+    def test_records_are_written_only_on_flush(self, tmp_path):
+        path = tmp_path / "memo.json"
+        memo = SelectorMemo(path, clock=FakeClock())
+        for _ in range(3):
+            memo.record("LIST", "chrome", SELECTORS[1])
+
+        assert not path.exists()
+        memo.flush()
+        assert json.loads(path.read_text())["LIST:chrome"]["css selector=.b"]["hits"] == 3
+        assert not memo.dirty
+
+        path.unlink()
+        memo.flush()
+        assert not path.exists()
+
+    def test_save_merges_what_other_workers_wrote(self, tmp_path):
+        path = tmp_path / "memo.json"
+        clock = FakeClock()
+        worker_a = SelectorMemo(path, clock=clock)
+        worker_b = SelectorMemo(path, clock=clock)
+        worker_a.record("LIST", "chrome", SELECTORS[0])
+        worker_a.flush()
+        clock.now += 1
+        worker_b.record("LIST", "firefox", SELECTORS[2])
+        worker_b.flush()
+
+        assert set(SelectorMemo(path, clock=clock).entries) == {"LIST:chrome", "LIST:firefox"}
+
+    def test_flush_shared_saves_every_shared_memo(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(SelectorMemo, "_shared", {})
+        first = SelectorMemo.shared(tmp_path / "first.json")
+        second = SelectorMemo.shared(tmp_path / "second.json")
+        assert SelectorMemo.shared(tmp_path / "first.json") is first
+        first.record("LIST", "chrome", SELECTORS[0])
+        second.record("LIST", "edge", SELECTORS[1])
+
+        SelectorMemo.flush_shared()
+
+        assert (tmp_path / "first.json").exists() and (tmp_path / "second.json").exists()
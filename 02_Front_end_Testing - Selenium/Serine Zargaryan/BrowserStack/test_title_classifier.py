@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+from replay_driver import ReplayDriver
+from test_helpers import BlueOriginHelpers, BlueOriginUrls
+from title_classifier import TitleClassifier, fuzz_titles, legacy_is_valid_job_title
+
+
+class TestTitleClassifier:
+    """Bulk job title classification with per-title reasons"""
+
+    @pytest.fixture
+    def classifier(self):
+        return TitleClassifier()
+
+    @pytest.mark.parametrize("title, expected", [
+        ("Systems Administrator", (True, "keyword 'administrator'")),
+        ("SENIOR Propulsion Test", (True, "keyword 'senior'")),
+        ("Flight Software Avionics", (True, "multi-word title")),
+        ("Jobs", (False, "too short")),
+        ("", (False, "too short")),
+        ("Avionics", (False, "no job keyword")),
+        ("Rockets & Spacecraft", (False, "no job keyword, contains '&'")),
+    ])
+    def test_reasons(self, classifier, title, expected):
+        assert classifier.classify(title) == expected
+
+    def test_classify_all_keeps_input_order(self, classifier):
+        results = classifier.classify_all(["Lead Machinist", "Apply", "Quality Engineer"])
+
+        assert [(title, valid) for title, valid, _ in results] == [
+            ("Lead Machinist", True), ("Apply", False), ("Quality Engineer", True)
+        ]
+        assert classifier.first_title(["  Apply ", None, " Quality Engineer\n"]) == "Quality Engineer"
+
+    def test_agrees_with_the_legacy_scan_on_fuzz_corpus(self, classifier):
+        titles = fuzz_titles(20000, seed=7)
+
+        assert [valid for _, valid, _ in classifier.classify_all(titles)] == \
+            [legacy_is_valid_job_title(title) for title in titles]
+
+    def test_hundred_thousand_titles_well_under_a_second(self, classifier):
+        titles = fuzz_titles(100000)
+
+        started = time.perf_counter()
+        results = classifier.classify_all(titles)
+
+        assert len(results) == 100000
+        assert time.perf_counter() - started < 1
+
+    def test_helpers_classify_visible_titles_from_snapshot(self):
+        page = """<html><body><ul>
+          <li><a data-automation-id="jobTitle" href="/job/1">Apply</a></li>
+          <li><a data-automation-id="jobTitle" href="/job/2">Propulsion Test Technician</a></li>
+        </ul></body></html>"""
+        helpers = BlueOriginHelpers(ReplayDriver.from_html(page, BlueOriginUrls.WORKDAY_URL))
+
+        assert helpers._is_valid_job_title("Propulsion Test Technician")
+        assert not helpers._is_valid_job_title("Apply")
+        assert helpers.title_classifier.first_title(
+            node.text for node in helpers.snapshot_find_elements(("css selector", "[data-automation-id='jobTitle']"))
+        ) == "Propulsion Test Technician"
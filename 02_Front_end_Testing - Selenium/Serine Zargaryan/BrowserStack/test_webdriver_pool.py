@@ -0,0 +1,68 @@
+from test_helpers import WebDriverPool
+from testing_support import FakeDriver
+
+
+class TestWebDriverPool:
+    """Warm driver reuse keyed by browser configuration"""
+
+    def make_pool(self):
+        launched = []
+
+        def factory(browser, disable_javascript=False, headless=False):
+            launched.append((browser, headless, disable_javascript))
+            return FakeDriver(browser_name=browser)
+
+        return WebDriverPool(factory=factory), launched
+
+    def test_released_driver_is_reset_and_reused(self):
+        pool, _ = self.make_pool()
+        driver = pool.acquire("Chrome")
+        driver.get("https://www.blueorigin.com/careers")
+        driver.add_cookie({"name": "session", "value": "abc"})
+        driver.handles.append("popup")
+        pool.release(driver)
+
+        assert pool.acquire("chrome") is driver
+        assert pool.launch_count == 1
+        assert driver.handles == ["main"]
+        assert driver.cookies == {}
+        assert driver.visited[-1] == "about:blank"
+        assert driver._consent_seeded_domains == set()
+
+    def test_configurations_get_their_own_drivers(self):
+        pool, launched = self.make_pool()
+        pool.release(pool.acquire("chrome"))
+
+        pool.acquire("chrome", headless=True)
+        pool.acquire("firefox")
+
+        assert launched == [("chrome", False, False), ("chrome", True, False), ("firefox", False, False)]
+
+    def test_dead_idle_driver_is_replaced(self):
+        pool, _ = self.make_pool()
+        driver = pool.acquire("chrome")
+        pool.release(driver)
+        driver.alive = False
+
+        assert pool.acquire("chrome") is not driver
+        assert driver.quit_called
+        assert pool.launch_count == 2
+
+    def test_driver_that_cannot_be_reset_is_discarded(self):
+        pool, _ = self.make_pool()
+        driver = pool.acquire("chrome")
+        driver.alive = False
+        pool.release(driver)
+
+        assert driver.quit_called
+        assert pool.acquire("chrome") is not driver
+
+    def test_quit_all_also_quits_drivers_still_in_use(self):
+        pool, _ = self.make_pool()
+        released = pool.acquire("chrome")
+        in_use = pool.acquire("chrome")
+        pool.release(released)
+
+        pool.quit_all()
+
+        assert released.quit_called and in_use.quit_called
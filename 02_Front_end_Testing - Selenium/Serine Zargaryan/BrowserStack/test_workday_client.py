@@ -0,0 +1,58 @@
+import pytest
+
+from testing_support import make_postings
+from workday_client import WorkdayApiError, WorkdayClient
+from workday_standin import WorkdayStandIn
+
+
+class TestWorkdayClient:
+    """CXS job search client against the local stand-in server"""
+
+    @pytest.fixture
+    def standin(self):
+        with WorkdayStandIn() as server:
+            yield server
+
+    @pytest.fixture
+    def client(self, standin):
+        client = WorkdayClient(standin.url)
+        yield client
+        client.close()
+
+    def test_job_count_uses_search_text(self, client, standin):
+        assert client.job_count() == 5
+        assert client.job_count("software engineer") == 2
+        assert client.job_count("123") == 0
+        assert standin.requests[-1] == {"appliedFacets": {}, "limit": 1, "offset": 0, "searchText": "123"}
+
+    def test_titles_are_paged_in_limit_sized_requests(self):
+        with WorkdayStandIn(make_postings(45, title="Software Engineer {i}")) as standin:
+            client = WorkdayClient(standin.url)
+            titles = client.job_titles(max_results=45)
+            client.close()
+
+        assert titles == [f"Software Engineer {i}" for i in range(45)]
+        assert [(request["offset"], request["limit"]) for request in standin.requests] == [(0, 20), (20, 20), (40, 5)]
+
+    def test_applied_facets_are_sent(self, client, standin):
+        facets = {"locations": ["kent"]}
+        client.search("engineer", applied_facets=facets)
+
+        assert standin.requests[-1]["appliedFacets"] == facets
+
+    def test_connection_is_kept_alive(self, client, standin):
+        for _ in range(5):
+            client.job_count()
+
+        assert standin.connections == 1
+
+    def test_http_error_raises(self, client):
+        with pytest.raises(WorkdayApiError):
+            client.post_json("/wday/cxs/unknown/jobs", {})
+
+    def test_unreachable_server_raises(self, standin):
+        client = WorkdayClient(standin.url, timeout=1)
+        standin.stop()
+
+        with pytest.raises(WorkdayApiError):
+            client.job_count()
@@ -0,0 +1,118 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from json_stream import JsonArrayStream
+from testing_support import make_postings
+from workday_client import WorkdayApiError, WorkdayClient
+from workday_crawler import WorkdayCrawler
+from workday_standin import WorkdayStandIn
+
+
+class FakeClient:
+    """Serves pages from memory, tracking concurrency and failing the first calls for chosen offsets"""
+
+    page_limit = WorkdayClient.PAGE_LIMIT
+
+    def __init__(self, total, failures=None, delay=0.02):
+        self.postings = make_postings(total)
+        self.failures = dict(failures or {})
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def search(self, search_text, applied_facets, limit, offset):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            with self.lock:
+                if self.failures.get(offset, 0) > 0:
+                    self.failures[offset] -= 1
+                    raise WorkdayApiError("HTTP 503")
+            return {"total": len(self.postings) if offset == 0 else 0,
+                    "jobPostings": self.postings[offset:offset + limit]}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def stream_search(self, search_text, applied_facets, limit, offset):
+        response = self.search(search_text, applied_facets, limit, offset)
+        return JsonArrayStream([json.dumps(response).encode("utf-8")], "jobPostings")
+
+
+class TestWorkdayCrawler:
+    """Concurrent catalog crawl against the stand-in server and a fake client"""
+
+    def test_full_catalog_from_standin(self):
+        with WorkdayStandIn(make_postings(95)) as standin:
+            crawler = WorkdayCrawler(WorkdayClient(standin.url, pool_size=3), concurrency=3)
+            postings = crawler.crawl_all()
+            crawler.client.close()
+
+        assert sorted(posting["title"] for posting in postings) == sorted(f"Engineer {i}" for i in range(95))
+        assert len(standin.requests) == 5
+        assert standin.connections <= 3
+
+    def test_concurrency_is_bounded(self):
+        client = FakeClient(total=200)
+        postings = WorkdayCrawler(client, concurrency=3).crawl_all()
+
+        assert len(postings) == 200
+        assert client.max_active == 3
+
+    def test_failed_pages_are_retried(self):
+        client = FakeClient(total=60, failures={20: 2})
+        postings = WorkdayCrawler(client, concurrency=2, backoff=0.01).crawl_all()
+
+        assert len(postings) == 60
+
+    def test_persistent_failure_raises(self):
+        client = FakeClient(total=60, failures={40: 5})
+
+        with pytest.raises(WorkdayApiError):
+            WorkdayCrawler(client, concurrency=2, max_retries=2, backoff=0.01).crawl_all()
+
+    def test_postings_stream_before_crawl_finishes(self):
+        client = FakeClient(total=100, delay=0.05)
+
+        async def first_posting():
+            crawl = WorkdayCrawler(client, concurrency=1).crawl()
+            posting = await crawl.__anext__()
+            await crawl.aclose()
+            return posting
+
+        started = time.time()
+        assert asyncio.run(first_posting())["title"] == "Engineer 0"
+        assert time.time() - started < 0.2
+
+    def test_postings_are_passed_on_while_the_page_is_read(self):
+        client = FakeClient(total=10)
+        first_received = threading.Event()
+
+        def stream_search(search_text, applied_facets, limit, offset):
+            body = json.dumps(client.search(search_text, applied_facets, limit, offset)).encode("utf-8")
+            first_end = body.index(b"}, {") + 3
+
+            def chunks():
+                yield body[:first_end]
+                # The rest of the page only arrives once the consumer holds the first posting
+                assert first_received.wait(timeout=2)
+                yield body[first_end:]
+            return JsonArrayStream(chunks(), "jobPostings")
+
+        client.stream_search = stream_search
+
+        async def collect():
+            postings = []
+            async for posting in WorkdayCrawler(client, concurrency=1).crawl():
+                postings.append(posting)
+                first_received.set()
+            return postings
+
+        assert [posting["title"] for posting in asyncio.run(collect())] == [f"Engineer {i}" for i in range(10)]
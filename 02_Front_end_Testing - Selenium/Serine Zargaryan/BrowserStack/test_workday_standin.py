@@ -0,0 +1,119 @@
+import time
+import urllib.request
+
+import pytest
+
+from workday_client import WorkdayApiError, WorkdayClient
+from workday_crawler import WorkdayCrawler
+from workday_standin import CONSENT_COOKIE, SAMPLE_POSTINGS, WorkdayStandIn
+
+
+def fetch_page(url, cookie=None):
+    request = urllib.request.Request(url, headers={"Cookie": cookie} if cookie else {})
+    with urllib.request.urlopen(request) as response:
+        return response.read().decode("utf-8")
+
+
+class TestWorkdayStandIn:
+    """Replay, latency, error injection and the careers page shell of the local Workday stand-in"""
+
+    def test_job_detail_is_synthesized_or_replayed(self):
+        recorded = {SAMPLE_POSTINGS[0]["externalPath"]: {"jobPostingInfo": {"title": "Recorded title"}}}
+        with WorkdayStandIn(details=recorded) as standin:
+            client = WorkdayClient(standin.url)
+            assert client.job_detail(SAMPLE_POSTINGS[0]["externalPath"])["jobPostingInfo"]["title"] == "Recorded title"
+            assert client.job_detail(SAMPLE_POSTINGS[2]["externalPath"])["jobPostingInfo"]["jobReqId"] == "R12003"
+            with pytest.raises(WorkdayApiError):
+                client.job_detail("/job/Nowhere/Missing_R1")
+            client.close()
+
+    def test_search_matches_word_prefixes_in_title_location_and_description(self):
+        described = {SAMPLE_POSTINGS[2]["externalPath"]: {"jobPostingInfo": {
+            "jobDescription": "<p>Hot-fire testing of <b>BE-4</b> engines</p>"}}}
+        with WorkdayStandIn(details=described) as standin:
+            assert standin.matching("eng") == [SAMPLE_POSTINGS[0], SAMPLE_POSTINGS[1], SAMPLE_POSTINGS[2],
+                                               SAMPLE_POSTINGS[3]]
+            assert standin.matching("Hot FIRE") == [SAMPLE_POSTINGS[2]]
+            assert standin.matching("kent manager") == [SAMPLE_POSTINGS[4]]
+            # Punctuation is dropped rather than matched
+            assert standin.matching("  software engineer @@ ##  ") == SAMPLE_POSTINGS[:2]
+            assert standin.matching("@@") == SAMPLE_POSTINGS
+
+    def test_search_index_is_built_once_per_catalog(self, monkeypatch):
+        indexed = []
+        search_words = WorkdayStandIn._search_words
+
+        def counting_search_words(posting, detail):
+            indexed.append(posting)
+            return search_words(posting, detail)
+
+        monkeypatch.setattr(WorkdayStandIn, "_search_words", staticmethod(counting_search_words))
+        with WorkdayStandIn() as standin:
+            client = WorkdayClient(standin.url)
+            assert [client.job_count(keyword) for keyword in ("software", "kent", "")] == [2, 2, 5]
+            assert len(indexed) == len(SAMPLE_POSTINGS)
+
+            standin.load(SAMPLE_POSTINGS[:1])
+            assert client.job_count("software") == 1
+            assert len(indexed) == len(SAMPLE_POSTINGS) + 1
+            client.close()
+
+    def test_recording_round_trip(self, tmp_path):
+        recording = tmp_path / "recording.json"
+        with WorkdayStandIn() as live:
+            assert WorkdayStandIn.record(WorkdayClient(live.url), recording) == len(SAMPLE_POSTINGS)
+
+        with WorkdayStandIn.from_recording(recording) as replay:
+            client = WorkdayClient(replay.url)
+            assert client.job_count("software") == 2
+            assert client.job_detail(SAMPLE_POSTINGS[1]["externalPath"])["jobPostingInfo"]["title"] == \
+                SAMPLE_POSTINGS[1]["title"]
+
+    def test_latency_is_applied(self):
+        with WorkdayStandIn(latency=0.1) as standin:
+            started = time.time()
+            WorkdayClient(standin.url).job_count()
+
+        assert time.time() - started >= 0.1
+
+    def test_injected_failures_are_retried_by_the_crawler(self):
+        postings = [dict(SAMPLE_POSTINGS[0], externalPath=f"/job/Kent-WA/Engineer_R{i}") for i in range(50)]
+        with WorkdayStandIn(postings) as standin:
+            standin.fail_next(2)
+            crawled = WorkdayCrawler(WorkdayClient(standin.url), backoff=0.01).crawl_all()
+
+        assert len(crawled) == 50
+
+    def test_error_rate_is_reproducible(self):
+        def failures(seed):
+            with WorkdayStandIn(error_rate=0.5, seed=seed) as standin:
+                client = WorkdayClient(standin.url)
+                results = []
+                for _ in range(20):
+                    try:
+                        client.job_count()
+                        results.append(True)
+                    except WorkdayApiError:
+                        results.append(False)
+                return results
+
+        assert failures(3) == failures(3)
+        assert 0 < failures(3).count(False) < 20
+
+    def test_pagination_limit_enforced(self):
+        with WorkdayStandIn(page_limit=5) as standin:
+            client = WorkdayClient(standin.url)
+            with pytest.raises(WorkdayApiError):
+                client.search(limit=10)
+
+    def test_careers_page_matches_workday_locators(self):
+        with WorkdayStandIn() as standin:
+            page = fetch_page(standin.site_url)
+            search_page = fetch_page(f"{standin.site_url}?q=software", cookie=f"{CONSENT_COOKIE}=accepted")
+
+        assert 'data-automation-id="cookieAcceptButton"' in page
+        assert 'data-automation-id="keywordSearchInput"' in page
+        assert f"{len(SAMPLE_POSTINGS)} JOBS FOUND" in page
+        assert page.count('data-automation-id="jobTitle"') == len(SAMPLE_POSTINGS)
+        assert "2 JOBS FOUND" in search_page
+        assert "cookieAcceptButton" not in search_page
@@ -0,0 +1,187 @@
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+
+from navigation_state import NavigationStateCache
+from page_snapshot import PageSnapshot
+from test_helpers import BlueOriginHelpers
+
+
+def make_postings(count, title="Engineer {i}", **fields):
+    """Workday jobPostings entries R0..R{count - 1}; title is formatted with the posting number i"""
+    return [dict({"title": title.format(i=i), "externalPath": f"/job/Kent-WA/Engineer_R{i}",
+                  "bulletFields": [f"R{i}"]}, **fields) for i in range(count)]
+
+
+class FakeClock:
+    """Clock callable whose time only moves when a test sets now"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeItem:
+    """Collected test item with a node ID and an optional browser parameter"""
+
+    def __init__(self, nodeid, browser=None):
+        self.nodeid = nodeid
+        self.location = ("t.py", 0, nodeid)
+        if browser:
+            self.callspec = FakeCallSpec({"browser": browser})
+
+
+class FakeCallSpec:
+    def __init__(self, params):
+        self.params = params
+
+
+class FakeElement:
+    """A parsed node whose visibility also honours the fake page's stylesheet"""
+
+    def __init__(self, node, hidden):
+        self.node = node
+        self.hidden = hidden
+
+    @property
+    def tag_name(self):
+        return self.node.tag
+
+    @property
+    def text(self):
+        return self.node.text
+
+    def get_attribute(self, name):
+        return self.node.get_attribute(name)
+
+    def is_displayed(self):
+        return self.node.is_displayed() and not any(self.node.attrs.get("class", "").startswith(name)
+                                                    for name in self.hidden)
+
+    def is_enabled(self):
+        return self.node.is_enabled()
+
+
+class FakeDriver:
+    """Browser stand-in for unit tests: per-origin cookies and web storage, windows and a mutable page
+
+    page is served to the helpers' snapshot script and to find_elements; classes listed in hidden
+    are hidden by a stylesheet, which only the driver's elements know about. script_results maps
+    other scripts to what they return. scripts and captures count round trips and page serializations.
+    """
+
+    def __init__(self, page="", current_url="about:blank", hidden=(), script_results=None, browser_name="fake"):
+        self.page = page
+        self.version = 0
+        self.current_url = current_url
+        self.hidden = hidden
+        self.script_results = dict(script_results or {})
+        self.capabilities = {"browserName": browser_name}
+        self.cookies = {}
+        self.storage = {}
+        self.visited = []
+        self.handles = ["main"]
+        self.switch_to = self
+        self.alive = True
+        self.quit_called = False
+        self.scripts = 0
+        self.captures = 0
+
+    @property
+    def origin(self):
+        parsed = urlparse(self.current_url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    @property
+    def window_handles(self):
+        if not self.alive:
+            raise WebDriverException("Session is gone")
+        return list(self.handles)
+
+    @property
+    def page_source(self):
+        return self.page
+
+    def window(self, handle):
+        self.current_handle = handle
+
+    def close(self):
+        self.handles.remove(self.current_handle)
+
+    def quit(self):
+        self.quit_called = True
+
+    def get(self, url):
+        self.current_url = url
+        self.visited.append(url)
+
+    def mutate(self, page):
+        self.page = page
+        self.version += 1
+
+    def find_elements(self, by, value):
+        return [FakeElement(node, self.hidden) for node in PageSnapshot(self.page).find_elements(by, value)]
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element matches {value}")
+        return elements[0]
+
+    def get_cookies(self):
+        return list(self.cookies.get(self.origin, {}).values())
+
+    def add_cookie(self, cookie):
+        if self.current_url == "about:blank":
+            raise WebDriverException("Cookies need a loaded page")
+        self.cookies.setdefault(self.origin, {})[cookie["name"]] = cookie
+
+    def delete_all_cookies(self):
+        self.cookies.pop(self.origin, None)
+
+    def execute_script(self, script, *args):
+        self.scripts += 1
+        if script == BlueOriginHelpers.SNAPSHOT_SCRIPT:
+            token = f"doc:{self.version}"
+            if args and args[0] == token:
+                return [token, None]
+            self.captures += 1
+            return [token, self.page]
+        if script in self.script_results:
+            return self.script_results[script]
+
+        local, session = self.storage.setdefault(self.origin, ({}, {}))
+        if script == NavigationStateCache.STORAGE_READ_SCRIPT:
+            return [dict(local), dict(session)]
+        if script == NavigationStateCache.STORAGE_WRITE_SCRIPT:
+            local.update(args[0])
+            session.update(args[1])
+        elif "localStorage.clear" in script:
+            local.clear()
+            session.clear()
+        elif "localStorage.setItem(arguments[0], arguments[1])" in script:
+            local[args[0]] = args[1]
+        elif "localStorage" in script:
+            return dict(local)
+        return None
+
+
+class FakeCdpDriver(FakeDriver):
+    """Chrome/Edge flavour: cookies are read and written for all domains through CDP"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cdp_cookies = []
+
+    def execute_cdp_cmd(self, command, params):
+        if command == "Network.getAllCookies":
+            return {"cookies": [dict(cookie, size=10, session=True, expires=-1) for cookie in self.cdp_cookies]}
+        if command == "Network.setCookies":
+            self.cdp_cookies.extend(params["cookies"])
+        elif command == "Network.setCookie":
+            self.cdp_cookies.append(params)
+        elif command == "Network.clearBrowserCookies":
+            self.cdp_cookies.clear()
+        return {}
@@ -0,0 +1,120 @@
+import argparse
+import re
+import time
+
+
+class TitleClassifier:
+    """Decides whether strings look like job titles, for whole lists at once, with one compiled keyword pattern"""
+
+    JOB_KEYWORDS = (
+        "engineer", "manager", "analyst", "specialist", "technician",
+        "developer", "designer", "coordinator", "director", "associate",
+        "intern", "senior", "junior", "lead", "principal", "staff",
+        "supervisor", "administrator", "consultant", "officer"
+    )
+    # Titles without a keyword must be multi-word, longer than this and free of these characters
+    MIN_LENGTH = 5
+    MULTI_WORD_MIN_LENGTH = 10
+    SYMBOL_PATTERN = re.compile(r"[@#$%&]")
+
+    _shared = None
+
+    def __init__(self, keywords=JOB_KEYWORDS):
+        self.keywords = tuple(keywords)
+        # Longest first, so a reason names "administrator" rather than a shorter keyword inside it
+        self.keyword_pattern = re.compile(
+            "|".join(re.escape(keyword) for keyword in sorted(self.keywords, key=len, reverse=True))
+        )
+
+    @classmethod
+    def shared(cls):
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def classify(self, title):
+        """(is_title, reason) for one string; reason names the keyword or rule that decided"""
+        if not title or len(title) <= self.MIN_LENGTH:
+            return False, "too short"
+        # Lowercased like the original per-keyword scan, so Unicode case rules match exactly
+        match = self.keyword_pattern.search(title.lower())
+        if match:
+            return True, f"keyword '{match.group()}'"
+        if len(title) <= self.MULTI_WORD_MIN_LENGTH or " " not in title:
+            return False, "no job keyword"
+        symbol = self.SYMBOL_PATTERN.search(title)
+        if symbol:
+            return False, f"no job keyword, contains '{symbol.group()}'"
+        return True, "multi-word title"
+
+    def classify_all(self, titles):
+        """[(title, is_title, reason), ...] in input order"""
+        classify = self.classify
+        return [(title, *classify(title)) for title in titles]
+
+    def is_title(self, title):
+        return self.classify(title)[0]
+
+    def first_title(self, candidates):
+        """First candidate (stripped) that looks like a job title, or None"""
+        for candidate in candidates:
+            candidate = (candidate or "").strip()
+            if self.is_title(candidate):
+                return candidate
+        return None
+
+
+def legacy_is_valid_job_title(job_title):
+    """The former per-keyword scan from BlueOriginHelpers, kept as the benchmark baseline"""
+    if not job_title or len(job_title) <= 5:
+        return False
+    job_title_lower = job_title.lower()
+    if any(keyword in job_title_lower for keyword in TitleClassifier.JOB_KEYWORDS):
+        return True
+    return (len(job_title) > 10 and job_title.count(' ') >= 1 and
+            not any(char in job_title for char in ['@', '#', '$', '%', '&']))
+
+
+def benchmark(titles, repeat=3):
+    """Best-of-repeat seconds for the classifier and the legacy scan over titles; verifies they agree"""
+    classifier = TitleClassifier()
+    results = {}
+    for name, run in (("classifier", lambda: [valid for _, valid, _ in classifier.classify_all(titles)]),
+                      ("legacy", lambda: [legacy_is_valid_job_title(title) for title in titles])):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            verdicts = run()
+            timings.append(time.perf_counter() - started)
+        results[name] = (min(timings), verdicts)
+    if results["classifier"][1] != results["legacy"][1]:
+        raise AssertionError("Classifier and legacy scan disagree")
+    return results["classifier"][0], results["legacy"][0]
+
+
+def fuzz_titles(size, seed=0):
+    """size strings mixing title-like word runs with the sweep's case, Unicode, injection and numeric keywords"""
+    from keyword_sweep import KeywordCorpus
+
+    corpus = KeywordCorpus(TitleClassifier.JOB_KEYWORDS + ("software", "flight", "propulsion", "systems", "test"),
+                           seed=seed)
+    share = max(1, size // 6)
+    titles = (corpus.words(share * 2, max_terms=5) + corpus.case_mixes(share) + corpus.unicode(share) +
+              corpus.injections(share) + corpus.numerics(share))
+    return titles[:size]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmark of the bulk job title classifier")
+    parser.add_argument("--size", type=int, default=100000, help="Number of fuzz strings (default: 100000)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    titles = fuzz_titles(args.size, args.seed)
+    classifier_seconds, legacy_seconds = benchmark(titles)
+    print(f"{len(titles)} strings: classifier {classifier_seconds * 1000:.1f} ms "
+          f"({len(titles) / classifier_seconds:,.0f}/s), legacy scan {legacy_seconds * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
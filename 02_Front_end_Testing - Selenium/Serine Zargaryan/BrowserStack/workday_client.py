@@ -0,0 +1,219 @@
+import http.client
+import json
+import logging
+import os
+import queue
+from urllib.parse import urlparse
+
+from http_cache import HttpCache
+from json_stream import JsonArrayStream
+
+
+class WorkdayApiError(Exception):
+    """Raised when the Workday CXS endpoint returns an error or an unreadable response"""
+
+
+class WorkdayClient:
+    """Keep-alive HTTP client for the Workday CXS job search endpoint used by the careers site"""
+
+    DEFAULT_BASE_URL = "https://blueorigin.wd5.myworkdayjobs.com"
+    SITE_API_PATH = "/wday/cxs/blueorigin/BlueOrigin"
+    JOBS_PATH = f"{SITE_API_PATH}/jobs"
+    # The CXS endpoint rejects pages larger than 20 postings
+    PAGE_LIMIT = 20
+    # Bytes read per step when streaming a response
+    STREAM_CHUNK_SIZE = 8192
+
+    _shared = {}
+
+    def __init__(self, base_url=None, pool_size=4, timeout=15, cache=None, page_limit=PAGE_LIMIT):
+        # WORKDAY_API_URL points the client at a stand-in server or another tenant host
+        self.base_url = (base_url or os.environ.get("WORKDAY_API_URL") or self.DEFAULT_BASE_URL).rstrip("/")
+        parsed = urlparse(self.base_url)
+        self.scheme = parsed.scheme
+        self.host = parsed.hostname
+        self.port = parsed.port
+        self.timeout = timeout
+        # Optional HttpCache; repeated identical requests are then answered locally
+        self.cache = cache
+        # Hosts without the CXS cap (e.g. a stand-in) may allow larger pages for bulk crawls
+        self.page_limit = page_limit
+        self._idle = queue.LifoQueue(maxsize=pool_size)
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def shared(cls, base_url=None):
+        """Return one cached client per base URL so its connections and responses are reused across helpers"""
+        key = (base_url or os.environ.get("WORKDAY_API_URL") or cls.DEFAULT_BASE_URL).rstrip("/")
+        if key not in cls._shared:
+            cls._shared[key] = cls(key, cache=HttpCache.shared())
+        return cls._shared[key]
+
+    def search(self, search_text="", applied_facets=None, limit=PAGE_LIMIT, offset=0):
+        """Run one job search and return the decoded JSON response"""
+        return self.post_json(self.JOBS_PATH, self._search_payload(search_text, applied_facets, limit, offset))
+
+    def stream_search(self, search_text="", applied_facets=None, limit=PAGE_LIMIT, offset=0):
+        """Run one job search and yield its jobPostings one by one while the response is read
+
+        Only the current posting and one chunk are held in memory. The other response
+        members (total, facets) end up in the fields of the returned JsonArrayStream.
+        Pages up to PAGE_LIMIT go through the cache when there is one; larger pages
+        (bulk crawls of a stand-in) are streamed uncached.
+        """
+        body = json.dumps(self._search_payload(search_text, applied_facets, limit, offset)).encode("utf-8")
+        headers = {"Content-Type": "application/json", "Accept": "application/json", "Connection": "keep-alive"}
+        if self.cache is not None and min(limit, self.page_limit) <= self.PAGE_LIMIT:
+            status, data = self._send("POST", self.JOBS_PATH, body, headers)
+            if status != 200:
+                raise WorkdayApiError(f"POST {self.JOBS_PATH} returned HTTP {status}")
+            return JsonArrayStream([data], "jobPostings")
+        return JsonArrayStream(self._stream_request("POST", self.JOBS_PATH, body, headers), "jobPostings")
+
+    def job_count(self, search_text="", applied_facets=None):
+        """Total number of postings matching the search"""
+        # Workday only reports the total on the first page
+        return int(self.search(search_text, applied_facets, limit=1, offset=0).get("total", 0))
+
+    def iter_postings(self, search_text="", applied_facets=None, max_results=None):
+        """Yield job postings page by page, as they are parsed, until max_results or the end of the results"""
+        offset = 0
+        total = None
+        while max_results is None or offset < max_results:
+            limit = self.page_limit if max_results is None else min(self.page_limit, max_results - offset)
+            page = self.stream_search(search_text, applied_facets, limit=limit, offset=offset)
+            count = 0
+            try:
+                for posting in page:
+                    count += 1
+                    yield posting
+            except ValueError as e:
+                raise WorkdayApiError(f"POST {self.JOBS_PATH} returned invalid JSON: {str(e)}")
+            if total is None:
+                total = int(page.fields.get("total", 0))
+            offset += count
+            if not count or offset >= total:
+                return
+
+    def job_titles(self, search_text="", applied_facets=None, max_results=PAGE_LIMIT):
+        """Titles of the first max_results postings matching the search"""
+        return [posting.get("title", "") for posting in self.iter_postings(search_text, applied_facets, max_results)]
+
+    def job_detail(self, external_path):
+        """Full posting (description, requisition ID, ...) for a jobPostings externalPath"""
+        return self.get_json(f"{self.SITE_API_PATH}{external_path}")
+
+    def post_json(self, path, payload):
+        body = json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json", "Accept": "application/json", "Connection": "keep-alive"}
+        return self._decode("POST", path, *self._send("POST", path, body, headers))
+
+    def get_json(self, path):
+        headers = {"Accept": "application/json", "Connection": "keep-alive"}
+        return self._decode("GET", path, *self._send("GET", path, None, headers))
+
+    @staticmethod
+    def _decode(method, path, status, data):
+        if status != 200:
+            raise WorkdayApiError(f"{method} {path} returned HTTP {status}")
+        try:
+            return json.loads(data)
+        except ValueError as e:
+            raise WorkdayApiError(f"{method} {path} returned invalid JSON: {str(e)}")
+
+    def _search_payload(self, search_text, applied_facets, limit, offset):
+        return {
+            "appliedFacets": applied_facets or {},
+            "limit": min(limit, self.page_limit),
+            "offset": offset,
+            "searchText": search_text
+        }
+
+    def close(self):
+        """Close all idle connections"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _send(self, method, path, body, headers):
+        if self.cache is None:
+            status, data, _ = self._request(method, path, body, headers)
+            return status, data
+        return self.cache.fetch(
+            method, f"{self.base_url}{path}", body, headers,
+            lambda request_headers: self._request(method, path, body, request_headers)
+        )
+
+    def _request(self, method, path, body, headers):
+        connection = self._checkout()
+        try:
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The server closed an idle keep-alive connection; retry once on a fresh one
+                connection.close()
+                connection = self._connect()
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            connection.close()
+            raise WorkdayApiError(f"{method} {path} failed: {str(e)}")
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._checkin(connection)
+        return response.status, data, response.headers
+
+    def _stream_request(self, method, path, body, headers):
+        """Yield the response body in chunks; the connection returns to the pool once it is fully read"""
+        connection = self._checkout()
+        finished = False
+        try:
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                connection.close()
+                connection = self._connect()
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+            if response.status != 200:
+                response.read()
+                finished = True
+                raise WorkdayApiError(f"{method} {path} returned HTTP {response.status}")
+            while not finished:
+                chunk = response.read(self.STREAM_CHUNK_SIZE)
+                # The parser may stop at the closing brace, so mark the body read before handing out its end
+                finished = not chunk or response.isclosed()
+                if chunk:
+                    yield chunk
+        except (OSError, http.client.HTTPException) as e:
+            raise WorkdayApiError(f"{method} {path} failed: {str(e)}")
+        finally:
+            # A partly read response leaves the connection unusable for the next request
+            if finished and not response.will_close:
+                self._checkin(connection)
+            else:
+                connection.close()
+
+    def _checkout(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def _checkin(self, connection):
+        try:
+            self._idle.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def _connect(self):
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from workday_client import WorkdayApiError, WorkdayClient
+
+# Queued after the last posting of each page
+_PAGE_DONE = object()
+
+
+class _CrawlStopped(Exception):
+    """Raised on a worker thread when the consumer closed the crawl"""
+
+
+class WorkdayCrawler:
+    """Pages through the whole Workday job catalog concurrently and streams postings as they are parsed"""
+
+    def __init__(self, client=None, concurrency=4, max_retries=3, backoff=0.5):
+        self.concurrency = concurrency
+        # One keep-alive connection per concurrent request
+        self.client = client or WorkdayClient(pool_size=concurrency)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.logger = logging.getLogger(__name__)
+
+    async def crawl(self, search_text="", applied_facets=None):
+        """Async generator of job postings, each passed on as soon as its page has parsed it
+
+        Pages after the first are read concurrently and their postings interleave. At most one
+        page worth of parsed postings waits between the workers and the consumer.
+        """
+        page_size = self.client.page_limit
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="workday-crawler")
+        postings = asyncio.Queue()
+        slots = threading.Semaphore(page_size)
+        stopped = threading.Event()
+        tasks = []
+
+        def deliver(posting):
+            # Called on worker threads; blocks while the consumer is a page behind
+            while not slots.acquire(timeout=0.1):
+                if stopped.is_set():
+                    raise _CrawlStopped()
+            if stopped.is_set():
+                raise _CrawlStopped()
+            loop.call_soon_threadsafe(postings.put_nowait, posting)
+
+        async def fetch_page(offset):
+            try:
+                async with semaphore:
+                    return await self._fetch_with_retry(loop, executor, search_text, applied_facets, offset, deliver)
+            finally:
+                postings.put_nowait(_PAGE_DONE)
+
+        async def receive(pages):
+            while pages:
+                posting = await postings.get()
+                if posting is _PAGE_DONE:
+                    pages -= 1
+                    for task in tasks:
+                        if task.done() and not task.cancelled() and task.exception() is not None:
+                            raise task.exception()
+                    continue
+                slots.release()
+                yield posting
+
+        try:
+            # The first page reports the total, which tells us every other offset up front
+            tasks.append(asyncio.ensure_future(fetch_page(0)))
+            async for posting in receive(1):
+                yield posting
+            total = tasks[0].result()
+            tasks.extend(asyncio.ensure_future(fetch_page(offset)) for offset in range(page_size, total, page_size))
+            self.logger.info(f"Crawling {total} Workday postings in {len(tasks)} pages")
+
+            async for posting in receive(len(tasks) - 1):
+                yield posting
+        finally:
+            stopped.set()
+            for task in tasks:
+                task.cancel()
+            executor.shutdown(wait=False)
+
+    def crawl_all(self, search_text="", applied_facets=None):
+        """Collect the full catalog synchronously"""
+        async def collect():
+            return [posting async for posting in self.crawl(search_text, applied_facets)]
+
+        return asyncio.run(collect())
+
+    async def _fetch_with_retry(self, loop, executor, search_text, applied_facets, offset, deliver):
+        """Read one page, passing its postings to deliver; returns the total the page reports"""
+        # A retry skips the postings an interrupted attempt already delivered
+        delivered = [0]
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await loop.run_in_executor(executor, self._read_page, search_text, applied_facets, offset,
+                                                  deliver, delivered)
+            except WorkdayApiError as e:
+                if attempt == self.max_retries:
+                    raise
+                # Exponential backoff with jitter so parallel retries do not hit the server together
+                delay = self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+                self.logger.warning(f"Page at offset {offset} failed ({str(e)}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    def _read_page(self, search_text, applied_facets, offset, deliver, delivered):
+        """Parse one page while it is read and hand each posting on, so workers never hold a whole page"""
+        page = self.client.stream_search(search_text, applied_facets, self.client.page_limit, offset)
+        try:
+            for index, posting in enumerate(page):
+                if index >= delivered[0]:
+                    deliver(posting)
+                    delivered[0] += 1
+        except ValueError as e:
+            raise WorkdayApiError(f"Page at offset {offset} is not valid JSON: {str(e)}")
+        return int(page.fields.get("total", 0))
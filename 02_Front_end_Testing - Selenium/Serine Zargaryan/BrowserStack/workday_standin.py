@@ -0,0 +1,358 @@
+import argparse
+import bisect
+import hashlib
+import html
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from workday_client import WorkdayClient
+from workday_crawler import WorkdayCrawler
+
+
+SAMPLE_POSTINGS = [
+    {"title": "Software Engineer II - Flight Software", "externalPath": "/job/Seattle-WA/Software-Engineer-II_R12001",
+     "locationsText": "Seattle, WA", "postedOn": "Posted Today", "bulletFields": ["R12001"]},
+    {"title": "Senior Software Engineer - Ground Systems", "externalPath": "/job/Kent-WA/Senior-Software-Engineer_R12002",
+     "locationsText": "Kent, WA", "postedOn": "Posted 2 Days Ago", "bulletFields": ["R12002"]},
+    {"title": "Propulsion Test Technician", "externalPath": "/job/Van-Horn-TX/Propulsion-Test-Technician_R12003",
+     "locationsText": "Van Horn, TX", "postedOn": "Posted 3 Days Ago", "bulletFields": ["R12003"]},
+    {"title": "Manufacturing Engineer III", "externalPath": "/job/Huntsville-AL/Manufacturing-Engineer-III_R12004",
+     "locationsText": "Huntsville, AL", "postedOn": "Posted 5 Days Ago", "bulletFields": ["R12004"]},
+    {"title": "Program Manager - Lunar Permanence", "externalPath": "/job/Kent-WA/Program-Manager_R12005",
+     "locationsText": "Kent, WA", "postedOn": "Posted 30+ Days Ago", "bulletFields": ["R12005"]}
+]
+
+SITE_PATH = "/en-US/BlueOrigin"
+CONSENT_COOKIE = "wd-cookie-consent"
+WORD_PATTERN = re.compile(r"\w+")
+TAG_PATTERN = re.compile(r"<[^>]+>")
+
+# Minimal careers page carrying the data-automation-id hooks the WORKDAY_* locators look for
+SHELL_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>Careers at Blue Origin</title></head>
+<body>
+{banner}
+<form method="get" action="{site_path}">
+  <input type="search" name="q" value="{query}" placeholder="Search for jobs or keywords"
+         data-automation-id="keywordSearchInput">
+</form>
+<p data-automation-id="jobFoundText">{count} JOBS FOUND</p>
+<ul>
+{items}
+</ul>
+</body>
+</html>
+"""
+
+BANNER_TEMPLATE = """<div id="cookie-banner" data-automation-id="legalNoticeContainer">
+  <p>We use cookies to improve your experience.</p>
+  <button data-automation-id="cookieAcceptButton" onclick="document.cookie = '{cookie}=accepted; path=/';
+          document.getElementById('cookie-banner').style.display = 'none';">Accept Cookies</button>
+</div>"""
+
+ITEM_TEMPLATE = """  <li><h3><a data-automation-id="jobTitle" href="{href}">{title}</a></h3>
+      <dd>{location}</dd><dd>{posted}</dd></li>"""
+
+DETAIL_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>{title}</title></head>
+<body>
+<h2 data-automation-id="jobPostingHeader">{title}</h2>
+<div data-automation-id="locations">{location}</div>
+<div data-automation-id="jobPostingDescription">{description}</div>
+</body>
+</html>
+"""
+
+
+class WorkdayStandIn:
+    """Local replay of the Workday CXS endpoints and careers page with configurable latency and failures"""
+
+    def __init__(self, postings=None, details=None, latency=0.0, error_rate=0.0, error_status=503,
+                 page_limit=WorkdayClient.PAGE_LIMIT, total_on_first_page_only=True, port=0, seed=0, facets=None):
+        self.load(SAMPLE_POSTINGS if postings is None else postings, details)
+        # Recorded facets block, returned with every search as-is
+        self.facets = list(facets or [])
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.page_limit = page_limit
+        # Workday reports the total only on the first page, which clients have to cope with
+        self.total_on_first_page_only = total_on_first_page_only
+        self.requests = []
+        self.connections = 0
+        self._pending_failures = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @classmethod
+    def from_recording(cls, path, **kwargs):
+        """Replay a catalog captured with record()"""
+        with open(path, encoding="utf-8") as recording_file:
+            recording = json.load(recording_file)
+        return cls(recording["postings"], recording.get("details"), facets=recording.get("facets"), **kwargs)
+
+    @staticmethod
+    def record(client, path, with_details=True):
+        """Capture the live catalog (and job detail responses) into a recording file"""
+        postings = WorkdayCrawler(client).crawl_all()
+        facets = client.search(limit=1).get("facets") or []
+        details = {}
+        if with_details:
+            for posting in postings:
+                details[posting["externalPath"]] = client.job_detail(posting["externalPath"])
+        with open(path, "w", encoding="utf-8") as recording_file:
+            json.dump({"postings": postings, "details": details, "facets": facets}, recording_file, indent=2)
+        return len(postings)
+
+    def load(self, postings, details=None):
+        """Serve a new catalog, indexing it for search once instead of on every request"""
+        postings = list(postings)
+        # Recorded /job/... responses by externalPath; missing ones are synthesized from the posting
+        details = dict(details or {})
+        index = {}
+        for position, posting in enumerate(postings):
+            for word in set(self._search_words(posting, details.get(posting["externalPath"]))):
+                index.setdefault(word, set()).add(position)
+        # Searches read the catalog and its index together, so one served during a reload sees either
+        self._search_index = (postings, index, sorted(index))
+        self.postings = postings
+        self.details = details
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def site_url(self):
+        return f"{self.url}{SITE_PATH}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def fail_next(self, count=1, status=None):
+        """Answer the next count API requests with an error status"""
+        with self._lock:
+            self._pending_failures.extend([status or self.error_status] * count)
+
+    def matching(self, search_text):
+        """Postings where every search word starts a word of the title, location or description
+
+        This models Workday search on its own rather than through SearchOracle, so a sweep against the
+        stand-in shows where the oracle's model falls short. Punctuation is dropped and facets are ignored.
+        """
+        postings, index, vocabulary = self._search_index
+        matches = set(range(len(postings)))
+        for term in WORD_PATTERN.findall(search_text.lower()):
+            positions = set()
+            entry = bisect.bisect_left(vocabulary, term)
+            while entry < len(vocabulary) and vocabulary[entry].startswith(term):
+                positions |= index[vocabulary[entry]]
+                entry += 1
+            matches &= positions
+        return [postings[position] for position in sorted(matches)]
+
+    def search(self, payload):
+        """Build a CXS /jobs response"""
+        matches = self.matching(payload.get("searchText", ""))
+        offset = payload.get("offset", 0)
+        limit = payload.get("limit", self.page_limit)
+        return {
+            "total": len(matches) if offset == 0 or not self.total_on_first_page_only else 0,
+            "jobPostings": matches[offset:offset + limit],
+            "facets": self.facets
+        }
+
+    def job_detail(self, external_path):
+        """Build a CXS /job/... response, preferring a recorded one"""
+        if external_path in self.details:
+            return self.details[external_path]
+        posting = next((posting for posting in self.postings if posting["externalPath"] == external_path), None)
+        if posting is None:
+            return None
+        return {"jobPostingInfo": {
+            "title": posting["title"],
+            "location": posting.get("locationsText", ""),
+            "postedOn": posting.get("postedOn", ""),
+            "jobReqId": (posting.get("bulletFields") or [""])[0],
+            "jobDescription": f"<p>{html.escape(posting['title'])}</p>",
+            "externalUrl": f"{self.site_url}{external_path}"
+        }}
+
+    @staticmethod
+    def _search_words(posting, detail):
+        description = TAG_PATTERN.sub(" ", (detail or {}).get("jobPostingInfo", {}).get("jobDescription", ""))
+        text = " ".join([posting.get("title", ""), posting.get("locationsText", ""), html.unescape(description)])
+        return WORD_PATTERN.findall(text.lower())
+
+    def _injected_error(self):
+        with self._lock:
+            if self._pending_failures:
+                return self._pending_failures.pop(0)
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self.error_status
+        return None
+
+    def _render_shell(self, query, consent_given):
+        matches = self.matching(query)
+        items = "\n".join(ITEM_TEMPLATE.format(
+            href=html.escape(f"{SITE_PATH}{posting['externalPath']}"),
+            title=html.escape(posting["title"]),
+            location=html.escape(posting.get("locationsText", "")),
+            posted=html.escape(posting.get("postedOn", ""))
+        ) for posting in matches)
+        return SHELL_TEMPLATE.format(
+            banner="" if consent_given else BANNER_TEMPLATE.format(cookie=CONSENT_COOKIE),
+            site_path=SITE_PATH,
+            query=html.escape(query),
+            count=len(matches),
+            items=items
+        )
+
+    def _render_detail(self, external_path):
+        detail = self.job_detail(external_path)
+        if detail is None:
+            return None
+        info = detail.get("jobPostingInfo", {})
+        return DETAIL_TEMPLATE.format(
+            title=html.escape(info.get("title", "")),
+            location=html.escape(info.get("location", "")),
+            description=info.get("jobDescription", "")
+        )
+
+    def _handler_class(self):
+        standin = self
+        api_path = WorkdayClient.SITE_API_PATH
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                standin.connections += 1
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if self.path != WorkdayClient.JOBS_PATH:
+                    self._send_json(404, {"errorCode": "NOT_FOUND"})
+                    return
+                if not self._delay_or_fail():
+                    return
+                try:
+                    payload = json.loads(body)
+                except ValueError:
+                    self._send_json(400, {"errorCode": "HTTP_400"})
+                    return
+                if payload.get("limit", 0) > standin.page_limit:
+                    self._send_json(400, {"errorCode": "HTTP_400"})
+                    return
+                standin.requests.append(payload)
+                self._send_json(200, standin.search(payload))
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path.startswith(f"{api_path}/job/"):
+                    if not self._delay_or_fail():
+                        return
+                    detail = standin.job_detail(url.path[len(api_path):])
+                    self._send_json(200 if detail else 404, detail or {"errorCode": "NOT_FOUND"})
+                elif url.path.rstrip("/") == SITE_PATH:
+                    time.sleep(standin.latency)
+                    query = parse_qs(url.query).get("q", [""])[0]
+                    consent_given = f"{CONSENT_COOKIE}=accepted" in self.headers.get("Cookie", "")
+                    self._send_html(200, standin._render_shell(query, consent_given))
+                elif url.path.startswith(f"{SITE_PATH}/job/"):
+                    time.sleep(standin.latency)
+                    page = standin._render_detail(url.path[len(SITE_PATH):])
+                    self._send_html(200 if page else 404, page or "<h1>Not found</h1>")
+                elif url.path == "/robots.txt":
+                    self._send(200, "text/plain", b"User-agent: *\nDisallow:\n")
+                else:
+                    self._send_html(404, "<h1>Not found</h1>")
+
+            def _delay_or_fail(self):
+                time.sleep(standin.latency)
+                status = standin._injected_error()
+                if status:
+                    self._send_json(status, {"errorCode": f"HTTP_{status}"})
+                    return False
+                return True
+
+            def _send_json(self, status, document):
+                data = json.dumps(document).encode("utf-8")
+                if status != 200:
+                    self._send(status, "application/json", data)
+                    return
+                # Like the real tenant, let clients revalidate unchanged responses
+                etag = f'"{hashlib.sha1(data).hexdigest()}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self._send(304, "application/json", b"", etag)
+                else:
+                    self._send(200, "application/json", data, etag)
+
+            def _send_html(self, status, page):
+                self._send(status, "text/html; charset=utf-8", page.encode("utf-8"))
+
+            def _send(self, status, content_type, data, etag=None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                if etag:
+                    self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local Workday stand-in for offline and load runs")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--recording", help="catalog recorded with --record (default: built-in sample postings)")
+    parser.add_argument("--record", metavar="PATH", help="capture the live catalog into PATH and exit")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of API requests answered with 503")
+    args = parser.parse_args()
+
+    if args.record:
+        count = WorkdayStandIn.record(WorkdayClient(WorkdayClient.DEFAULT_BASE_URL), args.record)
+        print(f"Recorded {count} postings to {args.record}")
+        return
+
+    options = {"latency": args.latency, "error_rate": args.error_rate, "port": args.port}
+    standin = WorkdayStandIn.from_recording(args.recording, **options) if args.recording else WorkdayStandIn(**options)
+    print(f"Workday stand-in serving {len(standin.postings)} postings at {standin.site_url}")
+    print(f"Run the tests against it with: WORKDAY_API_URL={standin.url} pytest")
+    try:
+        standin._server.serve_forever()
+    except KeyboardInterrupt:
+        standin._server.server_close()
+
+
+if __name__ == "__main__":
+    main()